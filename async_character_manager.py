@@ -0,0 +1,136 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Async Character Manager Module
+
+asyncio counterparts of the character_manager save functions for code
+running inside an event loop. Blocking file / sqlite I/O runs on a
+small bounded thread pool, so the loop keeps serving other tasks while
+a save is written. The functions are awaited like coroutines:
+
+    await async_save_character(character)
+    character = await async_load_character("Hero")
+
+Saves and loads of the same character are serialized with a per-name
+asyncio.Lock. The character is encoded when async_save_character is
+called, so changes made to the dict afterwards are not written by that
+save, and each save is numbered then too: a save that gets the lock
+after a later-requested save of the same character was written is
+skipped, so the newest requested state always wins whatever order the
+awaitables run in.
+"""
+
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import character_manager
+
+# Threads doing save I/O. Bounds how many saves/loads are in flight at once.
+ASYNC_IO_WORKERS = 4
+
+_executor = None
+_locks = {}     # character name -> [asyncio.Lock, number of tasks using it]
+# (backend location, character name) -> [number of the latest requested
+# save, number of the latest save written, saves not finished yet]
+_sequences = {}
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=ASYNC_IO_WORKERS,
+                                       thread_name_prefix="save-io")
+    return _executor
+
+
+async def _run(function, *args, **kwargs):
+    """Run a blocking call on the save I/O pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(function, *args, **kwargs))
+
+
+@contextlib.asynccontextmanager
+async def _character_lock(name):
+    """Hold the lock for one character; the entry is dropped when unused"""
+    entry = _locks.get(name)
+    if entry is None:
+        entry = _locks[name] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            yield
+    finally:
+        entry[1] -= 1
+        if not entry[1]:
+            del _locks[name]
+
+
+def async_save_character(character, save_directory="data/save_games", durable=None,
+                         backend=None):
+    """Async save_character: returns an awaitable that writes the save.
+    The character is encoded right away, not when the awaitable first
+    runs. A save superseded by a later one already written is skipped.
+    """
+    name = character['name']
+    data = character_manager.encode_character(character)
+    backend = character_manager.get_save_backend(save_directory, backend)
+    key = (backend.location, name)
+    entry = _sequences.get(key)
+    if entry is None:
+        entry = _sequences[key] = [0, 0, 0]
+    entry[0] += 1
+    entry[2] += 1
+    durable = character_manager.SAVE_FSYNC if durable is None else durable
+    journal = character_manager.SAVE_JOURNAL
+    since = None if journal is None else journal.mark(name)
+    return _write(backend, name, data, durable, since, key, entry[0])
+
+
+async def _write(backend, name, data, durable, since, key, sequence):
+    entry = _sequences[key]     # kept while this save is pending
+    try:
+        async with _character_lock(name):
+            if sequence < entry[1]:
+                return True     # a newer save of this character is on disk
+            await _run(character_manager._write_save, backend, name, data, durable, since)
+            entry[1] = sequence
+    finally:
+        # Dropped once no save of this character is pending
+        entry[2] -= 1
+        if not entry[2]:
+            del _sequences[key]
+    cache = character_manager.CHARACTER_CACHE
+    if cache is not None:
+        cache.discard(backend, name)
+    return True
+
+
+async def async_load_character(character_name, save_directory="data/save_games", backend=None):
+    """Async load_character. Waits for pending saves of the same character"""
+    async with _character_lock(character_name):
+        return await _run(character_manager.load_character, character_name, save_directory,
+                          backend=backend)
+
+
+async def async_list_saved_characters(save_directory="data/save_games", offset=0, limit=None,
+                                      backend=None):
+    """Async list_saved_characters"""
+    return await _run(character_manager.list_saved_characters, save_directory,
+                      offset=offset, limit=limit, backend=backend)
+
+
+async def async_delete_character(character_name, save_directory="data/save_games",
+                                 backend=None):
+    """Async delete_character"""
+    async with _character_lock(character_name):
+        return await _run(character_manager.delete_character, character_name, save_directory,
+                          backend=backend)
+
+
+def shutdown(wait=True):
+    """Stop the save I/O pool (a new one is created on the next call)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=wait)
+        _executor = None
@@ -0,0 +1,210 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Autosave Module
+
+Change tracking for characters plus a write-behind saver, so the game
+loop only touches the disk when a character actually changed.
+
+TrackedCharacter is a dict that flips a dirty flag on every mutation,
+including mutations of its list fields (quests) and its Inventory. An
+optional listener is told about each change as a small delta (see
+character_journal).
+WriteBehindSaver persists dirty characters at most once per interval,
+and always on flush(), and counts skipped and performed writes.
+"""
+
+import time
+import character_manager
+from records import CACHE_KEYS, CharacterDict, Inventory
+
+
+# ============================================================================
+# CHANGE TRACKING
+# ============================================================================
+_MISSING = object()
+
+
+class TrackedList(list):
+    """List that marks its owning TrackedCharacter dirty when mutated"""
+
+    __slots__ = ('_owner', '_key')
+
+    def __init__(self, values=(), owner=None, key=None):
+        super().__init__(values)
+        self._owner = owner
+        self._key = key
+
+
+def _tracked(name):
+    method = getattr(list, name)
+    # append/remove are reported as such, anything else as the new contents
+    single = name in ('append', 'remove')
+
+    def wrapper(self, *args, **kwargs):
+        owner = self._owner
+        if owner is None:
+            return method(self, *args, **kwargs)
+        owner.dirty = True
+        result = method(self, *args, **kwargs)
+        if owner.listener is not None:
+            if single:
+                owner.listener(owner, name, self._key, args[0])
+            else:
+                owner.listener(owner, 'set', self._key, list(self))
+        return result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+              '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(TrackedList, _name, _tracked(_name))
+del _name
+
+
+class TrackedCharacter(CharacterDict):
+    """Character dict that records whether anything was modified.
+    listener, if set, is called as listener(character, op, key, value)
+    after each change, with op one of:
+        'add'     integer field changed by value
+        'set'     field replaced by value
+        'append'  value appended to a list field or Inventory
+        'remove'  value removed from a list field or Inventory
+        'del'     field deleted
+    """
+
+    __slots__ = ('dirty', 'listener')
+
+    def __init__(self, data=(), dirty=False, listener=None):
+        super().__init__()
+        for key, value in dict(data).items():
+            dict.__setitem__(self, key, self._wrap(key, value))
+        self.dirty = dirty
+        self.listener = listener
+
+    def _wrap(self, key, value):
+        if type(value) is TrackedList and value._owner is self and value._key == key:
+            return value
+        if type(value) is list or type(value) is TrackedList:
+            return TrackedList(value, self, key)
+        if type(value) is Inventory:
+            if value._owner is not None and (value._owner is not self or value._key != key):
+                value = Inventory(value)
+            value._owner, value._key = self, key
+        return value
+
+    def __setitem__(self, key, value):
+        if key in CACHE_KEYS:
+            self._effective_stats = self._damage_range = None
+        old = dict.get(self, key, _MISSING)
+        dict.__setitem__(self, key, self._wrap(key, value))
+        if old is _MISSING or old != value:
+            self.dirty = True
+            if self.listener is not None:
+                if type(old) is int and type(value) is int:
+                    self.listener(self, 'add', key, value - old)
+                else:
+                    if isinstance(value, (list, Inventory)):
+                        value = list(value)
+                    self.listener(self, 'set', key, value)
+
+    def _deleted(self, key):
+        if key in CACHE_KEYS:
+            self._effective_stats = self._damage_range = None
+        self.dirty = True
+        if self.listener is not None:
+            self.listener(self, 'del', key, None)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._deleted(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def pop(self, key, *default):
+        if key not in self:
+            return dict.pop(self, key, *default)
+        value = dict.pop(self, key)
+        self._deleted(key)
+        return value
+
+    def popitem(self):
+        item = dict.popitem(self)
+        self._deleted(item[0])
+        return item
+
+    def clear(self):
+        for key in list(self):
+            del self[key]
+
+
+# ============================================================================
+# WRITE-BEHIND SAVER
+# ============================================================================
+class WriteBehindSaver:
+    """Coalesces save requests into writes of dirty characters only"""
+
+    def __init__(self, save=character_manager.save_character, interval=0.0,
+                 clock=time.monotonic, **save_kwargs):
+        self._save = save
+        self._save_kwargs = save_kwargs
+        self.interval = interval
+        self._clock = clock
+        self._pending = {}          # id(character) -> character
+        self._last_write = None
+        self.writes_performed = 0
+        self.writes_skipped = 0
+
+    def track(self, character, dirty=False):
+        """Wrap a character so its changes are tracked"""
+        if isinstance(character, TrackedCharacter):
+            return character
+        return TrackedCharacter(character, dirty=dirty)
+
+    def save(self, character, force=False):
+        """Request a save. Writes now only if the character is dirty and the
+        interval has passed (or force=True). Returns True if written.
+        """
+        if not getattr(character, 'dirty', True):
+            self.writes_skipped += 1
+            return False
+
+        self._pending[id(character)] = character
+        now = self._clock()
+        if force or self._last_write is None or now - self._last_write >= self.interval:
+            self.flush()
+            return True
+
+        self.writes_skipped += 1
+        return False
+
+    def flush(self):
+        """Write every pending dirty character. Returns the number written"""
+        written = 0
+        try:
+            for key, character in list(self._pending.items()):
+                if getattr(character, 'dirty', True):
+                    self._save(character, **self._save_kwargs)
+                    if isinstance(character, TrackedCharacter):
+                        character.dirty = False
+                    written += 1
+                # A failed save leaves this and the remaining characters pending
+                del self._pending[key]
+        finally:
+            self.writes_performed += written
+        if written:
+            self._last_write = self._clock()
+        return written
+
+    def stats(self):
+        """Counters of performed and skipped writes"""
+        return {'performed': self.writes_performed, 'skipped': self.writes_skipped,
+                'pending': len(self._pending)}
@@ -0,0 +1,114 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Balance Sweep Module
+
+Runs battle_simulator over the full class x enemy x level grid on a
+process pool. Every grid cell gets its own RNG stream seeded from the
+sweep seed and the cell itself, so results are identical no matter how
+many workers run or how the cells are chunked.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import battle_simulator
+import combat_system
+
+SWEEP_LEVELS = range(1, 51)
+
+
+# ============================================================================
+# GRID
+# ============================================================================
+def sweep_cells(classes=battle_simulator.CHARACTER_CLASSES,
+                enemy_types=battle_simulator.ENEMY_TYPES, levels=SWEEP_LEVELS):
+    """List every (class, enemy_type, level) cell of the sweep"""
+    return [(character_class, enemy_type, level)
+            for character_class in classes
+            for enemy_type in enemy_types
+            for level in levels]
+
+
+def cell_rng(seed, cell):
+    """Independent, reproducible RNG stream for one grid cell"""
+    character_class, enemy_type, level = cell
+    return random.Random(f"{seed}:{character_class}:{enemy_type}:{level}")
+
+
+def _run_chunk(task):
+    """Worker entry point: simulate a chunk of cells"""
+    cells, fights, policy, seed, max_turns = task
+    results = []
+    for cell in cells:
+        character_class, enemy_type, level = cell
+        character = battle_simulator.build_character(character_class, level)
+        enemy = combat_system.create_enemy(enemy_type)
+        summary = battle_simulator.simulate_many(
+            character, enemy, fights, policy, cell_rng(seed, cell), max_turns
+        )
+        results.append((cell, summary))
+    return results
+
+
+# ============================================================================
+# SWEEP
+# ============================================================================
+def run_sweep(fights=1000, classes=battle_simulator.CHARACTER_CLASSES,
+              enemy_types=battle_simulator.ENEMY_TYPES, levels=SWEEP_LEVELS,
+              policy=battle_simulator.special_policy, seed=0, workers=None,
+              max_turns=battle_simulator.MAX_TURNS):
+    """Simulate the whole grid across a process pool.
+    Returns {(class, enemy_type, level): summary}, the same shape as
+    battle_simulator.run_simulations. workers=1 runs in-process;
+    workers=None uses every core. The policy must be picklable
+    (a module-level function).
+    """
+    cells = sweep_cells(classes, enemy_types, levels)
+    workers = workers or os.cpu_count() or 1
+
+    # Several chunks per worker keeps cores busy when cells differ in cost
+    chunk_count = min(len(cells), workers * 4) or 1
+    chunks = [cells[i::chunk_count] for i in range(chunk_count)]
+    tasks = [(chunk, fights, policy, seed, max_turns) for chunk in chunks]
+
+    if workers == 1:
+        chunk_results = map(_run_chunk, tasks)
+        results = dict(pair for chunk in chunk_results for pair in chunk)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = dict(pair for chunk in pool.map(_run_chunk, tasks) for pair in chunk)
+
+    return {cell: results[cell] for cell in cells}
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+def summary_table(results):
+    """Flatten sweep results into one row per cell"""
+    rows = []
+    for (character_class, enemy_type, level), summary in results.items():
+        wins = summary['wins']
+        hp_total = sum(hp * count for hp, count in summary['hp_remaining'].items())
+        rows.append({
+            'class': character_class,
+            'enemy': enemy_type,
+            'level': level,
+            'fights': summary['fights'],
+            'win_rate': summary['win_rate'],
+            'avg_turns': summary['avg_turns'],
+            'avg_hp_remaining': hp_total / wins if wins else 0.0,
+        })
+    return rows
+
+
+def format_summary_table(rows):
+    """Render summary_table rows as fixed-width text"""
+    lines = [f"{'CLASS':<8} {'ENEMY':<7} {'LVL':>3} {'FIGHTS':>7} {'WIN%':>6} {'TURNS':>6} {'HP LEFT':>8}"]
+    for row in rows:
+        lines.append(
+            f"{row['class']:<8} {row['enemy']:<7} {row['level']:>3} {row['fights']:>7} "
+            f"{row['win_rate'] * 100:>6.1f} {row['avg_turns']:>6.2f} {row['avg_hp_remaining']:>8.1f}"
+        )
+    return "\n".join(lines)
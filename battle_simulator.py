@@ -0,0 +1,189 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Battle Simulator Module
+
+Runs large batches of headless battles for balancing. Uses the same
+damage rules as combat_system (calculate_damage / use_special_ability)
+but keeps each fight in local integers: no stdout, no input(), no
+battle log.
+"""
+
+import random
+import character_manager
+import combat_system
+from custom_exceptions import AbilityOnCooldownError
+
+CHARACTER_CLASSES = ("Warrior", "Mage", "Rogue", "Cleric")
+ENEMY_TYPES = ("goblin", "orc", "dragon")
+
+# Safety stop for policies that never finish a fight (e.g. always '3' with bad luck)
+MAX_TURNS = 1000
+
+
+# ============================================================================
+# PLAYER POLICIES
+# ============================================================================
+# A policy is called as policy(turn, cooldown, player_health, enemy_health)
+# and returns the same choices SimpleBattle.player_turn accepts: '1'|'2'|'3'.
+
+def attack_policy(turn, cooldown, player_health, enemy_health):
+    """Always use a basic attack"""
+    return '1'
+
+
+def special_policy(turn, cooldown, player_health, enemy_health):
+    """Use the special ability whenever it is off cooldown, else attack"""
+    return '2' if cooldown == 0 else '1'
+
+
+# ============================================================================
+# SETUP
+# ============================================================================
+def build_character(character_class, level=1):
+    """Create a character of the given class with the stats it has at level"""
+    character = character_manager.create_character(f"Sim{character_class}", character_class)
+    character_manager.apply_level_ups(character, max(0, level - 1))
+    character['level'] = level
+    return character
+
+
+def _special_profile(character):
+    """Return (kind, low, span, flat) describing the class special ability"""
+    char_class = character.get('class', '')
+    if char_class == 'Cleric':
+        return 'heal', 0, 0, combat_system.CLERIC_HEAL_AMOUNT
+
+    damage = combat_system.special_damage_range(character)
+    if damage is None:
+        return 'none', 0, 0, 0
+    low, high = damage
+    if char_class == 'Rogue':
+        strength = character_manager.get_effective_stats(character).get('strength', 1)
+        return 'crit', low, high - low + 1, max(1, int(strength))
+    return 'damage', low, high - low + 1, 0
+
+
+# ============================================================================
+# SIMULATION
+# ============================================================================
+def prepare_matchup(character, enemy):
+    """Precompute everything a fight needs so repeated fights skip the dict lookups"""
+    p_low, p_high = combat_system.damage_range(character)
+    e_low, e_high = combat_system.damage_range(enemy)
+    kind, s_low, s_span, flat = _special_profile(character)
+    player_max = character_manager.get_effective_stats(character)['max_health']
+    return (character['health'], player_max, enemy['health'],
+            p_low, p_high - p_low + 1, e_low, e_high - e_low + 1,
+            kind, s_low, s_span, flat)
+
+
+def _fight(matchup, policy, rand, max_turns):
+    """Run one fight from a prepared matchup. Returns (winner, turns, player_health)"""
+    (player_hp, player_max, enemy_hp, p_low, p_span, e_low, e_span,
+     kind, s_low, s_span, flat) = matchup
+    cooldown_length = combat_system.ABILITY_COOLDOWN
+    crit_chance = combat_system.ROGUE_CRIT_CHANCE
+    escape_chance = combat_system.ESCAPE_CHANCE
+
+    cooldown = 0
+    turn = 0
+    while turn < max_turns:
+        turn += 1
+        if cooldown > 0:
+            cooldown -= 1
+
+        if policy is special_policy:
+            choice = '1' if cooldown else '2'
+        elif policy is attack_policy:
+            choice = '1'
+        else:
+            choice = policy(turn, cooldown, player_hp, enemy_hp)
+
+        if choice == '1':
+            enemy_hp -= p_low + int(rand() * p_span)
+        elif choice == '2':
+            if cooldown > 0:
+                raise AbilityOnCooldownError(f"Cooldown: {cooldown} turns")
+            cooldown = cooldown_length
+            if kind == 'damage':
+                enemy_hp -= s_low + int(rand() * s_span)
+            elif kind == 'crit':
+                if rand() < crit_chance:
+                    enemy_hp -= s_low + int(rand() * s_span)
+                else:
+                    enemy_hp -= flat
+            elif kind == 'heal':
+                player_hp = min(player_hp + flat, player_max)
+        elif choice == '3':
+            if rand() < escape_chance:
+                return 'none', turn, player_hp
+
+        if enemy_hp <= 0:
+            return 'player', turn, player_hp
+
+        player_hp -= e_low + int(rand() * e_span)
+        if player_hp <= 0:
+            return 'enemy', turn, 0
+
+    return 'none', turn, player_hp
+
+
+def simulate_battle(character, enemy, policy=special_policy, rng=None, max_turns=MAX_TURNS):
+    """Simulate one fight without mutating character or enemy.
+    Returns (winner, turns, player_health) where winner is
+    'player', 'enemy' or 'none' (escaped / turn limit).
+    """
+    rand = (rng or random).random
+    return _fight(prepare_matchup(character, enemy), policy, rand, max_turns)
+
+
+def simulate_many(character, enemy, fights, policy=special_policy, rng=None, max_turns=MAX_TURNS):
+    """Run the same matchup `fights` times and aggregate the results"""
+    rand = (rng or random.Random()).random
+    matchup = prepare_matchup(character, enemy)
+    wins = losses = 0
+    total_turns = 0
+    turn_counts = {}
+    hp_remaining = {}
+
+    for _ in range(fights):
+        winner, turns, hp = _fight(matchup, policy, rand, max_turns)
+        total_turns += turns
+        turn_counts[turns] = turn_counts.get(turns, 0) + 1
+        if winner == 'player':
+            wins += 1
+            hp_remaining[hp] = hp_remaining.get(hp, 0) + 1
+        elif winner == 'enemy':
+            losses += 1
+
+    return {
+        'fights': fights,
+        'wins': wins,
+        'losses': losses,
+        'escapes': fights - wins - losses,
+        'win_rate': wins / fights if fights else 0.0,
+        'avg_turns': total_turns / fights if fights else 0.0,
+        'turn_counts': turn_counts,
+        'hp_remaining': hp_remaining,
+    }
+
+
+def run_simulations(fights=1000, classes=CHARACTER_CLASSES, enemy_types=ENEMY_TYPES,
+                    levels=(1,), policy=special_policy, seed=None, max_turns=MAX_TURNS):
+    """Simulate every class x enemy type x level combination.
+    Returns {(class, enemy_type, level): summary} where summary is the
+    dict produced by simulate_many.
+    """
+    rng = random.Random(seed)
+    results = {}
+
+    for character_class in classes:
+        for level in levels:
+            character = build_character(character_class, level)
+            for enemy_type in enemy_types:
+                enemy = combat_system.create_enemy(enemy_type)
+                results[(character_class, enemy_type, level)] = simulate_many(
+                    character, enemy, fights, policy, rng, max_turns
+                )
+
+    return results
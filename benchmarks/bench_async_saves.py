@@ -0,0 +1,64 @@
+"""
+Benchmark: event-loop latency while 1,000 saves are in flight
+
+A ticker task sleeps 1 ms at a time and records how late it wakes up.
+Meanwhile 1,000 concurrent saves run either by calling the blocking
+save_character from coroutines or through async_save_character.
+
+Run from the project root:
+    python benchmarks/bench_async_saves.py [saves] [durable]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import async_character_manager
+
+TICK = 0.001
+
+
+async def blocking_save(character, directory, durable):
+    character_manager.save_character(character, directory, durable=durable)
+
+
+async def run(save, count, directory, durable):
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(time.perf_counter() - start - TICK)
+
+    characters = [character_manager.create_character(f"hero{i % 100}", "Warrior")
+                  for i in range(count)]
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK)
+    start = time.perf_counter()
+    await asyncio.gather(*(save(c, directory, durable) for c in characters))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await task
+
+    lags.sort()
+    return elapsed, lags[len(lags) // 2], lags[int(len(lags) * 0.99)], lags[-1]
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    durable = len(sys.argv) > 2 and sys.argv[2] == "durable"
+    print(f"{count:,} concurrent saves{' (fsync)' if durable else ''}, loop lag in ms")
+    print(f"{'':10} {'total':>8} {'p50':>7} {'p99':>7} {'max':>7}")
+    for label, save in (("blocking", blocking_save),
+                        ("async", async_character_manager.async_save_character)):
+        with tempfile.TemporaryDirectory() as tmp:
+            elapsed, p50, p99, worst = asyncio.run(run(save, count, tmp, durable))
+        print(f"{label:10} {elapsed * 1e3:7.0f}ms {p50 * 1e3:7.2f} {p99 * 1e3:7.2f} {worst * 1e3:7.2f}")
+    async_character_manager.shutdown()
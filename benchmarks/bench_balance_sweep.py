@@ -0,0 +1,28 @@
+"""
+Benchmark: balance_sweep scaling with the number of worker processes
+
+Run from the project root:
+    python benchmarks/bench_balance_sweep.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import balance_sweep
+
+FIGHTS = 2000
+
+
+if __name__ == "__main__":
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cores})
+    baseline = None
+    for workers in counts:
+        start = time.perf_counter()
+        balance_sweep.run_sweep(fights=FIGHTS, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>3} workers: {elapsed:7.2f}s  speedup {baseline / elapsed:5.2f}x")
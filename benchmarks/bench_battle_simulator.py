@@ -0,0 +1,68 @@
+"""
+Benchmark: headless battle_simulator (and vectorized_combat when numpy
+is installed) vs looping SimpleBattle.start_battle
+
+Run from the project root:
+    python benchmarks/bench_battle_simulator.py
+"""
+
+import contextlib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import battle_simulator
+import combat_system
+
+FIGHTS = 2000
+
+
+class AutoBattle(combat_system.SimpleBattle):
+    """SimpleBattle that plays the special_policy instead of prompting"""
+
+    def player_turn(self, choice=None):
+        return super().player_turn('2' if self.ability_cooldown == 0 else '1')
+
+
+def bench_simple_battle():
+    random.seed(1)
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(FIGHTS):
+            character = battle_simulator.build_character("Warrior", 3)
+            AutoBattle(character, combat_system.create_enemy("orc")).start_battle()
+    return time.perf_counter() - start
+
+
+def bench_simulator():
+    start = time.perf_counter()
+    battle_simulator.run_simulations(fights=FIGHTS, classes=("Warrior",),
+                                     enemy_types=("orc",), levels=(3,), seed=1)
+    return time.perf_counter() - start
+
+
+def bench_vectorized(fights):
+    import vectorized_combat
+    start = time.perf_counter()
+    vectorized_combat.resolve_matchup(battle_simulator.build_character("Warrior", 3),
+                                      combat_system.create_enemy("orc"), fights, seed=1)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    slow = bench_simple_battle()
+    fast = bench_simulator()
+    print(f"SimpleBattle loop: {FIGHTS / slow:12,.0f} fights/sec")
+    print(f"battle_simulator:  {FIGHTS / fast:12,.0f} fights/sec")
+    print(f"speedup:           {slow / fast:12.1f}x")
+
+    try:
+        vector = bench_vectorized(FIGHTS * 100)
+    except ImportError:
+        print("vectorized_combat: skipped (numpy not installed)")
+    else:
+        print(f"vectorized_combat: {FIGHTS * 100 / vector:12,.0f} fights/sec")
+        print(f"speedup:           {slow / (vector / 100):12.1f}x")
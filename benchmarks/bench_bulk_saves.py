@@ -0,0 +1,44 @@
+"""
+Benchmark: load_characters / save_characters thread scaling
+
+Saves and then loads N characters in one text-file save directory with
+one call per character and with the batch APIs at several thread counts.
+
+Run from the project root:
+    python benchmarks/bench_bulk_saves.py [characters]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+THREADS = (1, 2, 4, 8, 16)
+
+
+def timed(function, *args, **kwargs):
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    characters = [character_manager.create_character(f"hero{i:06d}", "Warrior")
+                  for i in range(count)]
+    names = [c['name'] for c in characters]
+    print(f"{count:,} characters, {os.cpu_count()} CPU(s)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_one = timed(lambda: [character_manager.save_character(c, tmp) for c in characters])
+        load_one = timed(lambda: [character_manager.load_character(n, tmp) for n in names])
+        print(f"{'one per call':14} save {count / save_one:9,.0f}/s   load {count / load_one:9,.0f}/s")
+
+        for threads in THREADS:
+            save = timed(character_manager.save_characters, characters, tmp, workers=threads)
+            load = timed(character_manager.load_characters, names, tmp, workers=threads)
+            print(f"{threads:2} thread(s)    save {count / save:9,.0f}/s   load {count / load:9,.0f}/s")
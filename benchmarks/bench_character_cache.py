@@ -0,0 +1,32 @@
+"""
+Benchmark: load_character with and without the character cache
+
+Run from the project root:
+    python benchmarks/bench_character_cache.py [loads]
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+
+if __name__ == "__main__":
+    loads = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as tmp:
+        character = character_manager.create_character("Cached", "Warrior")
+        character['inventory'] = ['health_potion'] * 10
+        character_manager.save_character(character, tmp)
+        load = lambda: character_manager.load_character("Cached", tmp)
+
+        uncached = timeit.timeit(load, number=loads) / loads
+        cache = character_manager.enable_character_cache()
+        cached = timeit.timeit(load, number=loads) / loads
+        character_manager.disable_character_cache()
+
+    print(f"uncached: {uncached * 1e6:7.2f} us/load")
+    print(f"cached:   {cached * 1e6:7.2f} us/load  ({uncached / cached:.1f}x, {cache.stats()})")
@@ -0,0 +1,46 @@
+"""
+Benchmark: load_item_pack on a process pool vs calling load_items per file
+
+Run from the project root:
+    python benchmarks/bench_data_pack.py [files] [blocks_per_file]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from bench_parse import BLOCK, TYPES
+
+
+def write_pack(directory, files, blocks):
+    for f in range(files):
+        with open(os.path.join(directory, f"pack_{f:03}.txt"), 'w') as out:
+            for i in range(blocks):
+                n = f * blocks + i
+                out.write(BLOCK.format(n, TYPES[n % 3], n % 20, n % 500))
+
+
+if __name__ == "__main__":
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    blocks = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    with tempfile.TemporaryDirectory() as tmp:
+        write_pack(tmp, files, blocks)
+        paths = game_data.find_pack_files(tmp)
+
+        start = time.perf_counter()
+        items = {}
+        for path in paths:
+            items.update(game_data.load_items(path, use_cache=False))
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        game_data.load_item_pack(tmp)
+        pooled = time.perf_counter() - start
+
+    print(f"{files} files x {blocks:,} blocks, {os.cpu_count()} cores")
+    print(f"load_items loop: {serial:7.2f}s")
+    print(f"load_item_pack:  {pooled:7.2f}s  ({serial / pooled:.2f}x)")
@@ -0,0 +1,88 @@
+"""
+Benchmark: damage rolls reading cached effective stats
+
+Times combat_system.SimpleBattle.calculate_damage for an equipped
+character whose effective stats are cached (a create_character
+CharacterDict and a TrackedCharacter), for a plain dict (effective stats
+recomputed per roll), and the old rule that read the dict's stats
+directly (bonus baked into the base stats).
+
+Run from the project root:
+    python benchmarks/bench_effective_stats.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import autosave
+import character_manager
+import combat_system
+import inventory_system
+
+ROLLS = 100_000
+REPEATS = 5
+ITEMS = {'iron_sword': {'type': 'weapon', 'effect': 'strength:5'},
+         'leather_armor': {'type': 'armor', 'effect': 'max_health:10'}}
+
+
+def legacy_get_attack_stat(attacker):
+    attack_stat = int(attacker.get('strength', 5))
+    if attacker.get('class') == 'Mage' or attacker.get('magic', 0) > attacker.get('strength', 0):
+        attack_stat = int(attacker.get('magic', 5))
+    return attack_stat
+
+
+def legacy_damage_range(attacker):
+    base = max(1, legacy_get_attack_stat(attacker))
+    low = max(1, int(base * 0.8))
+    high = max(low, int(base * 1.2))
+    return low, high
+
+
+def legacy_calculate_damage(attacker, defender):
+    """calculate_damage before effective stats (same call structure)"""
+    low, high = legacy_damage_range(attacker)
+    return random.randint(low, high)
+
+
+def equipped(character):
+    for item_id in ITEMS:
+        inventory_system.add_item_to_inventory(character, item_id)
+    inventory_system.equip_weapon(character, 'iron_sword', ITEMS)
+    inventory_system.equip_armor(character, 'leather_armor', ITEMS)
+    return character
+
+
+def per_roll(calculate, character):
+    """Best of REPEATS runs, in seconds per roll"""
+    enemy = combat_system.create_enemy("orc")
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(ROLLS):
+            calculate(character, enemy)
+        best = min(best, time.perf_counter() - start)
+    return best / ROLLS
+
+
+if __name__ == "__main__":
+    battle = combat_system.SimpleBattle(character_manager.create_character("B", "Warrior"),
+                                        combat_system.create_enemy("orc"))
+    tracked = equipped(autosave.TrackedCharacter(
+        character_manager.create_character("Tracked", "Warrior")))
+    created = equipped(character_manager.create_character("Created", "Warrior"))
+    plain = dict(created)
+    baked = dict(created, strength=created['strength'] + 5)
+
+    rows = (("old (baked-in stats)", per_roll(legacy_calculate_damage, baked)),
+            ("create_character", per_roll(battle.calculate_damage, created)),
+            ("TrackedCharacter", per_roll(battle.calculate_damage, tracked)),
+            ("plain dict, no cache", per_roll(battle.calculate_damage, plain)))
+    legacy = rows[0][1]
+    print(f"{'character':>22} {'ns/roll':>9} {'vs old':>7}")
+    for name, seconds in rows:
+        print(f"{name:>22} {seconds * 1e9:9.0f} {seconds / legacy:6.2f}x")
@@ -0,0 +1,114 @@
+"""
+Benchmark: equip/unequip cycles per second
+
+Compares the old equip_weapon/unequip_weapon, which split and int()-parsed
+the item's EFFECT text on every call, against the current functions
+reading effects parsed once at load (game_data.load_items) and against
+raw item dicts without parsed effects (parsed once, then cached).
+
+Run from the project root:
+    python benchmarks/bench_equip.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import game_data
+import inventory_system
+from custom_exceptions import InventoryFullError, InvalidItemTypeError, ItemNotFoundError
+
+CYCLES = 50_000
+
+
+def legacy_equip_weapon(character, item_id, item_data):
+    """equip_weapon before effects were parsed at load"""
+    if not inventory_system.has_item(character, item_id):
+        raise ItemNotFoundError(f"Item '{item_id}' not in inventory.")
+    item = inventory_system._resolve_item(item_id, item_data)
+    if item.get('type') != 'weapon':
+        raise InvalidItemTypeError(f"{item.get('name', item_id)} is not a weapon.")
+
+    if character.get('equipped_weapon'):
+        if inventory_system.get_inventory_space_remaining(character) < 1:
+            raise InventoryFullError("Inventory full, cannot unequip old weapon.")
+        legacy_unequip_weapon(character, item_data)
+
+    inventory_system.remove_item_from_inventory(character, item_id)
+
+    effect = item.get('effect', '')
+    if ':' in effect:
+        stat, value_str = effect.split(':', 1)
+        try:
+            value = int(value_str.strip())
+        except ValueError:
+            value = 0
+        stat = stat.strip()
+        if stat == 'max_health':
+            character['max_health'] = character.get('max_health', 0) + value
+            character['health'] = min(character.get('health', 0) + value, character['max_health'])
+        else:
+            character[stat] = character.get(stat, 0) + value
+
+    character['equipped_weapon'] = item_id
+    return f"Equipped {item.get('name', item_id)}"
+
+
+def legacy_unequip_weapon(character, item_data):
+    """unequip_weapon before effects were parsed at load"""
+    weapon_id = character.get('equipped_weapon')
+    if not weapon_id:
+        return "No weapon equipped"
+
+    if inventory_system.get_inventory_space_remaining(character) < 1:
+        raise InventoryFullError("Inventory full")
+
+    item = inventory_system._resolve_item(weapon_id, item_data)
+
+    effect = item.get('effect', '')
+    if ':' in effect:
+        stat, value_str = effect.split(':', 1)
+        try:
+            value = int(value_str.strip())
+        except ValueError:
+            value = 0
+        stat = stat.strip()
+        if stat == 'max_health':
+            character['max_health'] = max(0, character.get('max_health', 0) - value)
+            character['health'] = min(character.get('health', 0), character['max_health'])
+        else:
+            character[stat] = character.get(stat, 0) - value
+
+    inventory_system.add_item_to_inventory(character, weapon_id)
+    character['equipped_weapon'] = None
+    return f"Unequipped {item.get('name', weapon_id)}"
+
+
+def cycles_per_second(equip, unequip, items):
+    character = character_manager.create_character("Bench", "Warrior")
+    inventory_system.add_item_to_inventory(character, 'iron_sword')
+    start = time.perf_counter()
+    for _ in range(CYCLES):
+        equip(character, 'iron_sword', items)
+        unequip(character, items)
+    return CYCLES / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    catalog = game_data.load_items()
+    raw = {item_id: {key: value for key, value in item.items() if key != 'effects'}
+           for item_id, item in catalog.items()}
+
+    legacy = cycles_per_second(legacy_equip_weapon, legacy_unequip_weapon, catalog)
+    parsed = cycles_per_second(inventory_system.equip_weapon, inventory_system.unequip_weapon,
+                               catalog)
+    cached = cycles_per_second(inventory_system.equip_weapon, inventory_system.unequip_weapon,
+                               raw)
+    print(f"{'variant':>24} {'cycles/s':>12} {'vs legacy':>10}")
+    for name, rate in (("legacy (parse per call)", legacy),
+                       ("parsed at load", parsed),
+                       ("raw dict (cached parse)", cached)):
+        print(f"{name:>24} {rate:12,.0f} {rate / legacy:9.2f}x")
@@ -0,0 +1,51 @@
+"""
+Benchmark: cost of battle output in SimpleBattle turns
+
+Times player_turn + enemy_turn with no event subscribers (headless), and
+with a print subscriber writing to /dev/null (what every run paid
+before the event bus).
+
+Run from the project root:
+    python benchmarks/bench_events.py [turns]
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import events
+
+
+def run_turns(turns):
+    character = character_manager.create_character("Bench", "Warrior")
+    enemy = combat_system.create_enemy("dragon")
+    battle = combat_system.SimpleBattle(character, enemy)
+    battle.combat_active = True
+    start = time.perf_counter()
+    for _ in range(turns):
+        character['health'] = enemy['health'] = 10 ** 9
+        battle.player_turn('1')
+        battle.enemy_turn()
+    return (time.perf_counter() - start) / turns
+
+
+def print_event(event):
+    print(event.message)
+
+
+if __name__ == "__main__":
+    turns = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    headless = run_turns(turns)
+
+    for event_type in (events.DamageDealt, events.CombatMessage):
+        events.subscribe(event_type, print_event)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        printing = run_turns(turns)
+
+    print(f"printing to /dev/null: {printing * 1e6:6.2f} us/turn pair")
+    print(f"no subscribers:        {headless * 1e6:6.2f} us/turn pair ({printing / headless:.1f}x)")
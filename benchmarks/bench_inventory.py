@@ -0,0 +1,56 @@
+"""
+Benchmark: list inventory vs stack-count Inventory
+
+Fills an inventory with MAX_INVENTORY_SIZE items spread over a few
+dozen item ids plus one rare item picked up last, then times has_item,
+count_item and a remove + add cycle of the rare item through
+inventory_system, once with the old plain list and once with
+records.Inventory.
+
+Run from the project root:
+    python benchmarks/bench_inventory.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import inventory_system
+from records import Inventory
+
+SIZES = (20, 1_000, 100_000, 1_000_000)
+ITEM_IDS = [f"item_{i}" for i in range(50)]
+RARE_ITEM = "rare_item"
+OPS = 2000
+
+
+def make_character(size, container):
+    items = [ITEM_IDS[i % len(ITEM_IDS)] for i in range(size - 1)] + [RARE_ITEM]
+    return {'inventory': container(items), 'gold': 0}
+
+
+def per_op(function, character, item_id):
+    start = time.perf_counter()
+    for _ in range(OPS):
+        function(character, item_id)
+    return (time.perf_counter() - start) / OPS
+
+
+def cycle(character, item_id):
+    inventory_system.remove_item_from_inventory(character, item_id)
+    inventory_system.add_item_to_inventory(character, item_id)
+
+
+if __name__ == "__main__":
+    print(f"{'size':>10} {'operation':>12} {'list us':>10} {'stacks us':>10} {'speedup':>9}")
+    for size in SIZES:
+        inventory_system.MAX_INVENTORY_SIZE = size
+        for name, function in (("has_item", inventory_system.has_item),
+                               ("count_item", inventory_system.count_item),
+                               ("remove+add", cycle)):
+            legacy = per_op(function, make_character(size, list), RARE_ITEM)
+            stacked = per_op(function, make_character(size, Inventory), RARE_ITEM)
+            print(f"{size:10,} {name:>12} {legacy * 1e6:10.2f} {stacked * 1e6:10.2f} "
+                  f"{legacy / stacked:8.1f}x")
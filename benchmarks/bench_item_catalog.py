@@ -0,0 +1,65 @@
+"""
+Benchmark: item lookups with a plain dict, a lazy catalog and an ItemCatalog
+
+Times the original _resolve_item (isinstance check, `in` test, then a
+second lookup) against the current one for each kind of item_data, and
+a purchase + sell round trip through inventory_system.
+
+Run from the project root:
+    python benchmarks/bench_item_catalog.py
+"""
+
+import os
+import sys
+import time
+from collections.abc import Mapping
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import game_data
+import inventory_system
+from custom_exceptions import ItemNotFoundError
+
+REPEAT = 200_000
+
+
+def legacy_resolve_item(item_id, item_data):
+    """_resolve_item before ItemCatalog"""
+    if item_data is None:
+        raise ItemNotFoundError(f"No item data provided for '{item_id}'.")
+    if isinstance(item_data, Mapping):
+        if item_id in item_data:
+            return item_data[item_id]
+        known_keys = {'type', 'cost', 'effect', 'name', 'id'}
+        if any(k in item_data for k in known_keys):
+            return item_data
+    raise ItemNotFoundError(f"Item data for '{item_id}' not found.")
+
+
+def per_call(function, *args, repeat=REPEAT):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+def round_trip(character, item_data):
+    inventory_system.purchase_item(character, "health_potion", item_data)
+    inventory_system.sell_item(character, "health_potion", item_data)
+
+
+if __name__ == "__main__":
+    sources = (
+        ("dict", game_data.load_items()),
+        ("lazy catalog", game_data.load_items_lazy()),
+        ("ItemCatalog", game_data.load_item_catalog()),
+    )
+    print(f"{'item_data':>13} {'legacy ns':>10} {'resolve ns':>11} {'buy+sell us':>12}")
+    for name, item_data in sources:
+        legacy = per_call(legacy_resolve_item, "health_potion", item_data)
+        current = per_call(inventory_system._resolve_item, "health_potion", item_data)
+        character = character_manager.create_character("Bench", "Warrior")
+        character['gold'] = 10 ** 9
+        trip = per_call(round_trip, character, item_data, repeat=REPEAT // 4)
+        print(f"{name:>13} {legacy * 1e9:10.0f} {current * 1e9:11.0f} {trip * 1e6:12.2f}")
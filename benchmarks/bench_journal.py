@@ -0,0 +1,60 @@
+"""
+Benchmark: per-action persistence cost, full save vs journal append
+
+Persists one add_gold call per iteration, either with a full
+save_character or through the character journal, for characters with
+growing inventories and quest logs.
+
+Run from the project root:
+    python benchmarks/bench_journal.py [actions]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import character_journal
+
+SIZES = (0, 100, 1000, 10000)
+
+
+def make_character(size):
+    character = character_manager.create_character("Bench", "Warrior")
+    character['inventory'] = [f"item_{i}" for i in range(size)]
+    character['completed_quests'] = [f"quest_{i}" for i in range(size)]
+    return character
+
+
+def full_saves(size, actions, directory):
+    character = make_character(size)
+    start = time.perf_counter()
+    for _ in range(actions):
+        character_manager.add_gold(character, 1)
+        character_manager.save_character(character, directory)
+    return (time.perf_counter() - start) / actions
+
+
+def journaled(size, actions, directory):
+    journal = character_journal.enable_journal(directory, compact_every=actions + 1)
+    character = journal.attach(make_character(size), directory)
+    start = time.perf_counter()
+    for _ in range(actions):
+        character_manager.add_gold(character, 1)
+    elapsed = time.perf_counter() - start
+    character_journal.disable_journal()
+    return elapsed / actions
+
+
+if __name__ == "__main__":
+    actions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{'entries':>8} {'full save us':>13} {'journal us':>11} {'speedup':>8}")
+    for size in SIZES:
+        with tempfile.TemporaryDirectory() as tmp:
+            full = full_saves(size, actions, tmp)
+        with tempfile.TemporaryDirectory() as tmp:
+            append = journaled(size, actions, tmp)
+        print(f"{size:8} {full * 1e6:13.1f} {append * 1e6:11.1f} {full / append:7.1f}x")
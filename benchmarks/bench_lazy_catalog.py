@@ -0,0 +1,37 @@
+"""
+Benchmark: memory held by load_items vs load_items_lazy
+
+Run from the project root:
+    python benchmarks/bench_lazy_catalog.py [block_count]
+"""
+
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from bench_parse import write_synthetic
+
+
+def measure(load, path):
+    tracemalloc.start()
+    catalog = load(path)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return catalog, current
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "items.txt")
+        write_synthetic(path, count)
+        _, eager = measure(lambda p: game_data.load_items(p, use_cache=False), path)
+        _, lazy = measure(game_data.load_items_lazy, path)
+    print(f"items:      {count:12,}")
+    print(f"load_items: {eager / 2**20:10.1f} MiB  ({eager / count:6.0f} B/item)")
+    print(f"lazy:       {lazy / 2**20:10.1f} MiB  ({lazy / count:6.0f} B/item)")
+    print(f"reduction:  {1 - lazy / eager:11.0%}")
@@ -0,0 +1,53 @@
+"""
+Benchmark: gain_experience for large XP grants
+
+Compares the old one-iteration-per-level loop (with its print per level,
+sent to /dev/null) against the closed-form gain_experience.
+
+Run from the project root:
+    python benchmarks/bench_leveling.py
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+GRANTS = (1000, 100_000, 10_000_000, 1_000_000_000)
+
+
+def legacy_gain_experience(character, xp_amount):
+    character['experience'] += xp_amount
+    while character['experience'] >= character['level'] * 100:
+        character['experience'] -= character['level'] * 100
+        character['level'] += 1
+        character['max_health'] += 10
+        character['strength'] += 2
+        character['magic'] += 2
+        character['health'] = character['max_health']
+        print(f"\nLEVEL UP! Now level {character['level']}")
+    return character['level']
+
+
+def per_grant(gain, xp, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        gain(character_manager.create_character("Bench", "Warrior"), xp)
+    return (time.perf_counter() - start) / repeat
+
+
+if __name__ == "__main__":
+    print(f"{'xp':>14} {'levels':>7} {'loop us':>11} {'closed us':>10} {'speedup':>9}")
+    with open(os.devnull, "w") as devnull:
+        for xp in GRANTS:
+            levels = character_manager.levels_gained(1, xp)[0]
+            repeat = max(3, 20000 // levels)
+            with contextlib.redirect_stdout(devnull):
+                loop = per_grant(legacy_gain_experience, xp, repeat)
+            closed = per_grant(character_manager.gain_experience, xp, 20000)
+            print(f"{xp:14,} {levels:7,} {loop * 1e6:11.1f} {closed * 1e6:10.2f} "
+                  f"{loop / closed:8.0f}x")
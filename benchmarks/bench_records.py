@@ -0,0 +1,48 @@
+"""
+Benchmark: per-object memory of records.* vs plain dicts
+
+Run from the project root:
+    python benchmarks/bench_records.py [count]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import game_data
+import records
+
+
+def measure(factory, count):
+    """Bytes allocated per object when building count objects"""
+    tracemalloc.start()
+    objects = [factory(i) for i in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / count
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    item = game_data.load_items()['iron_sword']
+    quest = game_data.load_quests()['goblin_hunter']
+    character = character_manager.create_character("Bench", "Warrior")
+    enemy = combat_system.create_enemy("orc")
+
+    # Values are shared so only the container cost is measured
+    cases = [
+        ("Item", item, records.Item),
+        ("Quest", quest, records.Quest),
+        ("Character", character, records.Character),
+        ("Enemy", enemy, records.Enemy),
+    ]
+    print(f"{'type':<10} {'dict':>8} {'slots':>8} {'saved':>6}")
+    for name, data, record_type in cases:
+        as_dict = measure(lambda i: dict(data), count)
+        as_record = measure(lambda i: record_type(data), count)
+        print(f"{name:<10} {as_dict:7.0f}B {as_record:7.0f}B {1 - as_record / as_dict:6.0%}")
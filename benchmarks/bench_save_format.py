@@ -0,0 +1,49 @@
+"""
+Benchmark: text vs binary save encoding
+
+Times encoding and decoding a typical character in both save formats and
+compares the size of the encoded save.
+
+Run from the project root:
+    python benchmarks/bench_save_format.py [iterations]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+
+def sample_character():
+    character = character_manager.create_character("Benchmark Hero", "Warrior")
+    character.update(level=25, experience=1234, gold=56789, equipped_weapon="iron_sword",
+                     equipped_armor="leather_armor")
+    character['inventory'].add('health_potion', 8)
+    character['inventory'].add('mana_potion', 4)
+    character['inventory'].add('iron_sword')
+    character['active_quests'] = ['goblin_camp', 'lost_ring']
+    character['completed_quests'] = [f"quest_{i}" for i in range(12)]
+    return character
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    character = sample_character()
+
+    print(f"{'':8} {'bytes':>6} {'save us':>9} {'load us':>9}")
+    results = {}
+    for fmt in ("text", "binary"):
+        data = character_manager.encode_character(character, fmt)
+        save = timeit.timeit(lambda: character_manager.encode_character(character, fmt),
+                             number=iterations) / iterations * 1e6
+        load = timeit.timeit(lambda: character_manager.deserialize_character(data),
+                             number=iterations) / iterations * 1e6
+        results[fmt] = (len(data), save, load)
+        print(f"{fmt:8} {len(data):6} {save:9.2f} {load:9.2f}")
+
+    text, binary = results["text"], results["binary"]
+    print(f"binary: {1 - binary[0] / text[0]:.0%} smaller, "
+          f"save {text[1] / binary[1]:.1f}x, load {text[2] / binary[2]:.1f}x")
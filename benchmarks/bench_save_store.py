@@ -0,0 +1,66 @@
+"""
+Benchmark: one text file per character vs a single sqlite3 save store
+
+Times saving N characters one save_character call at a time, listing the first page of names, and loading
+/ deleting random characters with both save backends.
+
+Run from the project root:
+    python benchmarks/bench_save_store.py [characters]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import save_backends
+
+PAGE = 20
+LOOKUPS = 2000
+
+
+def bench(backend, count):
+    character = character_manager.create_character("Bench", "Warrior")
+    names = [f"hero{i:07d}" for i in range(count)]
+    timings = {}
+
+    start = time.perf_counter()
+    for name in names:
+        character['name'] = name
+        character_manager.save_character(character, backend=backend)
+    timings['save all'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        character_manager.list_saved_characters(offset=count // 2, limit=PAGE, backend=backend)
+    timings['list page (x100)'] = time.perf_counter() - start
+
+    rng = random.Random(1)
+    picks = [rng.choice(names) for _ in range(LOOKUPS)]
+    start = time.perf_counter()
+    for name in picks:
+        character_manager.load_character(name, backend=backend)
+    timings[f'load (x{LOOKUPS})'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for name in set(picks[:200]):
+        character_manager.delete_character(name, backend=backend)
+    timings['delete (x200)'] = time.perf_counter() - start
+    return timings
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as tmp:
+        text = bench(save_backends.TextFileBackend(os.path.join(tmp, "saves")), count)
+        with save_backends.SQLiteBackend(os.path.join(tmp, "saves.db")) as db:
+            sqlite = bench(db, count)
+
+    print(f"{count:,} characters")
+    print(f"{'':20} {'text files':>12} {'sqlite':>12} {'speedup':>9}")
+    for key in text:
+        print(f"{key:20} {text[key]:11.3f}s {sqlite[key]:11.3f}s {text[key] / sqlite[key]:8.1f}x")
@@ -0,0 +1,45 @@
+"""
+Benchmark: save_character throughput
+
+Compares the old open('w') + one write per field approach with the
+atomic temp-file + os.replace save, with and without fsync.
+
+Run from the project root:
+    python benchmarks/bench_saves.py [saves]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+
+def legacy_save(character, save_directory):
+    """save_character as it was before atomic writes"""
+    path = os.path.join(save_directory, f"{character['name']}_save.txt")
+    with open(path, 'w') as f:
+        for line in character_manager.serialize_character(character).splitlines(True):
+            f.write(line)
+
+
+def bench(save, count, directory):
+    character = character_manager.create_character("Bench", "Warrior")
+    character['inventory'] = ['health_potion'] * 10
+    start = time.perf_counter()
+    for i in range(count):
+        character['gold'] = i
+        save(character, directory)
+    return count / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"in-place, 14 writes:    {bench(legacy_save, count, tmp):10,.0f} saves/sec")
+        print(f"atomic:                 {bench(character_manager.save_character, count, tmp):10,.0f} saves/sec")
+        durable = lambda c, d: character_manager.save_character(c, d, durable=True)
+        print(f"atomic + fsync:         {bench(durable, max(1, count // 10), tmp):10,.0f} saves/sec")
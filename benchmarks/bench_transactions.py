@@ -0,0 +1,80 @@
+"""
+Benchmark: market-bot ticks, single calls vs apply_transaction
+
+Each tick a bot buys and sells a few hundred items. Compares looping
+purchase_item/sell_item against one inventory_system.apply_transaction
+per tick (which checks the whole batch first and applies it in one
+pass), for single-unit operations and for the same volume expressed
+as quantities.
+
+Run from the project root:
+    python benchmarks/bench_transactions.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import game_data
+import inventory_system
+
+TICKS = 200
+OPS_PER_TICK = (100, 500)
+
+
+def make_bot():
+    bot = character_manager.create_character("MarketBot", "Rogue")
+    bot['gold'] = 10 ** 9
+    return bot
+
+
+def tick_operations(catalog, ops):
+    item_ids = list(catalog)
+    half = ops // 2
+    buys = [('buy', item_ids[i % len(item_ids)]) for i in range(half)]
+    sells = [('sell', item_ids[i % len(item_ids)]) for i in range(half)]
+    return buys + sells
+
+
+def run_single(catalog, operations):
+    bot = make_bot()
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        for action, item_id in operations:
+            if action == 'buy':
+                inventory_system.purchase_item(bot, item_id, catalog)
+            else:
+                inventory_system.sell_item(bot, item_id, catalog)
+    return (time.perf_counter() - start) / TICKS
+
+
+def run_batch(catalog, operations):
+    bot = make_bot()
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        inventory_system.apply_transaction(bot, operations, catalog)
+    return (time.perf_counter() - start) / TICKS
+
+
+def grouped(operations):
+    counts = {}
+    for action, item_id in operations:
+        counts[(action, item_id)] = counts.get((action, item_id), 0) + 1
+    return [(action, item_id, quantity) for (action, item_id), quantity in counts.items()]
+
+
+if __name__ == "__main__":
+    catalog = game_data.load_items()
+    print(f"{'ops/tick':>9} {'single us':>10} {'batch us':>10} {'grouped us':>11} "
+          f"{'batch':>7} {'grouped':>8}")
+    for ops in OPS_PER_TICK:
+        inventory_system.MAX_INVENTORY_SIZE = ops
+        operations = tick_operations(catalog, ops)
+        single = run_single(catalog, operations)
+        batch = run_batch(catalog, operations)
+        bulk = run_batch(catalog, grouped(operations))
+        print(f"{ops:9} {single * 1e6:10.0f} {batch * 1e6:10.0f} {bulk * 1e6:11.1f} "
+              f"{single / batch:6.1f}x {single / bulk:7.0f}x")
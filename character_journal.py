@@ -0,0 +1,252 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Character Journal Module
+
+Append-only journal of small character state changes, so a gold change,
+XP gain or picked-up item costs one short appended line instead of a
+rewrite of the whole save.
+
+Each character gets <name>_journal.log next to its saves. The first line
+names the snapshot (a digest of the save bytes) the journal applies to;
+every further line is one JSON delta from autosave.TrackedCharacter:
+
+    ["add", "gold", 25]             ["append", "inventory", "health_potion"]
+    ["add", "experience", 100]      ["remove", "active_quests", "goblin_camp"]
+    ["set", "equipped_weapon", "iron_sword"]
+
+Every full save (save_character, async saves, cache write-backs,
+migrate_saves) writes a new snapshot and restarts the journal, and the
+journal itself compacts (saves a snapshot) every compact_every deltas.
+With character_manager.SAVE_JOURNAL set, load_character replays the
+journal on top of the snapshot. A journal whose digest does not match
+the current save (a full save happened after it) is ignored, and a line
+torn by a crash mid-append is skipped.
+
+    journal = enable_journal()
+    character = journal.attach(character_manager.load_character("Hero"))
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+import autosave
+import character_manager
+from records import Inventory
+from save_backends import _atomic_write
+
+JOURNAL_SUFFIX = "_journal.log"
+
+
+def snapshot_digest(data):
+    """Digest identifying the save bytes a journal applies to"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def apply_delta(character, op, key, value):
+    """Apply one journal entry to a plain character dict"""
+    if op == 'add':
+        character[key] = character.get(key, 0) + value
+    elif op == 'set':
+        if isinstance(character.get(key), Inventory):
+            value = Inventory(value)
+        character[key] = value
+    elif op == 'append':
+        character.setdefault(key, []).append(value)
+    elif op == 'remove':
+        if value in character.get(key, ()):
+            character[key].remove(value)
+    elif op == 'del':
+        character.pop(key, None)
+    else:
+        raise ValueError(f"Unknown journal operation: {op}")
+
+
+class CharacterJournal:
+    """Journals changes of attached characters between full saves"""
+
+    def __init__(self, directory="data/save_games", compact_every=200, durable=False):
+        self.directory = directory
+        self.compact_every = compact_every
+        self.durable = durable
+        self._files = {}        # name -> open append handle
+        self._counts = {}       # name -> deltas since the snapshot
+        self._marks = {}        # name -> deltas recorded in total (see mark)
+        self._targets = {}      # name -> (save_directory, backend) used for compaction
+        self._lock = threading.Lock()
+        self.deltas_written = 0
+        self.compactions = 0
+
+    def path(self, name):
+        return os.path.join(self.directory, f"{name}{JOURNAL_SUFFIX}")
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def attach(self, character, save_directory="data/save_games", backend=None):
+        """Journal every later change of character, starting from a fresh
+        snapshot of its current state. Returns the tracked character (a
+        TrackedCharacter is reused, a plain dict wrapped).
+        """
+        if character_manager.SAVE_JOURNAL is not self:
+            raise ValueError("Journal is not installed (use enable_journal)")
+        if not isinstance(character, autosave.TrackedCharacter):
+            character = autosave.TrackedCharacter(character)
+        self._targets[character['name']] = (save_directory, backend)
+        cache = character_manager.CHARACTER_CACHE
+        if cache is not None:
+            # The snapshot below caches the character again
+            cache.discard(character_manager.get_save_backend(save_directory, backend),
+                          character['name'])
+        self.compact(character)
+        character.listener = self._record
+        return character
+
+    def detach(self, character):
+        character.listener = None
+        self.close(character['name'])
+
+    def _record(self, character, op, key, value):
+        if key == 'name':
+            # Renames cannot be journaled: write a full snapshot instead
+            self.compact(character)
+            return
+
+        name = character['name']
+        line = json.dumps([op, key, value], separators=(',', ':')) + "\n"
+        with self._lock:
+            f = self._files.get(name)
+            if f is None:
+                f = self._files[name] = self._open(name)
+            f.write(line)
+            f.flush()
+            if self.durable:
+                os.fsync(f.fileno())
+            count = self._counts[name] = self._counts.get(name, 0) + 1
+            self._marks[name] = self._marks.get(name, 0) + 1
+            self.deltas_written += 1
+
+        cache = character_manager.CHARACTER_CACHE
+        if cache is not None:
+            # Keep the cached copy in step instead of evicting it on every change
+            save_directory, backend = self._targets.get(name, ("data/save_games", None))
+            cache.update(character_manager.get_save_backend(save_directory, backend), name,
+                         lambda cached: apply_delta(cached, op, key, value))
+
+        if count >= self.compact_every:
+            self.compact(character)
+
+    def _open(self, name):
+        if not os.path.exists(self.path(name)):
+            # Not journaled since the last save: start from the current save
+            save_directory, backend = self._targets.get(name, ("data/save_games", None))
+            data = character_manager.get_save_backend(save_directory, backend).read(name)
+            self._start(name, b"" if data is None else data)
+        return open(self.path(name), 'a', encoding='utf-8')
+
+    def compact(self, character):
+        """Write a full snapshot; the journal restarts empty"""
+        save_directory, backend = self._targets.get(character['name'], ("data/save_games", None))
+        character_manager.save_character(character, save_directory, backend=backend)
+        self.compactions += 1
+
+    # ------------------------------------------------------------------
+    # Called by character_manager
+    # ------------------------------------------------------------------
+    def mark(self, name):
+        """Position in name's journal; pass it to reset for a snapshot
+        encoded now but written later
+        """
+        with self._lock:
+            return self._marks.get(name, 0)
+
+    def reset(self, name, data, since=None):
+        """A full save of name was written as data: restart its journal.
+        With since (a mark taken when data was encoded), the deltas
+        recorded after the mark are not in data and stay in the journal.
+        """
+        with self._lock:
+            f = self._files.pop(name, None)
+            if f is not None:
+                f.close()
+            pending = 0 if since is None else self._marks.get(name, 0) - since
+            kept = self._tail(name, pending) if pending > 0 else []
+            self._start(name, data, kept)
+            self._counts[name] = len(kept)
+
+    def _tail(self, name, count):
+        """The last count complete deltas of name's journal"""
+        try:
+            with open(self.path(name), 'r', encoding='utf-8') as f:
+                f.readline()
+                lines = [line for line in f.readlines() if line.endswith("\n")]
+        except FileNotFoundError:
+            return []
+        return lines[-count:]
+
+    def _start(self, name, data, lines=()):
+        os.makedirs(self.directory, exist_ok=True)
+        header = json.dumps({'snapshot': snapshot_digest(data)}) + "\n"
+        _atomic_write(self.path(name), (header + "".join(lines)).encode('utf-8'), self.durable)
+
+    def replay(self, name, data, character):
+        """Apply name's journal to character (just loaded from data).
+        Returns the number of deltas applied.
+        """
+        try:
+            with open(self.path(name), 'r', encoding='utf-8') as f:
+                header = f.readline()
+                try:
+                    base = json.loads(header).get('snapshot')
+                except ValueError:
+                    return 0
+                if base != snapshot_digest(data):
+                    return 0
+                lines = f.readlines()
+        except FileNotFoundError:
+            return 0
+
+        applied = 0
+        for line in lines:
+            if not line.endswith("\n"):
+                break       # torn final append
+            op, key, value = json.loads(line)
+            apply_delta(character, op, key, value)
+            applied += 1
+        return applied
+
+    def discard(self, name):
+        """Forget name's journal (the character was deleted)"""
+        self.close(name)
+        with self._lock:
+            self._counts.pop(name, None)
+            self._marks.pop(name, None)
+        try:
+            os.remove(self.path(name))
+        except FileNotFoundError:
+            pass
+
+    def close(self, name=None):
+        """Close the append handle for name (or all of them)"""
+        with self._lock:
+            names = list(self._files) if name is None else [name]
+            for key in names:
+                f = self._files.pop(key, None)
+                if f is not None:
+                    f.close()
+
+
+def enable_journal(directory="data/save_games", compact_every=200, durable=False):
+    """Install a CharacterJournal as character_manager.SAVE_JOURNAL. Returns it"""
+    disable_journal()
+    character_manager.SAVE_JOURNAL = CharacterJournal(directory, compact_every, durable)
+    return character_manager.SAVE_JOURNAL
+
+
+def disable_journal():
+    """Close and uninstall the current journal (journal files are kept)"""
+    journal = character_manager.SAVE_JOURNAL
+    if journal is not None:
+        journal.close()
+        character_manager.SAVE_JOURNAL = None
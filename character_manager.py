@@ -12,7 +12,17 @@ and implementing game logic for leveling, healing, and gold management.
 
 This module handles character creation, loading, and saving.
 """
-import os
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import events
+import schema
+import save_backends
+import save_format
+from records import CharacterDict, Inventory
+from schema import Field
 from custom_exceptions import (
     InvalidCharacterClassError,
     CharacterNotFoundError,
@@ -22,6 +32,71 @@ from custom_exceptions import (
 )
 
 
+# ============================================================================
+# SAVE FORMAT
+# ============================================================================
+
+def _split_list(value):
+    return value.split(',') if value else []
+
+
+def _optional_str(value):
+    return value if value else None
+
+
+
+# Save file fields, in the order save_character writes them
+SAVE_SCHEMA = {
+    'name': Field(str),
+    'class': Field(str),
+    'level': Field(int, kind=int),
+    'health': Field(int, kind=int),
+    'max_health': Field(int, kind=int),
+    'strength': Field(int, kind=int),
+    'magic': Field(int, kind=int),
+    'experience': Field(int, kind=int),
+    'gold': Field(int, kind=int),
+    'inventory': Field(_split_list, kind=(list, Inventory)),
+    'active_quests': Field(_split_list, kind=list),
+    'completed_quests': Field(_split_list, kind=list),
+    'equipped_weapon': Field(_optional_str, required=False, kind=(str, type(None))),
+    'equipped_armor': Field(_optional_str, required=False, kind=(str, type(None))),
+    'weapon_bonus': Field(save_format.parse_bonus, required=False, kind=(dict, type(None))),
+    'armor_bonus': Field(save_format.parse_bonus, required=False, kind=(dict, type(None))),
+}
+
+# Stat changes of the equipped weapon / armor, kept apart from the base
+# stats. None means "unknown": the character comes from a save written
+# before bonuses were stored, so the bonus is still part of its base stats.
+BONUS_FIELDS = save_format.BONUS_FIELDS
+# Stats equipment bonuses add to (see get_effective_stats)
+EFFECTIVE_STATS = ('max_health', 'strength', 'magic')
+
+# fsync saves before renaming them into place. Off by default: the rename
+# alone already guarantees a save is either the old or the new version.
+SAVE_FSYNC = False
+
+# Where saves live. None keeps one <name>_save.txt per character in
+# save_directory; set it (or pass backend=) to a save_backends.SQLiteBackend
+# to keep every character in one indexed file.
+SAVE_BACKEND = None
+
+# Encoding used for new saves: "text" (KEY: value lines) or "binary"
+# (save_format). Loading detects either format.
+SAVE_FORMAT = "text"
+
+# In-process cache of loaded/saved characters (see enable_character_cache)
+CHARACTER_CACHE = None
+
+# Journal of changes since the last save (see character_journal.enable_journal)
+SAVE_JOURNAL = None
+
+_SAVE_DISPATCH = schema.build_dispatch(SAVE_SCHEMA)
+_validate_character = schema.make_validator(
+    SAVE_SCHEMA, InvalidSaveDataError, type_message="Field '{field}' has wrong type"
+)
+
+
 # ============================================================================
 # CHARACTER MANAGEMENT
 # ============================================================================
@@ -39,7 +114,7 @@ def create_character(name, character_class):
         raise InvalidCharacterClassError(f"Invalid class '{character_class}'")
 
     stats = classes[character_class]
-    return {
+    return CharacterDict({
         "name": name,
         "class": character_class,
         "level": 1,
@@ -49,141 +124,447 @@ def create_character(name, character_class):
         "magic": stats["magic"],
         "experience": 0,
         "gold": 100,
-        "inventory": [],
+        "inventory": Inventory(),
         "active_quests": [],
         "completed_quests": [],
         "equipped_weapon": None,
-        "equipped_armor": None
-    }
-
-
-def save_character(character, save_directory="data/save_games"):
-    """Save character to file"""
-    os.makedirs(save_directory, exist_ok=True)
-    path = os.path.join(save_directory, f"{character['name']}_save.txt")
-
-    with open(path, 'w') as f:
-        f.write(f"NAME: {character['name']}\n")
-        f.write(f"CLASS: {character['class']}\n")
-        f.write(f"LEVEL: {character['level']}\n")
-        f.write(f"HEALTH: {character['health']}\n")
-        f.write(f"MAX_HEALTH: {character['max_health']}\n")
-        f.write(f"STRENGTH: {character['strength']}\n")
-        f.write(f"MAGIC: {character['magic']}\n")
-        f.write(f"EXPERIENCE: {character['experience']}\n")
-        f.write(f"GOLD: {character['gold']}\n")
-        f.write(f"INVENTORY: {','.join(character['inventory'])}\n")
-        f.write(f"ACTIVE_QUESTS: {','.join(character['active_quests'])}\n")
-        f.write(f"COMPLETED_QUESTS: {','.join(character['completed_quests'])}\n")
-        f.write(f"EQUIPPED_WEAPON: {character.get('equipped_weapon') or ''}\n")
-        f.write(f"EQUIPPED_ARMOR: {character.get('equipped_armor') or ''}\n")
-
+        "equipped_armor": None,
+        "weapon_bonus": {},
+        "armor_bonus": {}
+    })
+
+
+def get_save_backend(save_directory="data/save_games", backend=None):
+    """The backend a save call uses: backend, else SAVE_BACKEND, else text files"""
+    if backend is not None:
+        return backend
+    if SAVE_BACKEND is not None:
+        return SAVE_BACKEND
+    return save_backends.TextFileBackend(save_directory)
+
+
+def save_character(character, save_directory="data/save_games", durable=None, backend=None):
+    """Save character to the save backend (by default <name>_save.txt).
+    Saves are all-or-nothing: a crash mid-save leaves the previous save
+    intact. durable=True (or SAVE_FSYNC) also syncs the data to disk.
+    """
+    durable = SAVE_FSYNC if durable is None else durable
+    backend = get_save_backend(save_directory, backend)
+    cache = CHARACTER_CACHE
+    if cache is not None and cache.write_back and not durable and SAVE_JOURNAL is None:
+        cache.put(backend, character['name'], character, dirty=True)
+        return True
+
+    data = encode_character(character)
+    _write_save(backend, character['name'], data, durable)
+    if cache is not None:
+        cache.put(backend, character['name'], character)
     return True
 
 
-def load_character(character_name, save_directory="data/save_games"):
-    """Load character from save file"""
-    path = os.path.join(save_directory, f"{character_name}_save.txt")
-
-    if not os.path.exists(path):
-        raise CharacterNotFoundError(f"Save file not found: {character_name}")
-
-    character = {}
+def _write_save(backend, name, data, durable=False, since=None):
+    """Write data as the full save of name and restart its journal from it.
+    Every snapshot write goes through here, so a journal never outlives
+    the save it applies to. since is SAVE_JOURNAL.mark(name) taken when
+    data was encoded: changes journaled after it are kept.
+    """
+    backend.write(name, data, durable)
+    if SAVE_JOURNAL is not None:
+        SAVE_JOURNAL.reset(name, data, since)
+
+
+def serialize_character(character):
+    """Build the full text of a save file"""
+    return (
+        f"NAME: {character['name']}\n"
+        f"CLASS: {character['class']}\n"
+        f"LEVEL: {character['level']}\n"
+        f"HEALTH: {character['health']}\n"
+        f"MAX_HEALTH: {character['max_health']}\n"
+        f"STRENGTH: {character['strength']}\n"
+        f"MAGIC: {character['magic']}\n"
+        f"EXPERIENCE: {character['experience']}\n"
+        f"GOLD: {character['gold']}\n"
+        f"INVENTORY: {','.join(character['inventory'])}\n"
+        f"ACTIVE_QUESTS: {','.join(character['active_quests'])}\n"
+        f"COMPLETED_QUESTS: {','.join(character['completed_quests'])}\n"
+        f"EQUIPPED_WEAPON: {character.get('equipped_weapon') or ''}\n"
+        f"EQUIPPED_ARMOR: {character.get('equipped_armor') or ''}\n"
+        f"WEAPON_BONUS: {save_format.format_bonus(character.get('weapon_bonus'))}\n"
+        f"ARMOR_BONUS: {save_format.format_bonus(character.get('armor_bonus'))}\n"
+    )
+
+
+def encode_character(character, fmt=None):
+    """Save bytes for character in fmt (default SAVE_FORMAT)"""
+    fmt = SAVE_FORMAT if fmt is None else fmt
+    if fmt == "binary":
+        return save_format.encode(character)
+    if fmt == "text":
+        return serialize_character(character).encode('utf-8')
+    raise ValueError(f"Unknown save format: {fmt}")
+
+
+def deserialize_character(data):
+    """Parse the bytes of a text or binary save back into a character dict"""
+    if save_format.is_binary(data):
+        character = save_format.decode(data)
+    else:
+        character = schema.parse_block(data.decode('utf-8').splitlines(), SAVE_SCHEMA,
+                                       _SAVE_DISPATCH, InvalidSaveDataError, strict=False)
+    character['inventory'] = Inventory(character['inventory'])
+    return CharacterDict(character)
+
+
+def load_character(character_name, save_directory="data/save_games", backend=None):
+    """Load character from the save backend"""
+    backend = get_save_backend(save_directory, backend)
+    cache = CHARACTER_CACHE
+    if cache is not None:
+        character = cache.get(backend, character_name)
+        if character is not None:
+            return character
+        # Taken before reading, so a write racing the read invalidates the entry
+        signature = backend.signature(character_name)
 
     try:
-        with open(path, 'r') as f:
-            for line in f:
-                if ": " not in line:
-                    continue
-
-                key, value = line.split(": ", 1)
-                key = key.strip().upper()
-                value = value.strip()
-
-                if key == "NAME":
-                    character['name'] = value
-                elif key == "CLASS":
-                    character['class'] = value
-                elif key == "LEVEL":
-                    character['level'] = int(value)
-                elif key == "HEALTH":
-                    character['health'] = int(value)
-                elif key == "MAX_HEALTH":
-                    character['max_health'] = int(value)
-                elif key == "STRENGTH":
-                    character['strength'] = int(value)
-                elif key == "MAGIC":
-                    character['magic'] = int(value)
-                elif key == "EXPERIENCE":
-                    character['experience'] = int(value)
-                elif key == "GOLD":
-                    character['gold'] = int(value)
-                elif key == "INVENTORY":
-                    character['inventory'] = value.split(',') if value else []
-                elif key == "ACTIVE_QUESTS":
-                    character['active_quests'] = value.split(',') if value else []
-                elif key == "COMPLETED_QUESTS":
-                    character['completed_quests'] = value.split(',') if value else []
-                elif key == "EQUIPPED_WEAPON":
-                    character['equipped_weapon'] = value if value else None
-                elif key == "EQUIPPED_ARMOR":
-                    character['equipped_armor'] = value if value else None
-
+        data = backend.read(character_name)
+        if data is None:
+            raise CharacterNotFoundError(f"Save file not found: {character_name}")
+        character = deserialize_character(data)
+        if SAVE_JOURNAL is not None:
+            SAVE_JOURNAL.replay(character_name, data, character)
     except (IOError, ValueError) as e:
         raise SaveFileCorruptedError(f"Corrupted save file: {e}")
 
-    # Add missing fields
-    if 'equipped_weapon' not in character:
-        character['equipped_weapon'] = None
-    if 'equipped_armor' not in character:
-        character['equipped_armor'] = None
-
-    validate_character_data(character)
+    if cache is not None:
+        cache.put(backend, character_name, character, signature=signature)
     return character
 
 
-def list_saved_characters(save_directory="data/save_games"):
-    """Get list of all saved character names"""
-    if not os.path.exists(save_directory):
-        return []
+def list_saved_characters(save_directory="data/save_games", offset=0, limit=None,
+                          backend=None):
+    """Get saved character names in sorted order, optionally one page at a time"""
+    backend = get_save_backend(save_directory, backend)
+    if CHARACTER_CACHE is not None:
+        CHARACTER_CACHE.flush(backend)
+    return backend.names(offset=offset, limit=limit)
 
-    characters = []
-    for filename in os.listdir(save_directory):
-        if filename.endswith("_save.txt"):
-            characters.append(filename.replace("_save.txt", ""))
-    return characters
 
+def delete_character(character_name, save_directory="data/save_games", backend=None):
+    """Delete a character's save"""
+    backend = get_save_backend(save_directory, backend)
+    unsaved = CHARACTER_CACHE is not None and CHARACTER_CACHE.discard(backend, character_name)
+    if SAVE_JOURNAL is not None:
+        SAVE_JOURNAL.discard(character_name)
+    if not backend.delete(character_name) and not unsaved:
+        raise CharacterNotFoundError(f"No save file: {character_name}")
+    return True
 
-def delete_character(character_name, save_directory="data/save_games"):
-    """Delete a character's save file"""
-    path = os.path.join(save_directory, f"{character_name}_save.txt")
 
-    if not os.path.exists(path):
-        raise CharacterNotFoundError(f"No save file: {character_name}")
+# ============================================================================
+# CHARACTER CACHE
+# ============================================================================
 
-    os.remove(path)
-    return True
+def _copy_character(character):
+    """Copy of a character that shares no lists with the original"""
+    return CharacterDict({key: value.copy() if isinstance(value, (list, Inventory)) else value
+                          for key, value in character.items()})
+
+
+class CharacterCache:
+    """Bounded LRU cache of characters, shared by load_character and
+    save_character. Callers always get their own copy of a cached
+    character. A clean entry is dropped when the backend's signature for
+    it changes (e.g. the save file was edited on disk). With write_back,
+    non-durable saves only update the cache and the character is written
+    when its entry is evicted or flush() is called.
+    """
+
+    def __init__(self, capacity=64, write_back=False):
+        if capacity < 1:
+            raise ValueError("Cache capacity must be at least 1")
+        self.capacity = capacity
+        self.write_back = write_back
+        # (backend location, name) -> [character, backend, dirty, signature]
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.write_backs = 0
+
+    def get(self, backend, name):
+        """Copy of the cached character, or None"""
+        key = (backend.location, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not entry[2] and backend.signature(name) != entry[3]:
+                del self._entries[key]
+                self.invalidations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy_character(entry[0])
+
+    def put(self, backend, name, character, dirty=False, signature=None):
+        """Cache a copy of character. Clean entries record the backend
+        signature (read now unless given) to detect outside changes.
+        """
+        if not dirty and signature is None:
+            signature = backend.signature(name)
+        key = (backend.location, name)
+        with self._lock:
+            self._entries[key] = [_copy_character(character), backend, dirty, signature]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                _, entry = self._entries.popitem(last=False)
+                self.evictions += 1
+                if entry[2]:
+                    self._write(entry)
+
+    def update(self, backend, name, change):
+        """Call change(character) on the cached copy of name, if any"""
+        with self._lock:
+            entry = self._entries.get((backend.location, name))
+            if entry is not None:
+                change(entry[0])
+
+    def discard(self, backend, name):
+        """Drop one entry. Returns True if it held unsaved changes"""
+        with self._lock:
+            entry = self._entries.pop((backend.location, name), None)
+        return entry is not None and entry[2]
+
+    def invalidate(self, name=None):
+        """Drop clean entries for name (or for every character). Unsaved
+        changes are kept; call flush() first to write them.
+        """
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if (name is None or key[1] == name) and not entry[2]:
+                    del self._entries[key]
+                    self.invalidations += 1
+
+    def flush(self, backend=None):
+        """Write every dirty entry (only those of backend, if given)"""
+        with self._lock:
+            for key, entry in self._entries.items():
+                if entry[2] and (backend is None or key[0] == backend.location):
+                    self._write(entry)
+
+    def _write(self, entry):
+        character, backend = entry[0], entry[1]
+        _write_save(backend, character['name'], encode_character(character), SAVE_FSYNC)
+        entry[2] = False
+        entry[3] = backend.signature(character['name'])
+        self.write_backs += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        """Counters plus the current size"""
+        return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions, 'invalidations': self.invalidations,
+                'write_backs': self.write_backs}
+
+
+def enable_character_cache(capacity=64, write_back=False):
+    """Install a CharacterCache used by every load/save call. Returns it"""
+    global CHARACTER_CACHE
+    disable_character_cache()
+    CHARACTER_CACHE = CharacterCache(capacity, write_back)
+    return CHARACTER_CACHE
+
+
+def disable_character_cache():
+    """Write back unsaved characters and stop caching"""
+    global CHARACTER_CACHE
+    if CHARACTER_CACHE is not None:
+        CHARACTER_CACHE.flush()
+        CHARACTER_CACHE = None
+
+
+# ============================================================================
+# BATCH OPERATIONS
+# ============================================================================
+
+# Threads used by load_characters / save_characters. File and sqlite I/O
+# release the GIL, so this may usefully exceed the number of cores.
+BATCH_WORKERS = 8
+
+# Per-character failures that are reported instead of aborting a batch
+BATCH_ERRORS = (CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError, OSError)
+
+
+def _run_batch(task, items, workers):
+    """Apply task to every item, in a thread pool when workers > 1"""
+    workers = min(BATCH_WORKERS if workers is None else workers, len(items))
+    if workers <= 1:
+        return [task(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(task, items))
+
+
+def load_characters(names, save_directory="data/save_games", workers=None, backend=None):
+    """Load and validate many characters.
+    Returns (characters, errors): {name: character} for every save that
+    loaded, {name: exception} for the ones that did not.
+    """
+    backend = get_save_backend(save_directory, backend)
+
+    def load(name):
+        try:
+            character = load_character(name, backend=backend)
+            _validate_character(character)
+            return name, character, None
+        except BATCH_ERRORS as e:
+            return name, None, e
+
+    characters, errors = {}, {}
+    for name, character, error in _run_batch(load, list(names), workers):
+        if error is None:
+            characters[name] = character
+        else:
+            errors[name] = error
+    return characters, errors
+
+
+def save_characters(characters, save_directory="data/save_games", durable=None,
+                    workers=None, backend=None):
+    """Validate and save many characters.
+    Returns (saved, errors): the names that were saved, and {index:
+    exception} for the ones that were not, by position in characters
+    (an invalid character may have no usable name).
+    """
+    backend = get_save_backend(save_directory, backend)
+
+    def save(character):
+        try:
+            _validate_character(character)
+            save_character(character, durable=durable, backend=backend)
+            return None
+        except BATCH_ERRORS as e:
+            return e
+
+    characters = list(characters)
+    saved, errors = [], {}
+    for index, error in enumerate(_run_batch(save, characters, workers)):
+        if error is None:
+            saved.append(characters[index]['name'])
+        else:
+            errors[index] = error
+    return saved, errors
+
+
+def migrate_saves(fmt, save_directory="data/save_games", backend=None):
+    """Rewrite every save in fmt ("text" or "binary"). Returns the number converted.
+    With SAVE_JOURNAL set, journaled changes are folded into the new save.
+    """
+    if fmt not in ("text", "binary"):
+        raise ValueError(f"Unknown save format: {fmt}")
+    backend = get_save_backend(save_directory, backend)
+    converted = 0
+    for name in backend.names():
+        data = backend.read(name)
+        if data is None or save_format.is_binary(data) == (fmt == "binary"):
+            continue
+        character = deserialize_character(data)
+        if SAVE_JOURNAL is not None:
+            SAVE_JOURNAL.replay(name, data, character)
+        _write_save(backend, name, encode_character(character, fmt))
+        converted += 1
+    return converted
 
 
 # ============================================================================
 # CHARACTER OPERATIONS
 # ============================================================================
 
+# Leveling from level L to L + 1 costs L * XP_PER_LEVEL experience
+XP_PER_LEVEL = 100
+LEVEL_UP_GAINS = {'max_health': 10, 'strength': 2, 'magic': 2}
+
+def levels_gained(level, experience):
+    """(levels, cost): how many level ups experience pays for starting at
+    level, and the experience they use up. Solves
+        XP_PER_LEVEL * (k*level + k*(k-1)/2) <= experience
+    for the largest k instead of stepping one level at a time.
+    """
+    if experience < level * XP_PER_LEVEL:
+        return 0, 0
+    budget = experience // XP_PER_LEVEL
+    b = 2 * level - 1
+    k = (math.isqrt(b * b + 8 * budget) - b) // 2
+    # isqrt rounds down; nudge k onto the exact boundary
+    while k * level + k * (k - 1) // 2 > budget:
+        k -= 1
+    while (k + 1) * level + (k + 1) * k // 2 <= budget:
+        k += 1
+    return k, XP_PER_LEVEL * (k * level + k * (k - 1) // 2)
+
+
+def apply_level_ups(character, levels):
+    """Apply the stat gains of levels level ups in one step"""
+    character['level'] += levels
+    for stat, gain in LEVEL_UP_GAINS.items():
+        character[stat] += gain * levels
+    character['health'] = get_effective_stats(character)['max_health']
+
+
+def get_effective_stats(character):
+    """{stat: value} for EFFECTIVE_STATS: base stats plus equipment
+    bonuses. Characters with an _effective_stats slot (CharacterDict, as
+    returned by create_character and load_character, TrackedCharacter,
+    records.Character) compute it on first use and keep it until one of
+    records.CACHE_KEYS is written (equip, unequip, level up, or any other
+    change to the base stats); other mappings get a fresh dict each call.
+    Treat the result as read-only.
+    """
+    stats = getattr(character, '_effective_stats', None)
+    if stats is not None:
+        return stats
+
+    stats = {stat: character[stat] for stat in EFFECTIVE_STATS if stat in character}
+    for field in BONUS_FIELDS:
+        bonus = character.get(field)
+        if bonus:
+            for stat, value in bonus.items():
+                if stat in stats:
+                    stats[stat] += value
+    if hasattr(character, '_effective_stats'):
+        character._effective_stats = stats
+    return stats
+
+
+def invalidate_effective_stats(character):
+    """Drop the cached effective stats (and the damage range derived from
+    them). Only needed after changing a bonus dict in place; assigning a
+    stat or bonus field clears the cache already.
+    """
+    if hasattr(character, '_effective_stats'):
+        character._effective_stats = character._damage_range = None
+
+
 def gain_experience(character, xp_amount):
     """Add experience and handle level ups"""
     if is_character_dead(character):
         raise CharacterDeadError("Cannot gain XP while dead")
 
-    character['experience'] += xp_amount
+    experience = character['experience'] + xp_amount
+    old_level = character['level']
+    levels, cost = levels_gained(old_level, experience)
+    character['experience'] = experience - cost
 
-    while character['experience'] >= character['level'] * 100:
-        character['experience'] -= character['level'] * 100
-        character['level'] += 1
-        character['max_health'] += 10
-        character['strength'] += 2
-        character['magic'] += 2
-        character['health'] = character['max_health']
-        print(f"\nLEVEL UP! Now level {character['level']}")
+    if levels:
+        apply_level_ups(character, levels)
+        if events.has_subscribers(events.LevelUp):
+            events.publish(events.LevelUp(character, old_level, character['level']))
 
     return character['level']
 
@@ -202,7 +583,8 @@ def heal_character(character, amount):
         return 0
 
     old_health = character['health']
-    character['health'] = min(character['health'] + amount, character['max_health'])
+    max_health = get_effective_stats(character)['max_health']
+    character['health'] = min(character['health'] + amount, max_health)
     return character['health'] - old_health
 
 
@@ -215,7 +597,7 @@ def revive_character(character):
     """Revive a dead character with 50% health"""
     if not is_character_dead(character):
         return False
-    character['health'] = character['max_health'] // 2
+    character['health'] = get_effective_stats(character)['max_health'] // 2
     return True
 
 
@@ -225,17 +607,4 @@ def revive_character(character):
 
 def validate_character_data(character):
     """Validate character dictionary has required fields"""
-    required = [
-        ('name', str), ('class', str), ('level', int), ('health', int),
-        ('max_health', int), ('strength', int), ('magic', int),
-        ('experience', int), ('gold', int), ('inventory', list),
-        ('active_quests', list), ('completed_quests', list)
-    ]
-
-    for field, field_type in required:
-        if field not in character:
-            raise InvalidSaveDataError(f"Missing field: {field}")
-        if not isinstance(character[field], field_type):
-            raise InvalidSaveDataError(f"Field '{field}' has wrong type")
-
-    return True
+    return _validate_character(character)
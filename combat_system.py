@@ -19,6 +19,20 @@ from custom_exceptions import (
     AbilityOnCooldownError
 )
 import character_manager
+from records import CharacterDict
+import events
+
+ABILITY_COOLDOWN = 2
+ESCAPE_CHANCE = 0.5
+ROGUE_CRIT_CHANCE = 0.5
+CLERIC_HEAL_AMOUNT = 30
+
+# Class -> (stat used, multiplier) for damaging special abilities
+SPECIAL_ABILITY_SCALING = {
+    'Warrior': ('strength', 2),
+    'Mage': ('magic', 2),
+    'Rogue': ('strength', 3),
+}
 
 
 # ============================================================================
@@ -40,7 +54,7 @@ def create_enemy(enemy_type):
         raise InvalidTargetError(f"Unknown enemy: {enemy_type}")
 
     # Return a shallow copy so callers can mutate safely
-    return dict(enemies[key])
+    return CharacterDict(enemies[key])
 
 
 def get_random_enemy_for_level(character_level):
@@ -139,30 +153,35 @@ class SimpleBattle:
             self.enemy['health'] = max(0, self.enemy.get('health', 0) - damage)
             msg = f"You deal {damage} damage!"
             self.battle_log.append(msg)
-            print(msg)
+            self._publish_damage(self.character, self.enemy, damage, msg)
         elif choice == '2':
             if self.ability_cooldown > 0:
                 # Keep raising so tests can assert cooldown behavior if desired
                 raise AbilityOnCooldownError(f"Cooldown: {self.ability_cooldown} turns")
+            enemy_health = self.enemy.get('health', 0)
             msg = use_special_ability(self.character, self.enemy)
             # Some abilities (Cleric heal) return amounts; ensure proper logging
-            self.ability_cooldown = 2
+            self.ability_cooldown = ABILITY_COOLDOWN
             self.battle_log.append(msg)
-            print(msg)
+            damage = enemy_health - self.enemy.get('health', 0)
+            if damage > 0:
+                self._publish_damage(self.character, self.enemy, damage, msg)
+            else:
+                self._publish_message(msg)
         elif choice == '3':
             # 50% chance to escape
-            if random.random() < 0.5:
+            if random.random() < ESCAPE_CHANCE:
                 self.combat_active = False
                 raise CombatNotActiveError("Escaped")
             else:
                 msg = "Failed to escape!"
                 self.battle_log.append(msg)
-                print(msg)
+                self._publish_message(msg)
         else:
             # Invalid choice results in no action but is logged
             msg = "Invalid action."
             self.battle_log.append(msg)
-            print(msg)
+            self._publish_message(msg)
 
     def enemy_turn(self):
         """Handle enemy's turn"""
@@ -173,20 +192,22 @@ class SimpleBattle:
         self.character['health'] = max(0, self.character.get('health', 0) - damage)
         msg = f"{self.enemy.get('name','Enemy')} deals {damage} damage!"
         self.battle_log.append(msg)
-        print(msg)
+        self._publish_damage(self.enemy, self.character, damage, msg)
+
+    @staticmethod
+    def _publish_damage(attacker, target, damage, msg):
+        if events.has_subscribers(events.DamageDealt):
+            events.publish(events.DamageDealt(attacker.get('name', 'Enemy'),
+                                              target.get('name', 'Enemy'), damage, msg))
+
+    @staticmethod
+    def _publish_message(msg):
+        if events.has_subscribers(events.CombatMessage):
+            events.publish(events.CombatMessage(msg))
 
     def calculate_damage(self, attacker, defender):
         """Calculate damage from attacker to defender (simple formula)."""
-        # Default stats if missing
-        attack_stat = int(attacker.get('strength', 5))
-        # If attacker is a spellcaster, prioritize magic
-        if attacker.get('class') == 'Mage' or attacker.get('magic', 0) > attacker.get('strength', 0):
-            attack_stat = int(attacker.get('magic', 5))
-
-        # Base damage at least 1
-        base = max(1, attack_stat)
-        low = max(1, int(base * 0.8))
-        high = max(low, int(base * 1.2))
+        low, high = damage_range(attacker)
         damage = random.randint(low, high)
         return damage
 
@@ -199,6 +220,51 @@ class SimpleBattle:
         return False
 
 
+# ============================================================================
+# DAMAGE RULES
+# ============================================================================
+def get_attack_stat(attacker):
+    """Return the stat used for basic attacks (magic for spellcasters)"""
+    # Equipment bonuses included; default stats if missing
+    stats = character_manager.get_effective_stats(attacker)
+    attack_stat = int(stats.get('strength', 5))
+    # If attacker is a spellcaster, prioritize magic
+    if attacker.get('class') == 'Mage' or stats.get('magic', 0) > stats.get('strength', 0):
+        attack_stat = int(stats.get('magic', 5))
+    return attack_stat
+
+
+def damage_range(attacker):
+    """Return (low, high) bounds of a basic attack roll. Characters with a
+    _damage_range slot keep the bounds until their effective stats are
+    invalidated, so repeated rolls skip the stat lookups.
+    """
+    bounds = getattr(attacker, '_damage_range', None)
+    if bounds is not None:
+        return bounds
+    # Base damage at least 1
+    base = max(1, get_attack_stat(attacker))
+    low = max(1, int(base * 0.8))
+    high = max(low, int(base * 1.2))
+    bounds = (low, high)
+    if hasattr(attacker, '_damage_range'):
+        attacker._damage_range = bounds
+    return bounds
+
+
+def special_damage_range(character):
+    """Return (low, high) bounds of a damaging special ability roll.
+    Returns None for classes whose ability does not deal rolled damage.
+    """
+    scaling = SPECIAL_ABILITY_SCALING.get(character.get('class', ''))
+    if scaling is None:
+        return None
+    stat, multiplier = scaling
+    stat_value = character_manager.get_effective_stats(character).get(stat, 1)
+    damage = max(1, int(stat_value) * multiplier)
+    return int(damage * 0.8), int(damage * 1.2)
+
+
 # ============================================================================
 # SPECIAL ABILITIES
 # ============================================================================
@@ -207,30 +273,27 @@ def use_special_ability(character, enemy):
     char_class = character.get('class', '')
 
     if char_class == 'Warrior':
-        damage = max(1, int(character.get('strength', 1)) * 2)
-        damage = random.randint(int(damage * 0.8), int(damage * 1.2))
+        damage = random.randint(*special_damage_range(character))
         enemy['health'] = max(0, enemy.get('health', 0) - damage)
         return f"Power Strike! {damage} damage!"
 
     elif char_class == 'Mage':
-        damage = max(1, int(character.get('magic', 1)) * 2)
-        damage = random.randint(int(damage * 0.8), int(damage * 1.2))
+        damage = random.randint(*special_damage_range(character))
         enemy['health'] = max(0, enemy.get('health', 0) - damage)
         return f"Fireball! {damage} damage!"
 
     elif char_class == 'Rogue':
-        if random.random() < 0.5:
-            damage = max(1, int(character.get('strength', 1)) * 3)
-            damage = random.randint(int(damage * 0.8), int(damage * 1.2))
+        if random.random() < ROGUE_CRIT_CHANCE:
+            damage = random.randint(*special_damage_range(character))
             enemy['health'] = max(0, enemy.get('health', 0) - damage)
             return f"CRITICAL STRIKE! {damage} damage!"
         else:
-            damage = max(1, int(character.get('strength', 1)))
+            damage = max(1, int(character_manager.get_effective_stats(character).get('strength', 1)))
             enemy['health'] = max(0, enemy.get('health', 0) - damage)
             return f"Missed critical. {damage} damage."
 
     elif char_class == 'Cleric':
-        healed = character_manager.heal_character(character, 30)
+        healed = character_manager.heal_character(character, CLERIC_HEAL_AMOUNT)
         return f"Heal! Restored {healed} HP."
 
     return "No special ability."
@@ -253,7 +316,8 @@ def display_combat_stats(character, enemy):
     """Display current combat status (safe access)."""
     c_name = character.get('name', 'Player')
     e_name = enemy.get('name', 'Enemy')
-    c_health = f"{character.get('health', 0)}/{character.get('max_health', 0)}"
+    c_max = character_manager.get_effective_stats(character).get('max_health', 0)
+    c_health = f"{character.get('health', 0)}/{c_max}"
     e_health = f"{enemy.get('health', 0)}/{enemy.get('max_health', 0)}"
     print(f"  {c_name}: {c_health} HP")
     print(f"  {e_name}: {e_health} HP")
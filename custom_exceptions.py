@@ -57,6 +57,11 @@ class CorruptedDataError(DataError):
     pass
 
 
+class DuplicateDataIdError(DataError):
+    """Raised when the same quest or item ID is defined more than once"""
+    pass
+
+
 # Character Exceptions
 class InvalidCharacterClassError(CharacterError):
     """Raised when an invalid character class is chosen"""
@@ -151,6 +156,7 @@ class InvalidSaveDataError(GameError):
 __all__ = [
     "GameError", "DataError", "CharacterError", "CombatError", "QuestError", "InventoryError",
     "InvalidDataFormatError", "MissingDataFileError", "CorruptedDataError",
+    "DuplicateDataIdError",
     "InvalidCharacterClassError", "CharacterNotFoundError", "InsufficientLevelError",
     "CharacterDeadError",
     "InvalidTargetError", "CombatNotActiveError", "AbilityOnCooldownError",
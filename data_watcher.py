@@ -0,0 +1,165 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Data Watcher Module
+
+Hot-reloads data files (quests, items) while the game is running.
+Files are polled by mtime/size; when the optional `watchdog` package is
+installed its filesystem events wake the poller early. Only the file
+that changed is re-parsed, and the new catalog replaces the old one in
+a single assignment after parsing has fully succeeded, so readers never
+see a half-parsed catalog. Reload callbacks let dependent caches
+invalidate themselves.
+"""
+
+import os
+import threading
+
+from custom_exceptions import GameError
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+
+def _file_signature(filename):
+    """(mtime_ns, size) of a file, or None if it cannot be read"""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class _WakeHandler(FileSystemEventHandler):
+    """watchdog handler that wakes the polling thread on any event"""
+
+    def __init__(self, wake):
+        super().__init__()
+        self.wake = wake
+
+    def on_any_event(self, event):
+        self.wake.set()
+
+
+class DataWatcher:
+    """Keeps named catalogs in sync with their source files"""
+
+    def __init__(self, interval=1.0, backend='auto'):
+        if backend == 'auto':
+            backend = 'poll' if Observer is None else 'watchdog'
+        elif backend not in ('poll', 'watchdog'):
+            raise ValueError(f"Unknown backend: {backend}")
+        elif backend == 'watchdog' and Observer is None:
+            raise ImportError("watchdog backend requested but watchdog is not installed")
+
+        self.interval = interval
+        self.backend = backend
+
+        self._sources = {}      # name -> (filename, loader)
+        self._signatures = {}   # name -> last loaded file signature
+        self._catalogs = {}     # name -> parsed catalog (replaced, never mutated)
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._observer = None
+        self.errors = {}        # name -> last reload or callback error, cleared on success
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+    def watch(self, name, filename, loader, catalog=None):
+        """Start tracking a file. loader(filename) must return the parsed catalog.
+        Pass catalog when the caller has already loaded the file.
+        """
+        signature = _file_signature(filename)
+        if catalog is None:
+            catalog = loader(filename)
+        with self._lock:
+            self._sources[name] = (filename, loader)
+            self._signatures[name] = signature
+            self._catalogs[name] = catalog
+        return catalog
+
+    def on_reload(self, callback):
+        """Register callback(name, catalog), called after each successful reload.
+        An exception from a callback is recorded in errors[name] and the
+        remaining callbacks still run.
+        """
+        self._callbacks.append(callback)
+
+    def get(self, name):
+        """Current catalog for name"""
+        return self._catalogs[name]
+
+    # ------------------------------------------------------------------
+    # Reloading
+    # ------------------------------------------------------------------
+    def check(self):
+        """Poll every watched file once. Returns the names that were reloaded"""
+        reloaded = []
+        with self._lock:
+            for name, (filename, loader) in list(self._sources.items()):
+                signature = _file_signature(filename)
+                if signature is None or signature == self._signatures.get(name):
+                    continue
+                try:
+                    catalog = loader(filename)
+                except (GameError, OSError, ValueError) as e:
+                    # Keep serving the last good catalog; retry on the next change
+                    self.errors[name] = e
+                    self._signatures[name] = signature
+                    continue
+                self._signatures[name] = signature
+                self._catalogs[name] = catalog
+                self.errors.pop(name, None)
+                reloaded.append((name, catalog))
+
+        for name, catalog in reloaded:
+            for callback in self._callbacks:
+                try:
+                    callback(name, catalog)
+                except Exception as e:
+                    # Never let one callback stop the reloads (or the thread)
+                    self.errors[name] = e
+        return [name for name, _ in reloaded]
+
+    # ------------------------------------------------------------------
+    # Background thread
+    # ------------------------------------------------------------------
+    def start(self):
+        """Run check() in a daemon thread until stop() is called"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        if self.backend == 'watchdog':
+            self._observer = Observer()
+            directories = {os.path.dirname(os.path.abspath(f)) for f, _ in self._sources.values()}
+            for directory in directories:
+                self._observer.schedule(_WakeHandler(self._wake), directory)
+            self._observer.start()
+        self._thread = threading.Thread(target=self._run, name="DataWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread (and watchdog observer, if any)"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if not self._stop.is_set():
+                self.check()
@@ -0,0 +1,95 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Events Module
+
+A small publish/subscribe bus for game events. Game modules publish
+typed events instead of printing; front ends (the CLI in main.py, a
+server, tests) subscribe to the event types they care about.
+
+Publishers guard event construction with has_subscribers, so an event
+nobody listens to costs one dict lookup:
+
+    if events.has_subscribers(events.DamageDealt):
+        events.publish(events.DamageDealt("Hero", "Goblin", 12, "You deal 12 damage!"))
+"""
+
+from dataclasses import dataclass
+
+_subscribers = {}   # event type -> tuple of callbacks (key absent when empty)
+
+
+# ============================================================================
+# EVENT TYPES
+# ============================================================================
+@dataclass(frozen=True, slots=True)
+class DamageDealt:
+    """Someone in a battle took damage"""
+    attacker: str
+    target: str
+    amount: int
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class CombatMessage:
+    """Any other battle outcome worth showing (heals, failed escapes, ...)"""
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class LevelUp:
+    """A character gained one or more levels in one XP grant"""
+    character: dict
+    old_level: int
+    new_level: int
+
+    @property
+    def message(self):
+        return f"\nLEVEL UP! Now level {self.new_level}"
+
+
+@dataclass(frozen=True, slots=True)
+class ItemUsed:
+    """A consumable was used"""
+    character: dict
+    item_id: str
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class QuestCompleted:
+    """A quest was completed and its rewards granted"""
+    character: dict
+    quest_id: str
+    reward_xp: int
+    reward_gold: int
+    message: str
+
+
+# ============================================================================
+# BUS
+# ============================================================================
+def subscribe(event_type, callback):
+    """Call callback(event) for every published event of event_type"""
+    _subscribers[event_type] = _subscribers.get(event_type, ()) + (callback,)
+
+
+def unsubscribe(event_type, callback):
+    """Remove a callback added with subscribe"""
+    callbacks = list(_subscribers.get(event_type, ()))
+    callbacks.remove(callback)
+    if callbacks:
+        _subscribers[event_type] = tuple(callbacks)
+    else:
+        del _subscribers[event_type]
+
+
+def has_subscribers(event_type):
+    """True if publishing event_type would reach anyone"""
+    return event_type in _subscribers
+
+
+def publish(event):
+    """Deliver event to the subscribers of its type"""
+    for callback in _subscribers.get(type(event), ()):
+        callback(event)
@@ -12,164 +12,536 @@ and formatting errors, and structuring the data into dictionaries.
 This module handles loading and validating game data from text files.
 """
 
+import glob
 import os
+import pickle
+import tempfile
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+import schema
+from schema import Field
+from save_backends import _file_mode
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
-    CorruptedDataError
+    CorruptedDataError,
+    DuplicateDataIdError,
+    ItemNotFoundError
 )
 
+# Compiled caches live next to the source file as <filename>.cache.
+# Bump CACHE_VERSION whenever the parsed record layout changes.
+CACHE_SUFFIX = ".cache"
+CACHE_VERSION = 2
+
 
 # ============================================================================
 # DATA LOADING
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"):
+def load_quests(filename="data/quests.txt", use_cache=True):
     """Load quest data from file"""
     if not os.path.exists(filename):
         raise MissingDataFileError(f"File not found: {filename}")
 
-    try:
-        with open(filename, 'r') as f:
-            content = f.read()
+    if use_cache:
+        return _load_cached(filename, _parse_quests_file)
+    return _parse_quests_file(filename)
 
-        blocks = [b.strip() for b in content.split('\n\n') if b.strip()]
-        quests = {}
 
-        for block in blocks:
-            quest = parse_quest_block(block.split('\n'))
-            validate_quest_data(quest)
-            quests[quest['quest_id']] = quest
+def load_items(filename="data/items.txt", use_cache=True):
+    """Load item data from file"""
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"File not found: {filename}")
 
-        return quests
+    if use_cache:
+        return _load_cached(filename, _parse_items_file)
+    return _parse_items_file(filename)
 
-    except (IOError, ValueError) as e:
-        raise CorruptedDataError(f"Failed to load quests: {e}")
 
+def _parse_quests_file(filename):
+    """Parse a quest file into {quest_id: quest}"""
+    return {quest['quest_id']: quest for quest in _stream_quests(filename)}
 
-def load_items(filename="data/items.txt"):
-    """Load item data from file"""
+
+def _parse_items_file(filename):
+    """Parse an item file into {item_id: item}"""
+    return {item['item_id']: item for item in _stream_items(filename)}
+
+
+# ============================================================================
+# STREAMING
+# ============================================================================
+
+def iter_quests(filename="data/quests.txt"):
+    """Yield validated quests one block at a time.
+    Memory use is bounded by a single block, so this works for catalogs
+    far larger than RAM.
+    """
     if not os.path.exists(filename):
         raise MissingDataFileError(f"File not found: {filename}")
+    return _stream_quests(filename)
+
 
+def iter_items(filename="data/items.txt"):
+    """Yield validated items one block at a time"""
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"File not found: {filename}")
+    return _stream_items(filename)
+
+
+def _iter_blocks(filename):
+    """Yield (first_line_number, lines) for each blank-line separated block"""
+    with open(filename, 'r') as f:
+        lines = []
+        start = 0
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if line:
+                if not lines:
+                    start = line_number
+                lines.append(line)
+            elif lines:
+                yield start, lines
+                lines = []
+        if lines:
+            yield start, lines
+
+
+def _stream_quests(filename):
     try:
-        with open(filename, 'r') as f:
-            content = f.read()
+        for _, lines in _iter_blocks(filename):
+            yield parse_quest_block(lines)
+    except (IOError, ValueError) as e:
+        raise CorruptedDataError(f"Failed to load quests: {e}")
 
-        blocks = [b.strip() for b in content.split('\n\n') if b.strip()]
-        items = {}
 
-        for block in blocks:
-            item = parse_item_block(block.split('\n'))
-            validate_item_data(item)
-            items[item['item_id']] = item
+def _stream_items(filename):
+    try:
+        for _, lines in _iter_blocks(filename):
+            yield parse_item_block(lines)
+    except (IOError, ValueError) as e:
+        raise CorruptedDataError(f"Failed to load items: {e}")
 
-        return items
 
+# ============================================================================
+# DATA PACKS
+# ============================================================================
+
+def load_quest_pack(source, workers=None):
+    """Load quests from every file in a directory, glob or list of files"""
+    return _load_pack(source, 'quest', workers)
+
+
+def load_item_pack(source, workers=None):
+    """Load items from every file in a directory, glob or list of files"""
+    return _load_pack(source, 'item', workers)
+
+
+def find_pack_files(source):
+    """Expand a directory (all *.txt inside), glob pattern or list into sorted paths"""
+    if isinstance(source, (list, tuple)):
+        files = list(source)
+    elif os.path.isdir(source):
+        files = sorted(glob.glob(os.path.join(source, "*.txt")))
+    else:
+        files = sorted(glob.glob(source))
+
+    if not files:
+        raise MissingDataFileError(f"No data files found for: {source}")
+    for filename in files:
+        if not os.path.exists(filename):
+            raise MissingDataFileError(f"File not found: {filename}")
+    return files
+
+
+def _parse_pack_file(task):
+    """Worker entry point: parse one file into [(id, line_number, record)]"""
+    kind, filename = task
+    parse, id_field = ((parse_quest_block, 'quest_id') if kind == 'quest'
+                       else (parse_item_block, 'item_id'))
+    entries = []
+    line_number = 0
+    try:
+        for line_number, lines in _iter_blocks(filename):
+            record = parse(lines)
+            entries.append((record[id_field], line_number, record))
+    except InvalidDataFormatError as e:
+        raise InvalidDataFormatError(f"{filename}:{line_number}: {e}")
     except (IOError, ValueError) as e:
-        raise CorruptedDataError(f"Failed to load items: {e}")
+        raise CorruptedDataError(f"{filename}:{line_number}: Failed to load {kind}s: {e}")
+    return filename, entries
+
+
+def _load_pack(source, kind, workers):
+    """Parse pack files in a process pool and merge them in file order"""
+    files = find_pack_files(source)
+    tasks = [(kind, filename) for filename in files]
+    workers = min(workers or os.cpu_count() or 1, len(files))
+
+    if workers == 1:
+        parsed = list(map(_parse_pack_file, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(_parse_pack_file, tasks))
+
+    merged = {}
+    origins = {}
+    duplicates = []
+    for filename, entries in parsed:
+        for record_id, line_number, record in entries:
+            if record_id in merged:
+                first_file, first_line = origins[record_id]
+                duplicates.append(f"{record_id} at {filename}:{line_number} "
+                                  f"(first defined at {first_file}:{first_line})")
+                continue
+            merged[record_id] = record
+            origins[record_id] = (filename, line_number)
+
+    if duplicates:
+        raise DuplicateDataIdError(f"Duplicate {kind} IDs: " + "; ".join(duplicates))
+    return merged
 
 
 # ============================================================================
-# PARSING
+# COMPILED CACHE
 # ============================================================================
 
-def parse_quest_block(lines):
-    """Parse quest block into dictionary"""
-    quest = {}
-
-    for line in lines:
-        if ": " not in line:
-            raise InvalidDataFormatError(f"Invalid line: {line}")
-
-        key, value = line.split(": ", 1)
-        key = key.strip().lower()
-        value = value.strip()
-
-        if key == "quest_id":
-            quest['quest_id'] = value
-        elif key == "title":
-            quest['title'] = value
-        elif key == "description":
-            quest['description'] = value
-        elif key == "reward_xp":
-            quest['reward_xp'] = int(value)
-        elif key == "reward_gold":
-            quest['reward_gold'] = int(value)
-        elif key == "required_level":
-            quest['required_level'] = int(value)
-        elif key == "prerequisite":
-            quest['prerequisite'] = value
-
-    return quest
+def _source_signature(filename):
+    """Cache key for a data file: format version, size and mtime"""
+    stat = os.stat(filename)
+    return (CACHE_VERSION, stat.st_size, stat.st_mtime_ns)
 
 
-def parse_item_block(lines):
-    """Parse item block into dictionary"""
-    item = {}
-
-    for line in lines:
-        if ": " not in line:
-            raise InvalidDataFormatError(f"Invalid line: {line}")
-
-        key, value = line.split(": ", 1)
-        key = key.strip().lower()
-        value = value.strip()
-
-        if key == "item_id":
-            item['item_id'] = value
-        elif key == "name":
-            item['name'] = value
-        elif key == "type":
-            item['type'] = value.lower()
-        elif key == "effect":
-            item['effect'] = value
-        elif key == "cost":
-            item['cost'] = int(value)
-        elif key == "description":
-            item['description'] = value
+def _load_cached(filename, parse):
+    """Return parsed data from the cache, rebuilding it if the source changed"""
+    cache_path = filename + CACHE_SUFFIX
+    try:
+        signature = _source_signature(filename)
+    except OSError as e:
+        raise CorruptedDataError(f"Failed to stat {filename}: {e}")
 
-    return item
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_signature, data = pickle.load(f)
+        if cached_signature == signature:
+            return data
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass  # Missing or unreadable cache: fall back to parsing
+
+    data = parse(filename)
+    _write_cache(cache_path, signature, data)
+    return data
+
+
+def _write_cache(cache_path, signature, data):
+    """Atomically write a cache file; failures only cost the next load a reparse"""
+    directory = os.path.dirname(cache_path) or "."
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((signature, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp_path, _file_mode(cache_path))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def clear_cache(filename):
+    """Remove the compiled cache for a data file, if any"""
+    try:
+        os.remove(filename + CACHE_SUFFIX)
+        return True
+    except FileNotFoundError:
+        return False
 
 
 # ============================================================================
-# VALIDATION
+# LAZY CATALOGS
 # ============================================================================
 
-def validate_quest_data(quest):
-    """Validate quest dictionary has required fields"""
-    required = ['quest_id', 'title', 'description', 'reward_xp',
-                'reward_gold', 'required_level', 'prerequisite']
+# Fields decoded up front; everything else is re-read from disk on access.
+# Include every field the inventory and quest functions read, so gameplay
+# never touches the disk halfway through changing a character.
+ITEM_HOT_FIELDS = ('item_id', 'name', 'type', 'effect', 'effects', 'cost')
+QUEST_HOT_FIELDS = ('quest_id', 'title', 'reward_xp', 'reward_gold', 'required_level',
+                    'prerequisite')
+
+
+def load_items_lazy(filename="data/items.txt"):
+    """Index items by byte offset, keeping only the hot fields in memory"""
+    return LazyCatalog(filename, parse_item_block, 'item_id', ITEM_HOT_FIELDS)
+
+
+def load_quests_lazy(filename="data/quests.txt"):
+    """Index quests by byte offset, keeping only the hot fields in memory"""
+    return LazyCatalog(filename, parse_quest_block, 'quest_id', QUEST_HOT_FIELDS)
+
+
+class LazyRecord(Mapping):
+    """Read-only record whose cold fields are decoded on first access"""
+
+    __slots__ = ('_hot', '_cold', '_catalog', '_start', '_end')
+
+    def __init__(self, hot, catalog, start, end):
+        self._hot = hot            # tuple of values, in catalog.hot_fields order
+        self._cold = None
+        self._catalog = catalog
+        self._start = start
+        self._end = end
+
+    def __getitem__(self, key):
+        index = self._catalog._hot_index.get(key)
+        if index is not None:
+            return self._hot[index]
+        if self._cold is None:
+            self._cold = self._catalog._cold_fields(self)
+        return self._cold[key]
+
+    def __iter__(self):
+        return iter(self._catalog.fields)
+
+    def __len__(self):
+        return len(self._catalog.fields)
+
+    def __repr__(self):
+        return f"LazyRecord({dict(zip(self._catalog.hot_fields, self._hot))!r})"
+
+
+class LazyCatalog(Mapping):
+    """Mapping of id -> LazyRecord built from one pass over a data file.
+    Every block is parsed and validated while indexing, but only the hot
+    fields and the block's byte span are kept. Repeated hot strings
+    (types, effects) are shared between records. If the file changes
+    after indexing, the spans are re-indexed on the next cold read: hot
+    fields keep their indexed values, cold fields come from the current
+    file.
+    """
+
+    def __init__(self, filename, parse, id_field, hot_fields):
+        if not os.path.exists(filename):
+            raise MissingDataFileError(f"File not found: {filename}")
+        self.filename = filename
+        self.hot_fields = tuple(hot_fields)
+        self.fields = ()
+        self._hot_index = {field: i for i, field in enumerate(self.hot_fields)}
+        self._parse = parse
+        self._id_field = id_field
+        self._signature = _source_signature(filename)
+        self._records = {}
+
+        shared = {}
+        try:
+            for (start, end), lines in self._iter_spans():
+                record = parse(lines)
+                self.fields = self.fields or tuple(record)
+                hot = tuple(shared.setdefault(record[field], record[field])
+                            if field != id_field else record[field]
+                            for field in self.hot_fields)
+                self._records[record[id_field]] = LazyRecord(hot, self, start, end)
+        except (IOError, ValueError, UnicodeDecodeError) as e:
+            raise CorruptedDataError(f"Failed to index {filename}: {e}")
+
+    def _iter_spans(self):
+        """Yield ((start, end) byte offsets, lines) for each block"""
+        with open(self.filename, 'rb') as f:
+            lines = []
+            start = offset = 0
+            for raw in f:
+                line = raw.decode('utf-8').strip()
+                if line:
+                    if not lines:
+                        start = offset
+                    lines.append(line)
+                elif lines:
+                    yield (start, offset), lines
+                    lines = []
+                offset += len(raw)
+            if lines:
+                yield (start, offset), lines
+
+    def _cold_fields(self, record):
+        """Parse record's block, re-indexing first if the file changed"""
+        if _source_signature(self.filename) != self._signature:
+            self._reindex()
+        if record._start is None:
+            record_id = record[self._id_field]
+            raise CorruptedDataError(f"{record_id} was removed from {self.filename}")
+        return self._read_block(record._start, record._end)
+
+    def _reindex(self):
+        """Point every record at its block in the changed file"""
+        signature = _source_signature(self.filename)
+        spans = {}
+        try:
+            for span, lines in self._iter_spans():
+                spans[self._parse(lines)[self._id_field]] = span
+        except (IOError, ValueError, UnicodeDecodeError) as e:
+            raise CorruptedDataError(f"Failed to index {self.filename}: {e}")
+        for record_id, record in self._records.items():
+            record._start, record._end = spans.get(record_id, (None, None))
+        self._signature = signature
+
+    def _read_block(self, start, end):
+        """Re-read and parse one block from disk"""
+        with open(self.filename, 'rb') as f:
+            f.seek(start)
+            text = f.read(end - start).decode('utf-8')
+        return self._parse([line.strip() for line in text.splitlines() if line.strip()])
+
+    def __getitem__(self, record_id):
+        return self._records[record_id]
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
 
-    for field in required:
-        if field not in quest:
-            raise InvalidDataFormatError(f"Missing field: {field}")
 
-    if not isinstance(quest['reward_xp'], int):
-        raise InvalidDataFormatError("reward_xp must be integer")
-    if not isinstance(quest['reward_gold'], int):
-        raise InvalidDataFormatError("reward_gold must be integer")
-    if not isinstance(quest['required_level'], int):
-        raise InvalidDataFormatError("required_level must be integer")
+# ============================================================================
+# RESOLVED ITEM CATALOG
+# ============================================================================
 
-    return True
+def load_item_catalog(filename="data/items.txt", use_cache=True):
+    """load_items wrapped in an ItemCatalog"""
+    return ItemCatalog(load_items(filename, use_cache))
 
 
-def validate_item_data(item):
-    """Validate item dictionary has required fields"""
-    required = ['item_id', 'name', 'type', 'effect', 'cost', 'description']
-    valid_types = ['weapon', 'armor', 'consumable']
+class ItemCatalog(Mapping):
+    """Read-only {item_id: item} mapping resolved once for the inventory
+    functions: every item has its parsed 'effects', and resolve() is a
+    single dict lookup. Build it once (load_item_catalog) and pass it
+    wherever item_data is expected.
+    """
+
+    __slots__ = ('_items',)
+
+    def __init__(self, items):
+        resolved = {}
+        for item_id, item in items.items():
+            if 'effects' not in item:
+                item = dict(item)
+                item['effects'] = parse_effects(item.get('effect', ''))
+            resolved[item_id] = item
+        self._items = resolved
+
+    def resolve(self, item_id):
+        """The item for item_id; ItemNotFoundError if there is none"""
+        try:
+            return self._items[item_id]
+        except KeyError:
+            raise ItemNotFoundError(f"Item data for '{item_id}' not found.") from None
+
+    def __getitem__(self, item_id):
+        return self._items[item_id]
+
+    def __contains__(self, item_id):
+        return item_id in self._items
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, item_id, default=None):
+        return self._items.get(item_id, default)
+
+    def __repr__(self):
+        return f"ItemCatalog({len(self._items)} items)"
+
+
+# ============================================================================
+# SCHEMAS
+# ============================================================================
+
+VALID_ITEM_TYPES = ('weapon', 'armor', 'consumable')
+# Stats an item EFFECT may change ("strength:5", or "strength:5,magic:2")
+EFFECT_STATS = ('health', 'max_health', 'strength', 'magic')
+EFFECT_SEPARATOR = ','
+
+QUEST_SCHEMA = {
+    'quest_id': Field(str),
+    'title': Field(str),
+    'description': Field(str),
+    'reward_xp': Field(int, kind=int),
+    'reward_gold': Field(int, kind=int),
+    'required_level': Field(int, kind=int),
+    'prerequisite': Field(str),
+}
+
+ITEM_SCHEMA = {
+    'item_id': Field(str),
+    'name': Field(str),
+    'type': Field(str.lower, choices=VALID_ITEM_TYPES),
+    'effect': Field(str),
+    'cost': Field(int, kind=int),
+    'description': Field(str),
+}
+
+_QUEST_DISPATCH = schema.build_dispatch(QUEST_SCHEMA)
+_ITEM_DISPATCH = schema.build_dispatch(ITEM_SCHEMA)
 
-    for field in required:
-        if field not in item:
-            raise InvalidDataFormatError(f"Missing field: {field}")
 
-    if item['type'] not in valid_types:
-        raise InvalidDataFormatError(f"Invalid type: {item['type']}")
+# ============================================================================
+# PARSING
+# ============================================================================
+
+def parse_quest_block(lines):
+    """Parse and validate a quest block into a dictionary"""
+    return schema.parse_block(lines, QUEST_SCHEMA, _QUEST_DISPATCH, InvalidDataFormatError)
+
+
+def parse_item_block(lines):
+    """Parse and validate an item block into a dictionary.
+    The EFFECT text is also parsed into item['effects'].
+    """
+    item = schema.parse_block(lines, ITEM_SCHEMA, _ITEM_DISPATCH, InvalidDataFormatError)
+    item['effects'] = parse_effects(item['effect'])
+    return item
+
+
+def parse_effects(effect):
+    """Parse effect text such as "strength:5,magic:2" into a tuple of
+    (stat, delta) pairs. An empty effect gives ().
+    """
+    effects = []
+    for part in effect.split(EFFECT_SEPARATOR) if effect.strip() else ():
+        stat, sep, value = part.partition(':')
+        stat = stat.strip()
+        if not sep or stat not in EFFECT_STATS:
+            raise InvalidDataFormatError(f"Invalid effect: {effect}")
+        try:
+            effects.append((stat, int(value)))
+        except ValueError:
+            raise InvalidDataFormatError(f"Invalid effect value: {effect}") from None
+    return tuple(effects)
 
-    if not isinstance(item['cost'], int):
-        raise InvalidDataFormatError("cost must be integer")
 
+# ============================================================================
+# VALIDATION
+# ============================================================================
+
+_validate_quest = schema.make_validator(QUEST_SCHEMA, InvalidDataFormatError)
+_validate_item = schema.make_validator(ITEM_SCHEMA, InvalidDataFormatError)
+
+
+def validate_quest_data(quest):
+    """Validate quest dictionary has required fields"""
+    return _validate_quest(quest)
+
+
+def validate_item_data(item):
+    """Validate item dictionary has required fields and a well-formed effect"""
+    _validate_item(item)
+    parse_effects(item['effect'])
     return True
 
 
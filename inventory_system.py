@@ -12,16 +12,27 @@ that match test expectations.
 This module handles inventory management, item usage, and equipment.
 """
 
+import functools
+from collections.abc import Mapping
 from custom_exceptions import (
+    InvalidDataFormatError,
+    InventoryError,
     InventoryFullError,
     ItemNotFoundError,
     InsufficientResourcesError,
     InvalidItemTypeError
 )
 import character_manager
+import events
+import game_data
+from game_data import ItemCatalog
+from records import Inventory
 
 MAX_INVENTORY_SIZE = 20
 
+# Keys that mark item_data as one item's metadata rather than a catalog
+_SINGLE_ITEM_KEYS = ('type', 'cost', 'effect', 'name', 'id')
+
 
 # ============================================================================
 # HELPERS
@@ -29,35 +40,108 @@ MAX_INVENTORY_SIZE = 20
 def _resolve_item(item_id, item_data):
     """Resolve item metadata.
     Accepts either:
+      - item_data as a game_data.ItemCatalog (direct lookup)
       - item_data as a dict representing the single item
-      - item_data as mapping {item_id: {...}, ...}
+      - item_data as mapping {item_id: {...}, ...} (including lazy catalogs)
     Returns the item dict or raises ItemNotFoundError.
     """
+    if type(item_data) is ItemCatalog:
+        return item_data.resolve(item_id)
+
     if item_data is None:
         raise ItemNotFoundError(f"No item data provided for '{item_id}'.")
 
     # If it's a mapping keyed by item ids, return that entry
-    if isinstance(item_data, dict):
-        if item_id in item_data:
+    if isinstance(item_data, Mapping):
+        try:
             return item_data[item_id]
+        except KeyError:
+            pass
 
         # If the dict looks like a single item (contains typical item fields),
         # treat it as item metadata for the requested item_id.
-        known_keys = {'type', 'cost', 'effect', 'name', 'id'}
-        if any(k in item_data for k in known_keys):
+        if any(k in item_data for k in _SINGLE_ITEM_KEYS):
             return item_data
 
     # Otherwise, can't resolve
     raise ItemNotFoundError(f"Item data for '{item_id}' not found.")
 
 
+# Raw item dicts (not from game_data.load_items) carry no parsed 'effects';
+# their effect text is parsed once per distinct string
+_parse_effect_text = functools.lru_cache(maxsize=256)(game_data.parse_effects)
+
+
+def _item_effects(item_id, item):
+    """The item's parsed (stat, delta) effects"""
+    effects = item.get('effects')
+    if effects is None:
+        try:
+            effects = _parse_effect_text(item.get('effect') or "")
+        except InvalidDataFormatError:
+            raise InvalidItemTypeError(f"Malformed effect for {item.get('name', item_id)}")
+    return effects
+
+
+def _effective_max_health(character):
+    return character_manager.get_effective_stats(character).get('max_health', 0)
+
+
+def _apply_use(character, effects):
+    """Apply a consumable's effects (they change the base stats)"""
+    for stat, value in effects:
+        if stat == 'health':
+            character_manager.heal_character(character, value)
+            continue
+        character[stat] = character.get(stat, 0) + value
+        if stat == 'max_health':
+            # Optionally heal the same amount to current health
+            character['health'] = min(character.get('health', 0) + value,
+                                      _effective_max_health(character))
+
+
+def _equip_bonus(character, field, effects):
+    """Store an equipped item's effects as the bonus in field
+    ('weapon_bonus' / 'armor_bonus'); base stats are left alone
+    """
+    bonus = {}
+    for stat, value in effects:
+        bonus[stat] = bonus.get(stat, 0) + value
+    character[field] = bonus
+    if 'health' in bonus:
+        character['health'] = character.get('health', 0) + bonus['health']
+    if 'max_health' in bonus:
+        character['health'] = min(character.get('health', 0) + bonus['max_health'],
+                                  _effective_max_health(character))
+
+
+def _unequip_bonus(character, field, item_id, item):
+    """Clear the bonus in field for the item being unequipped"""
+    bonus = character.get(field)
+    if bonus is None:
+        # Equipped before bonuses were kept apart: the item's effects are
+        # part of the base stats, so take them off those
+        for stat, value in _item_effects(item_id, item):
+            character[stat] = character.get(stat, 0) - value
+        if 'max_health' in character:
+            character['max_health'] = max(0, character['max_health'])
+        clamp = True
+    else:
+        if 'health' in bonus:
+            character['health'] = character.get('health', 0) - bonus['health']
+        clamp = 'max_health' in bonus
+    character[field] = {}
+    if clamp:
+        character['health'] = min(character.get('health', 0), _effective_max_health(character))
+
+
 # ============================================================================
 # INVENTORY MANAGEMENT
 # ============================================================================
 def add_item_to_inventory(character, item_id):
     """Add an item to character's inventory"""
     if 'inventory' not in character or character['inventory'] is None:
-        character['inventory'] = []
+        character['inventory'] = Inventory()
     if len(character['inventory']) >= MAX_INVENTORY_SIZE:
         raise InventoryFullError("Your inventory is full!")
     character['inventory'].append(item_id)
@@ -102,35 +186,16 @@ def use_item(character, item_id, item_data):
     if item.get('type') != 'consumable':
         raise InvalidItemTypeError(f"{item.get('name', item_id)} is not consumable.")
 
-    effect = item.get('effect')
-    if not effect or ':' not in effect:
+    effects = _item_effects(item_id, item)
+    if not effects:
         raise InvalidItemTypeError(f"Malformed effect for {item.get('name', item_id)}")
 
-    stat, value_str = effect.split(':', 1)
-    stat = stat.strip()
-    try:
-        value = int(value_str.strip())
-    except ValueError:
-        raise InvalidItemTypeError(f"Invalid effect value for {item.get('name', item_id)}")
-
-    if stat == 'health':
-        healed = character_manager.heal_character(character, value)
-    elif stat == 'strength':
-        character['strength'] = character.get('strength', 0) + value
-        healed = 0
-    elif stat == 'magic':
-        character['magic'] = character.get('magic', 0) + value
-        healed = 0
-    elif stat == 'max_health':
-        character['max_health'] = character.get('max_health', 0) + value
-        # Optionally heal the same amount to current health
-        character['health'] = min(character.get('health', 0) + value, character['max_health'])
-        healed = value
-    else:
-        raise InvalidItemTypeError(f"Unknown stat '{stat}' for {item.get('name', item_id)}")
-
+    _apply_use(character, effects)
     remove_item_from_inventory(character, item_id)
-    return f"Used {item.get('name', item_id)}"
+    message = f"Used {item.get('name', item_id)}"
+    if events.has_subscribers(events.ItemUsed):
+        events.publish(events.ItemUsed(character, item_id, message))
+    return message
 
 
 def equip_weapon(character, item_id, item_data):
@@ -140,6 +205,7 @@ def equip_weapon(character, item_id, item_data):
     item = _resolve_item(item_id, item_data)
     if item.get('type') != 'weapon':
         raise InvalidItemTypeError(f"{item.get('name', item_id)} is not a weapon.")
+    effects = _item_effects(item_id, item)
 
     # Unequip old weapon
     if character.get('equipped_weapon'):
@@ -150,22 +216,7 @@ def equip_weapon(character, item_id, item_data):
 
     # Remove from inventory and equip
     remove_item_from_inventory(character, item_id)
-
-    # Apply stat bonus, safe parsing
-    effect = item.get('effect', '')
-    if ':' in effect:
-        stat, value_str = effect.split(':', 1)
-        try:
-            value = int(value_str.strip())
-        except ValueError:
-            value = 0
-        stat = stat.strip()
-        if stat == 'max_health':
-            character['max_health'] = character.get('max_health', 0) + value
-            character['health'] = min(character.get('health', 0) + value, character['max_health'])
-        else:
-            character[stat] = character.get(stat, 0) + value
-
+    _equip_bonus(character, 'weapon_bonus', effects)
     character['equipped_weapon'] = item_id
     return f"Equipped {item.get('name', item_id)}"
 
@@ -177,6 +228,7 @@ def equip_armor(character, item_id, item_data):
     item = _resolve_item(item_id, item_data)
     if item.get('type') != 'armor':
         raise InvalidItemTypeError(f"{item.get('name', item_id)} is not armor.")
+    effects = _item_effects(item_id, item)
 
     # Unequip old armor
     if character.get('equipped_armor'):
@@ -185,21 +237,7 @@ def equip_armor(character, item_id, item_data):
         unequip_armor(character, item_data)
 
     remove_item_from_inventory(character, item_id)
-
-    effect = item.get('effect', '')
-    if ':' in effect:
-        stat, value_str = effect.split(':', 1)
-        try:
-            value = int(value_str.strip())
-        except ValueError:
-            value = 0
-        stat = stat.strip()
-        if stat == 'max_health':
-            character['max_health'] = character.get('max_health', 0) + value
-            character['health'] = min(character.get('health', 0) + value, character['max_health'])
-        else:
-            character[stat] = character.get(stat, 0) + value
-
+    _equip_bonus(character, 'armor_bonus', effects)
     character['equipped_armor'] = item_id
     return f"Equipped {item.get('name', item_id)}"
 
@@ -214,21 +252,7 @@ def unequip_weapon(character, item_data):
         raise InventoryFullError("Inventory full")
 
     item = _resolve_item(weapon_id, item_data)
-
-    # Remove stat bonus if present
-    effect = item.get('effect', '')
-    if ':' in effect:
-        stat, value_str = effect.split(':', 1)
-        try:
-            value = int(value_str.strip())
-        except ValueError:
-            value = 0
-        stat = stat.strip()
-        if stat == 'max_health':
-            character['max_health'] = max(0, character.get('max_health', 0) - value)
-            character['health'] = min(character.get('health', 0), character['max_health'])
-        else:
-            character[stat] = character.get(stat, 0) - value
+    _unequip_bonus(character, 'weapon_bonus', weapon_id, item)
 
     add_item_to_inventory(character, weapon_id)
     character['equipped_weapon'] = None
@@ -245,21 +269,7 @@ def unequip_armor(character, item_data):
         raise InventoryFullError("Inventory full")
 
     item = _resolve_item(armor_id, item_data)
-
-    # Remove stat bonus if present
-    effect = item.get('effect', '')
-    if ':' in effect:
-        stat, value_str = effect.split(':', 1)
-        try:
-            value = int(value_str.strip())
-        except ValueError:
-            value = 0
-        stat = stat.strip()
-        if stat == 'max_health':
-            character['max_health'] = max(0, character.get('max_health', 0) - value)
-            character['health'] = min(character.get('health', 0), character['max_health'])
-        else:
-            character[stat] = character.get(stat, 0) - value
+    _unequip_bonus(character, 'armor_bonus', armor_id, item)
 
     add_item_to_inventory(character, armor_id)
     character['equipped_armor'] = None
@@ -290,6 +300,128 @@ def sell_item(character, item_id, item_data):
     return sell_price
 
 
+# ============================================================================
+# TRANSACTIONS
+# ============================================================================
+TRANSACTION_ACTIONS = ('buy', 'sell', 'use')
+
+
+def apply_transaction(character, operations, item_data):
+    """Apply a batch of buy/sell/use operations all-or-nothing.
+    operations is a list of (action, item_id) or (action, item_id, quantity).
+    Every operation is first checked, in order, against gold, inventory
+    space and held items; if one would fail its error is raised and the
+    character is left untouched. The checked batch is then applied in
+    one pass (gold once at the end) and rolled back if anything fails.
+    Returns the net gold change.
+    """
+    plan, gold_change = _plan_transaction(character, operations, item_data)
+    if character.get('inventory') is None:
+        character['inventory'] = Inventory()
+    inventory = character['inventory']
+
+    stats = {stat: character[stat] for stat in game_data.EFFECT_STATS if stat in character}
+    undo = []
+    try:
+        for action, item_id, quantity, item, effects in plan:
+            if action == 'buy':
+                _add_items(inventory, item_id, quantity)
+                undo.append((_remove_items, item_id, quantity))
+            else:
+                _remove_items(inventory, item_id, quantity)
+                undo.append((_add_items, item_id, quantity))
+                if action == 'use':
+                    for _ in range(quantity):
+                        _apply_use(character, effects)
+        if gold_change:
+            character_manager.add_gold(character, gold_change)
+    except Exception:
+        for reverse, item_id, quantity in reversed(undo):
+            reverse(inventory, item_id, quantity)
+        for stat, value in stats.items():
+            if character[stat] != value:
+                character[stat] = value
+        raise
+
+    if events.has_subscribers(events.ItemUsed):
+        for action, item_id, quantity, item, effects in plan:
+            if action == 'use':
+                message = f"Used {item.get('name', item_id)}"
+                for _ in range(quantity):
+                    events.publish(events.ItemUsed(character, item_id, message))
+    return gold_change
+
+
+def _plan_transaction(character, operations, item_data):
+    """Check operations without changing anything.
+    Returns ([(action, item_id, quantity, item, effects)], net gold change).
+    """
+    inventory = character.get('inventory') or ()
+    start_gold = gold = character.get('gold', 0)
+    size = len(inventory)
+    held = {}       # item_id -> quantity held after the operations so far
+    items = {}      # item_id -> resolved item, resolved once per batch
+    plan = []
+
+    for operation in operations:
+        action, item_id = operation[0], operation[1]
+        quantity = operation[2] if len(operation) > 2 else 1
+        if action not in TRANSACTION_ACTIONS:
+            raise InventoryError(f"Unknown transaction action: {action}")
+        if quantity < 1:
+            raise InventoryError(f"Invalid quantity for '{item_id}': {quantity}")
+
+        item = items.get(item_id)
+        if item is None:
+            item = items[item_id] = _resolve_item(item_id, item_data)
+        count = held.get(item_id)
+        if count is None:
+            count = inventory.count(item_id)
+
+        effects = None
+        if action == 'buy':
+            cost = int(item.get('cost', 0)) * quantity
+            if gold < cost:
+                raise InsufficientResourcesError(f"Need {cost} gold, have {gold}.")
+            if size + quantity > MAX_INVENTORY_SIZE:
+                raise InventoryFullError("Your inventory is full!")
+            gold -= cost
+            size += quantity
+            held[item_id] = count + quantity
+        else:
+            if count < quantity:
+                raise ItemNotFoundError(f"Item '{item_id}' not in inventory.")
+            if action == 'sell':
+                gold += int(item.get('cost', 0)) // 2 * quantity
+            else:
+                if item.get('type') != 'consumable':
+                    raise InvalidItemTypeError(f"{item.get('name', item_id)} is not consumable.")
+                effects = _item_effects(item_id, item)
+                if not effects:
+                    raise InvalidItemTypeError(
+                        f"Malformed effect for {item.get('name', item_id)}")
+            size -= quantity
+            held[item_id] = count - quantity
+        plan.append((action, item_id, quantity, item, effects))
+
+    return plan, gold - start_gold
+
+
+def _add_items(inventory, item_id, quantity):
+    if isinstance(inventory, Inventory):
+        inventory.add(item_id, quantity)
+    else:
+        inventory.extend([item_id] * quantity)
+
+
+def _remove_items(inventory, item_id, quantity):
+    if isinstance(inventory, Inventory):
+        inventory.remove(item_id, quantity)
+    else:
+        for _ in range(quantity):
+            inventory.remove(item_id)
+
+
 # ============================================================================
 # DISPLAY
 # ============================================================================
@@ -320,12 +452,16 @@ def display_inventory(character, item_data=None):
     print(f"Armor: {armor_name}")
 
     if inv:
-        item_counts = {}
-        for item_id in inv:
-            item_counts[item_id] = item_counts.get(item_id, 0) + 1
+        if isinstance(inv, Inventory):
+            stacks = inv.stacks()
+        else:
+            item_counts = {}
+            for item_id in inv:
+                item_counts[item_id] = item_counts.get(item_id, 0) + 1
+            stacks = item_counts.items()
 
         print("\nItems:")
-        for item_id, count in item_counts.items():
+        for item_id, count in stacks:
             name = item_id
             if item_data:
                 try:
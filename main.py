@@ -21,12 +21,25 @@ import inventory_system
 import quest_handler
 import combat_system
 import game_data
+import data_watcher
+import autosave
+import character_journal
+import events
 from custom_exceptions import *
 
+# Dirty characters are fully saved at most this often (and always on quit);
+# the journal records every change in between
+AUTOSAVE_INTERVAL = 60.0
+# Characters kept in memory so Load Game after a save skips the disk
+CHARACTER_CACHE_SIZE = 32
+
 current_character = None
 all_quests = {}
 all_items = {}
 game_running = False
+watcher = None
+journal = None
+saver = autosave.WriteBehindSaver(interval=AUTOSAVE_INTERVAL)
 
 
 # ============================================================================
@@ -55,8 +68,10 @@ def new_game():
     char_class = classes.get(class_choice, 'Warrior')
 
     try:
-        current_character = character_manager.create_character(name, char_class)
-        save_game()
+        current_character = track_character(
+            character_manager.create_character(name, char_class), new=True
+        )
+        save_game(force=True)
         game_loop()
     except InvalidCharacterClassError as e:
         print(f"Error: {e}")
@@ -78,7 +93,9 @@ def load_game():
     choice = input("Select character: ").strip()
     if choice.isdigit() and 1 <= int(choice) <= len(saves):
         try:
-            current_character = character_manager.load_character(saves[int(choice) - 1])
+            current_character = track_character(
+                character_manager.load_character(saves[int(choice) - 1])
+            )
             game_loop()
         except (CharacterNotFoundError, SaveFileCorruptedError) as e:
             print(f"Error: {e}")
@@ -111,7 +128,7 @@ def game_loop():
             elif choice == 5:
                 shop()
             elif choice == 6:
-                save_game()
+                save_game(force=True)
                 game_running = False
                 current_character = None
 
@@ -137,8 +154,9 @@ def game_loop():
 
 def game_menu():
     """Display game menu"""
+    max_health = character_manager.get_effective_stats(current_character)['max_health']
     print(f"\n=== {current_character['name']} Lv.{current_character['level']} ===")
-    print(f"HP: {current_character['health']}/{current_character['max_health']} | Gold: {current_character['gold']}")
+    print(f"HP: {current_character['health']}/{max_health} | Gold: {current_character['gold']}")
     print("1. Stats  2. Inventory  3. Quests  4. Explore  5. Shop  6. Save & Quit")
     choice = input("Choice: ").strip()
     return int(choice) if choice.isdigit() else 0
@@ -151,9 +169,10 @@ def game_menu():
 def view_stats():
     """View character stats"""
     c = current_character
+    stats = character_manager.get_effective_stats(c)
     print(f"\n{c['name']} - {c['class']} Lv.{c['level']}")
-    print(f"HP: {c['health']}/{c['max_health']}")
-    print(f"STR: {c['strength']} | MAG: {c['magic']}")
+    print(f"HP: {c['health']}/{stats['max_health']}")
+    print(f"STR: {stats['strength']} | MAG: {stats['magic']}")
     print(f"XP: {c['experience']}/{c['level'] * 100}")
     print(f"Gold: {c['gold']}")
 
@@ -277,10 +296,29 @@ def shop():
 # SAVE/LOAD
 # ============================================================================
 
-def save_game():
-    """Save current game"""
+def track_character(character, new=False):
+    """Wrap character for autosave and, when enabled, journaling"""
+    character = saver.track(character, dirty=new)
+    if journal is not None:
+        # attach writes a full snapshot
+        character = journal.attach(character)
+        character.dirty = False
+    return character
+
+
+# Game events the CLI shows as they happen
+CLI_EVENTS = (events.DamageDealt, events.CombatMessage, events.LevelUp)
+
+
+def print_event(event):
+    """CLI subscriber: print the event's message"""
+    print(event.message)
+
+
+def save_game(force=False):
+    """Save current game if it changed (write-behind, see AUTOSAVE_INTERVAL)"""
     if current_character:
-        character_manager.save_character(current_character)
+        saver.save(current_character, force=force)
 
 
 def load_game_data():
@@ -291,13 +329,41 @@ def load_game_data():
     os.makedirs("data", exist_ok=True)
     
     try:
-        all_quests = game_data.load_quests()
-        all_items = game_data.load_items()
-        quest_handler.validate_quest_prerequisites(all_quests)
+        all_quests = load_checked_quests()
+        all_items = game_data.load_item_catalog()
     except MissingDataFileError:
         game_data.create_default_data_files()
         all_quests = game_data.load_quests()
-        all_items = game_data.load_items()
+        all_items = game_data.load_item_catalog()
+
+
+def load_checked_quests(filename="data/quests.txt"):
+    """load_quests, rejecting circular prerequisites (ValueError)"""
+    quests = game_data.load_quests(filename)
+    quest_handler.validate_quest_prerequisites(quests)
+    return quests
+
+
+def start_data_watcher(interval=1.0):
+    """Hot-reload quests and items when their files change on disk"""
+    global watcher
+
+    watcher = data_watcher.DataWatcher(interval)
+    watcher.watch('quests', "data/quests.txt", load_checked_quests, all_quests)
+    watcher.watch('items', "data/items.txt", game_data.load_item_catalog, all_items)
+    watcher.on_reload(apply_reloaded_data)
+    watcher.start()
+    return watcher
+
+
+def apply_reloaded_data(name, catalog):
+    """Swap a freshly reloaded catalog into the game state"""
+    global all_quests, all_items
+
+    if name == 'quests':
+        all_quests = catalog
+    elif name == 'items':
+        all_items = catalog
 
 
 # ============================================================================
@@ -306,8 +372,14 @@ def load_game_data():
 
 def main():
     """Main execution"""
+    global journal
     print("=== QUEST CHRONICLES ===")
     load_game_data()
+    start_data_watcher()
+    character_manager.enable_character_cache(CHARACTER_CACHE_SIZE)
+    for event_type in CLI_EVENTS:
+        events.subscribe(event_type, print_event)
+    journal = character_journal.enable_journal()
 
     while True:
         choice = main_menu()
@@ -319,6 +391,12 @@ def main():
             print("Goodbye!")
             break
 
+    saver.flush()
+    character_journal.disable_journal()
+    character_manager.disable_character_cache()
+    if watcher:
+        watcher.stop()
+
 
 if __name__ == "__main__":
     main()
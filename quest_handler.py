@@ -20,6 +20,7 @@ from custom_exceptions import (
     InsufficientLevelError
 )
 import character_manager
+import events
 
 
 # ============================================================================
@@ -83,7 +84,10 @@ def complete_quest(character, quest_id, all_quests):
     character_manager.add_gold(character, reward_gold)
     
     quest_title = quest.get('title', quest_id)
-    return f"Completed: {quest_title} | +{reward_xp} XP, +{reward_gold} gold"
+    message = f"Completed: {quest_title} | +{reward_xp} XP, +{reward_gold} gold"
+    if events.has_subscribers(events.QuestCompleted):
+        events.publish(events.QuestCompleted(character, quest_id, reward_xp, reward_gold, message))
+    return message
 
 
 def abandon_quest(character, quest_id):
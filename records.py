@@ -0,0 +1,382 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Records Module
+
+Compact __slots__ record types for items, quests, characters and
+enemies. Each record behaves like the plain dict the rest of the game
+uses (record['gold'], .get(), setdefault, `in`, iteration, ==), so it
+can be passed to existing functions unchanged, while storing its fields
+in slots instead of a per-object hash table.
+
+Keys outside a record's fields are still accepted and kept in a small
+overflow dict that is only created when needed.
+
+CharacterDict is the plain dict characters and enemies are created and
+loaded as, plus a slot for derived values cached on the character.
+
+Inventory stores a character's items as stacks (item_id -> quantity)
+while still looking like the plain list of item ids callers expect.
+"""
+
+from collections.abc import MutableMapping, MutableSequence
+
+
+class SlotRecord(MutableMapping):
+    """Base class: dict-compatible access over __slots__ fields"""
+
+    __slots__ = ('_extra',)
+    FIELDS = ()
+
+    def __init__(self, data=(), **kwargs):
+        self._extra = None
+        if data:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self._field_set:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._field_set:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in self._field_set:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for field in self.FIELDS:
+            if hasattr(self, field):
+                yield field
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self):
+        count = sum(1 for field in self.FIELDS if hasattr(self, field))
+        return count + (len(self._extra) if self._extra else 0)
+
+    def get(self, key, default=None):
+        if key in self._field_set:
+            return getattr(self, key, default)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def copy(self):
+        return type(self)(self)
+
+    def to_dict(self):
+        """Plain dict copy of this record"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+
+
+class Item(SlotRecord):
+    """Item loaded from items.txt"""
+
+    FIELDS = ('item_id', 'name', 'type', 'effect', 'effects', 'cost', 'description')
+    __slots__ = FIELDS
+
+
+class Quest(SlotRecord):
+    """Quest loaded from quests.txt"""
+
+    FIELDS = ('quest_id', 'title', 'description', 'reward_xp', 'reward_gold',
+              'required_level', 'prerequisite')
+    __slots__ = FIELDS
+
+
+# Keys the cached effective stats and damage range are derived from
+# (character_manager.EFFECTIVE_STATS, BONUS_FIELDS and level). Writing one
+# clears the caches of a CharacterDict / Character.
+CACHE_KEYS = frozenset(('level', 'max_health', 'strength', 'magic',
+                        'weapon_bonus', 'armor_bonus'))
+
+
+class Character(SlotRecord):
+    """Player character (same keys as character_manager.create_character)"""
+
+    FIELDS = ('name', 'class', 'level', 'health', 'max_health', 'strength', 'magic',
+              'experience', 'gold', 'inventory', 'active_quests', 'completed_quests',
+              'equipped_weapon', 'equipped_armor', 'weapon_bonus', 'armor_bonus')
+    # Caches for character_manager.get_effective_stats and combat_system.damage_range
+    __slots__ = FIELDS + ('_effective_stats', '_damage_range')
+
+    def __init__(self, data=(), **kwargs):
+        self._effective_stats = self._damage_range = None
+        super().__init__(data, **kwargs)
+
+    def __setitem__(self, key, value):
+        if key in CACHE_KEYS:
+            self._effective_stats = self._damage_range = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        if key in CACHE_KEYS:
+            self._effective_stats = self._damage_range = None
+        super().__delitem__(key)
+
+
+class Enemy(SlotRecord):
+    """Enemy (same keys as combat_system.create_enemy)"""
+
+    FIELDS = ('name', 'health', 'max_health', 'strength', 'magic', 'xp_reward', 'gold_reward')
+    __slots__ = FIELDS
+
+
+class CharacterDict(dict):
+    """Character (or enemy) dict with a slot for cached derived values.
+    Still a dict: it compares, copies and serializes like one. Every
+    change to a CACHE_KEYS key clears the caches; copies start without.
+    """
+
+    # Caches for character_manager.get_effective_stats and combat_system.damage_range
+    __slots__ = ('_effective_stats', '_damage_range')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._effective_stats = self._damage_range = None
+
+    def _clear_caches(self):
+        self._effective_stats = self._damage_range = None
+
+    def __setitem__(self, key, value):
+        if key in CACHE_KEYS:
+            self._effective_stats = self._damage_range = None
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        if key in CACHE_KEYS:
+            self._effective_stats = self._damage_range = None
+        dict.__delitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self._clear_caches()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if key in CACHE_KEYS and key not in self:
+            self._clear_caches()
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *default):
+        if key in CACHE_KEYS:
+            self._clear_caches()
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._clear_caches()
+        return dict.popitem(self)
+
+    def clear(self):
+        self._clear_caches()
+        dict.clear(self)
+
+    def copy(self):
+        return CharacterDict(self)
+
+    __copy__ = copy
+
+
+class Inventory(MutableSequence):
+    """Inventory kept as stacks of item_id -> quantity.
+    add/append, remove, `in`, count and len are O(1) whatever the size
+    of the inventory. It still reads like the list of item ids it
+    replaces (iteration, indexing, sort), listing each item as many
+    times as it is held, grouped by stack in the order each stack was
+    started. Since the order is by stack, == against a list or tuple
+    compares the items held and ignores their order. Positional
+    operations (inv[i], inv[i] = x, del inv[i]) work but cost O(n);
+    insert only accepts the end of the inventory, as there is no other
+    position to keep. It is not a list subclass: use list(inv) where a
+    real list is needed (json.dumps, isinstance checks).
+    """
+
+    __slots__ = ('_counts', '_size', '_owner', '_key')
+
+    def __init__(self, items=()):
+        self._counts = {}
+        self._size = 0
+        self._owner = None      # set by autosave.TrackedCharacter
+        self._key = None
+        if isinstance(items, Inventory):
+            self._counts = dict(items._counts)
+            self._size = items._size
+        else:
+            for item_id in items:
+                self.add(item_id)
+
+    @classmethod
+    def from_stacks(cls, stacks):
+        """Build an Inventory from {item_id: quantity}"""
+        inventory = cls()
+        for item_id, quantity in stacks.items():
+            inventory.add(item_id, quantity)
+        return inventory
+
+    def _changed(self, op, value=None):
+        owner = self._owner
+        if owner is not None:
+            owner.dirty = True
+            if owner.listener is not None:
+                # 'set' reports the new contents
+                owner.listener(owner, op, self._key, list(self) if op == 'set' else value)
+
+    # ------------------------------------------------------------------
+    # O(1) stack operations
+    # ------------------------------------------------------------------
+    def add(self, item_id, quantity=1):
+        """Add quantity of item_id"""
+        if quantity < 1:
+            raise ValueError("Quantity must be at least 1")
+        self._counts[item_id] = self._counts.get(item_id, 0) + quantity
+        self._size += quantity
+        if quantity == 1:
+            self._changed('append', item_id)
+        else:
+            self._changed('set')
+
+    def append(self, item_id):
+        self.add(item_id)
+
+    def remove(self, item_id, quantity=1):
+        """Remove quantity of item_id; ValueError if there are fewer
+        (like list.remove)
+        """
+        count = self._counts.get(item_id, 0)
+        if count < quantity or quantity < 1:
+            raise ValueError(f"{item_id!r} not in inventory")
+        if count == quantity:
+            del self._counts[item_id]
+        else:
+            self._counts[item_id] = count - quantity
+        self._size -= quantity
+        if quantity == 1:
+            self._changed('remove', item_id)
+        else:
+            self._changed('set')
+
+    def count(self, item_id):
+        return self._counts.get(item_id, 0)
+
+    def stacks(self):
+        """(item_id, quantity) pairs, one per stack"""
+        return self._counts.items()
+
+    def __contains__(self, item_id):
+        return item_id in self._counts
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for item_id, quantity in self._counts.items():
+            for _ in range(quantity):
+                yield item_id
+
+    def clear(self):
+        if self._size:
+            self._counts.clear()
+            self._size = 0
+            self._changed('set')
+
+    def copy(self):
+        return Inventory(self)
+
+    # ------------------------------------------------------------------
+    # List compatibility (O(n))
+    # ------------------------------------------------------------------
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __setitem__(self, index, value):
+        """Replace the item at index (in the grouped listing)"""
+        items = list(self)
+        items[index] = value
+        self._replace(items)
+
+    def __delitem__(self, index):
+        items = list(self)
+        del items[index]
+        self._replace(items)
+
+    def insert(self, index, item_id):
+        """Only at the end (index >= len), which is append"""
+        if index < self._size:
+            raise TypeError("Inventory keeps stacks, not positions: use add()")
+        self.add(item_id)
+
+    def sort(self, key=None, reverse=False):
+        """Order the stacks like list.sort would order the items"""
+        order = sorted(self._counts, key=key, reverse=reverse)
+        self._counts = {item_id: self._counts[item_id] for item_id in order}
+        self._changed('set')
+
+    def pop(self, index=-1):
+        item_id = self[index]
+        self.remove(item_id)
+        return item_id
+
+    def _replace(self, items):
+        self._counts = {}
+        self._size = 0
+        for item_id in items:
+            self._counts[item_id] = self._counts.get(item_id, 0) + 1
+            self._size += 1
+        self._changed('set')
+
+    def __eq__(self, other):
+        if isinstance(other, Inventory):
+            return self._counts == other._counts
+        if isinstance(other, (list, tuple)):
+            if len(other) != self._size:
+                return False
+            counts = {}
+            for item_id in other:
+                counts[item_id] = counts.get(item_id, 0) + 1
+            return counts == self._counts
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Inventory({list(self)!r})"
+
+
+def compact_catalog(catalog, record_type):
+    """Convert {id: dict} (e.g. from game_data.load_items) into {id: record}"""
+    return {record_id: record_type(data) for record_id, data in catalog.items()}
@@ -0,0 +1,286 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Backends Module
+
+Pluggable storage for character saves. A backend stores one opaque
+payload (bytes) per character name; character_manager handles the
+encoding. Every backend offers the same small interface:
+
+    write(name, data, durable=False)
+    read(name)                          -> bytes, or None if missing
+    delete(name)                        -> True if something was deleted
+    names(offset=0, limit=None, after=None) -> sorted list of names
+    count()
+    signature(name)     -> value that changes when the stored save changes
+    location            -> identifies the store (for caches)
+
+TextFileBackend is the original layout, one `<name>_save.txt` per
+character. SQLiteBackend keeps every character in a single indexed
+sqlite3 file, so load/save/delete are primary-key B-tree lookups and
+listing is paginated instead of scanning a directory.
+
+Copy saves from one backend to another with:
+    python save_backends.py data/save_games data/saves.db
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+
+SAVE_SUFFIX = "_save.txt"
+
+# Read once: os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _file_mode(path):
+    """Permissions for a file replacing path: the existing file's, else
+    those a plain open() would create (mkstemp files are always 0600)
+    """
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def _atomic_write(path, data, durable=False):
+    """Write data to a temp file in the same directory, then os.replace it over path"""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp",
+                                    dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    if durable and hasattr(os, 'O_DIRECTORY'):
+        # Persist the rename itself
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _page(names, offset, limit, after):
+    """Apply after/offset/limit to an already sorted list of names"""
+    if after is not None:
+        names = [name for name in names if name > after]
+    end = None if limit is None else offset + limit
+    return names[offset:end]
+
+
+# ============================================================================
+# ONE TEXT FILE PER CHARACTER
+# ============================================================================
+class TextFileBackend:
+    """Original layout: save_directory/<name>_save.txt"""
+
+    def __init__(self, directory="data/save_games"):
+        self.directory = directory
+
+    @property
+    def location(self):
+        return os.path.abspath(self.directory)
+
+    def path(self, name):
+        return os.path.join(self.directory, f"{name}{SAVE_SUFFIX}")
+
+    def write(self, name, data, durable=False):
+        os.makedirs(self.directory, exist_ok=True)
+        _atomic_write(self.path(name), data, durable)
+
+    def read(self, name):
+        try:
+            with open(self.path(name), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def delete(self, name):
+        try:
+            os.remove(self.path(name))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def names(self, offset=0, limit=None, after=None):
+        if not os.path.isdir(self.directory):
+            return []
+        names = sorted(
+            entry.name[:-len(SAVE_SUFFIX)]
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(SAVE_SUFFIX) and not entry.name.startswith(".")
+        )
+        return _page(names, offset, limit, after)
+
+    def count(self):
+        return len(self.names())
+
+    def signature(self, name):
+        """(mtime_ns, size) of the save file, or None if it does not exist"""
+        try:
+            stat = os.stat(self.path(name))
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def close(self):
+        pass
+
+
+# ============================================================================
+# SINGLE INDEXED SQLITE FILE
+# ============================================================================
+class SQLiteBackend:
+    """All characters in one sqlite3 table keyed (and indexed) by name.
+    Each write is its own transaction, so a save is all-or-nothing like
+    the temp-file + rename used by TextFileBackend. Safe to share
+    between threads.
+    """
+
+    def __init__(self, path="data/saves.db"):
+        self.path = path
+        self.location = os.path.abspath(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._synchronous = None
+        self._set_durable(False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS characters ("
+            " name TEXT PRIMARY KEY,"
+            " payload BLOB NOT NULL"
+            ") WITHOUT ROWID"
+        )
+
+    def _set_durable(self, durable):
+        # NORMAL in WAL mode never corrupts the store but may lose the last
+        # commits on power loss; FULL syncs every commit
+        synchronous = "FULL" if durable else "NORMAL"
+        if synchronous != self._synchronous:
+            self._conn.execute(f"PRAGMA synchronous={synchronous}")
+            self._synchronous = synchronous
+
+    def write(self, name, data, durable=False):
+        with self._lock:
+            self._set_durable(durable)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO characters (name, payload) VALUES (?, ?)",
+                (name, bytes(data)),
+            )
+
+    def write_many(self, items, durable=False):
+        """Write several (name, data) pairs in one transaction"""
+        with self._lock:
+            self._set_durable(durable)
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO characters (name, payload) VALUES (?, ?)",
+                    ((name, bytes(data)) for name, data in items),
+                )
+
+    def read(self, name):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM characters WHERE name = ?", (name,)
+            ).fetchone()
+        return None if row is None else bytes(row[0])
+
+    def delete(self, name):
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM characters WHERE name = ?", (name,))
+        return cursor.rowcount > 0
+
+    def names(self, offset=0, limit=None, after=None):
+        """Sorted names. Prefer after=<last name of previous page> over a
+        large offset: it seeks the index instead of skipping rows.
+        """
+        query = "SELECT name FROM characters"
+        params = []
+        if after is not None:
+            query += " WHERE name > ?"
+            params.append(after)
+        query += " ORDER BY name LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query, params)]
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM characters").fetchone()[0]
+
+    def signature(self, name):
+        """sqlite's data_version: changes whenever another connection
+        commits to the store (writes through this object do not change it)
+        """
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+def open_backend(location):
+    """SQLiteBackend for a *.db / *.sqlite path, TextFileBackend for a directory"""
+    if location.endswith((".db", ".sqlite", ".sqlite3")):
+        return SQLiteBackend(location)
+    return TextFileBackend(location)
+
+
+def copy_saves(source, target, batch_size=1000):
+    """Copy every save from one backend to another. Returns the number copied"""
+    copied = 0
+    after = None
+    while True:
+        names = source.names(limit=batch_size, after=after)
+        if not names:
+            return copied
+        batch = [(name, source.read(name)) for name in names]
+        batch = [(name, data) for name, data in batch if data is not None]
+        if hasattr(target, 'write_many'):
+            target.write_many(batch)
+        else:
+            for name, data in batch:
+                target.write(name, data)
+        copied += len(batch)
+        after = names[-1]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("usage: python save_backends.py SOURCE TARGET  (directory or .db file)")
+        sys.exit(2)
+    source, target = open_backend(sys.argv[1]), open_backend(sys.argv[2])
+    try:
+        print(f"Copied {copy_saves(source, target)} saves to {sys.argv[2]}")
+    finally:
+        source.close()
+        target.close()
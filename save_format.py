@@ -0,0 +1,165 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Save Format Module
+
+Compact, versioned binary encoding for character saves.
+
+    header  b"QCSB", version byte, then in one struct: level, health,
+            max_health, strength, magic, experience, gold (int64), the
+            string table size in bytes, and the number of inventory
+            stacks / active quest / completed quest entries (uint32)
+    table   UTF-8, NUL-separated: name, class, equipped weapon, equipped
+            armor ("" for none), weapon bonus, armor bonus (format_bonus),
+            then the inventory stack item IDs, active and completed
+            quest entries
+    counts  uint32 quantity of each inventory stack
+
+Older saves still load: version 2 stores every inventory entry as its
+own string and the list lengths as uint16, and version 1 additionally
+has no bonus strings (both bonuses load as None).
+
+The whole table is encoded, decoded and split in one call each, and
+item IDs may contain commas. character_manager picks text or
+binary on save (SAVE_FORMAT) and detects the format on load.
+
+Convert existing saves with:
+    python save_format.py binary [data/save_games | data/saves.db]
+"""
+
+import struct
+import sys
+from operator import itemgetter
+
+from custom_exceptions import SaveFileCorruptedError
+from records import Inventory
+
+MAGIC = b"QCSB"
+VERSION = 3
+SEPARATOR = "\0"
+
+STAT_FIELDS = ('level', 'health', 'max_health', 'strength', 'magic', 'experience', 'gold')
+LIST_FIELDS = ('inventory', 'active_quests', 'completed_quests')
+BONUS_FIELDS = ('weapon_bonus', 'armor_bonus')
+# Single strings before the list entries, per version
+_FIXED_STRINGS = {1: 4, 2: 4 + len(BONUS_FIELDS), 3: 4 + len(BONUS_FIELDS)}
+
+# magic, version, stats, string table size in bytes, list lengths
+_HEADER = struct.Struct(f"<4sB{len(STAT_FIELDS)}qI{len(LIST_FIELDS)}I")
+# Versions 1 and 2: uint16 list lengths
+_HEADER_V2 = struct.Struct(f"<4sB{len(STAT_FIELDS)}qI{len(LIST_FIELDS)}H")
+_get_stats = itemgetter(*STAT_FIELDS)
+
+
+def is_binary(data):
+    """True if data starts with the binary save magic"""
+    return data[:len(MAGIC)] == MAGIC
+
+
+def format_bonus(bonus):
+    """{'strength': 5, 'magic': 2} -> 'strength:5,magic:2'; None -> '-'"""
+    if bonus is None:
+        return "-"
+    return ','.join(f"{stat}:{value}" for stat, value in bonus.items())
+
+
+def parse_bonus(text):
+    """Inverse of format_bonus. Raises ValueError on a malformed bonus"""
+    if text == "-":
+        return None
+    bonus = {}
+    for part in text.split(',') if text else ():
+        stat, _, amount = part.partition(':')
+        bonus[stat.strip()] = int(amount)
+    return bonus
+
+
+def encode(character):
+    """Encode a character dict as binary save bytes"""
+    inventory = character['inventory']
+    if isinstance(inventory, Inventory):
+        stacks = inventory.stacks()
+    else:
+        counts = dict.fromkeys(inventory, 0)
+        for item_id in inventory:
+            counts[item_id] += 1
+        stacks = counts.items()
+    item_ids = [item_id for item_id, _ in stacks]
+    quantities = [quantity for _, quantity in stacks]
+    active = character['active_quests']
+    completed = character['completed_quests']
+    strings = [character['name'], character['class'],
+               character.get('equipped_weapon') or "", character.get('equipped_armor') or "",
+               *(format_bonus(character.get(field)) for field in BONUS_FIELDS),
+               *item_ids, *active, *completed]
+
+    text = SEPARATOR.join(strings)
+    if text.count(SEPARATOR) != len(strings) - 1:
+        raise ValueError("Save strings cannot contain NUL characters")
+    table = text.encode('utf-8')
+
+    try:
+        header = _HEADER.pack(MAGIC, VERSION, *_get_stats(character), len(table),
+                              len(item_ids), len(active), len(completed))
+        counts = struct.pack(f"<{len(quantities)}I", *quantities)
+    except struct.error as e:
+        raise ValueError(f"Character cannot be encoded: {e}") from None
+    return header + table + counts
+
+
+def decode(data):
+    """Decode binary save bytes back into a character dict"""
+    try:
+        if not is_binary(data):
+            raise SaveFileCorruptedError("Not a binary save")
+        version = data[len(MAGIC)]
+        fixed = _FIXED_STRINGS.get(version)
+        if fixed is None:
+            raise SaveFileCorruptedError(f"Unsupported save version: {version}")
+        header = _HEADER if version == VERSION else _HEADER_V2
+        fields = header.unpack_from(data, 0)
+
+        size = fields[9]
+        table = data[header.size:header.size + size]
+        strings = bytes(table).decode('utf-8').split(SEPARATOR)
+        quantities = None
+        if version >= 3:
+            quantities = struct.unpack_from(f"<{fields[10]}I", data, header.size + size)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise SaveFileCorruptedError(f"Corrupted save file: {e}") from None
+
+    inventory, active, completed = fields[10:]
+    if len(table) != size or len(strings) != fixed + inventory + active + completed:
+        raise SaveFileCorruptedError("Corrupted save file: bad string table")
+
+    # Same key order as character_manager.create_character
+    character = {'name': strings[0], 'class': strings[1]}
+    character.update(zip(STAT_FIELDS, fields[2:9]))
+    start = fixed
+    for field, length in zip(LIST_FIELDS, fields[10:]):
+        character[field] = strings[start:start + length]
+        start += length
+    if quantities is not None:
+        character['inventory'] = Inventory.from_stacks(dict(zip(character['inventory'],
+                                                                quantities)))
+    character['equipped_weapon'] = strings[2] or None
+    character['equipped_armor'] = strings[3] or None
+    # Version 1 has no bonus strings: unknown ("-")
+    for field, text in zip(BONUS_FIELDS, strings[4:fixed] or ["-"] * len(BONUS_FIELDS)):
+        character[field] = parse_bonus(text)
+    return character
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3) or sys.argv[1] not in ("text", "binary"):
+        print("usage: python save_format.py text|binary [save directory or .db file]")
+        sys.exit(2)
+
+    import character_manager
+    import save_backends
+
+    backend = save_backends.open_backend(sys.argv[2] if len(sys.argv) == 3 else "data/save_games")
+    try:
+        converted = character_manager.migrate_saves(sys.argv[1], backend=backend)
+    finally:
+        backend.close()
+    print(f"Converted {converted} saves to {sys.argv[1]}")
@@ -0,0 +1,90 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Schema Module
+
+Declarative field registry shared by the text parsers. A schema maps a
+field name to a Field saying how to convert the text value, whether the
+field is required, and which type / values are allowed. The same schema
+drives single-pass block parsing and the validate_* functions.
+"""
+
+from collections import namedtuple
+
+# converter: text -> value      required: raise if missing
+# kind: type(s) a valid value has   choices: allowed values (or None)
+# default: value filled in for a missing optional field
+Field = namedtuple('Field', ['converter', 'required', 'kind', 'choices', 'default'],
+                   defaults=(True, str, None, None))
+
+KIND_NAMES = {int: 'integer', str: 'string', list: 'list'}
+
+
+def build_dispatch(schema):
+    """Map every accepted spelling of a key to (field name, converter, choices).
+    A converter of None means the stripped text is stored as-is.
+    """
+    dispatch = {}
+    for name, spec in schema.items():
+        converter = None if spec.converter is str else spec.converter
+        for key in (name, name.lower(), name.upper()):
+            dispatch[key] = (name, converter, spec.choices)
+    return dispatch
+
+
+def parse_block(lines, schema, dispatch, error, strict=True):
+    """Parse 'KEY: value' lines into a validated dict in one pass.
+    Unknown keys are ignored. Lines without ': ' raise `error` when
+    strict, otherwise they are skipped. Converters may raise ValueError.
+    """
+    record = {}
+
+    for line in lines:
+        key, sep, value = line.partition(": ")
+        if not sep:
+            if strict:
+                raise error(f"Invalid line: {line}")
+            continue
+
+        entry = dispatch.get(key)
+        if entry is None:
+            entry = dispatch.get(key.strip().lower())
+            if entry is None:
+                continue
+
+        name, converter, choices = entry
+        value = value.strip()
+        if converter is not None:
+            value = converter(value)
+        if choices is not None and value not in choices:
+            raise error(f"Invalid {name}: {value}")
+        record[name] = value
+
+    if len(record) < len(schema):
+        for name, spec in schema.items():
+            if name not in record:
+                if spec.required:
+                    raise error(f"Missing field: {name}")
+                record[name] = spec.default
+
+    return record
+
+
+def make_validator(schema, error, type_message="{field} must be {kind}"):
+    """Build a function that checks an already-built dict against schema"""
+    checks = [(name, spec.required, spec.kind, spec.choices) for name, spec in schema.items()]
+
+    def validate(record):
+        for name, required, kind, choices in checks:
+            if name not in record:
+                if required:
+                    raise error(f"Missing field: {name}")
+                continue
+            value = record[name]
+            if kind is not None and not isinstance(value, kind):
+                kind_name = KIND_NAMES.get(kind, getattr(kind, '__name__', str(kind)))
+                raise error(type_message.format(field=name, kind=kind_name))
+            if choices is not None and value not in choices:
+                raise error(f"Invalid {name}: {value}")
+        return True
+
+    return validate
@@ -0,0 +1,142 @@
+"""
+Test Async Character Manager
+Tests the asyncio save/load API
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import async_character_manager as acm
+import save_backends
+from custom_exceptions import CharacterNotFoundError
+
+
+class SlowBackend(save_backends.TextFileBackend):
+    """Text backend whose writes take a random amount of time"""
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.writes = []
+        self.rng = random.Random(7)
+
+    def write(self, name, data, durable=False):
+        time.sleep(self.rng.random() / 500)
+        super().write(name, data, durable)
+        self.writes.append((name, character_manager.deserialize_character(data)['gold']))
+
+
+def test_async_round_trip_and_listing(tmp_path):
+    """Test that async saves load back and list with pagination"""
+    async def scenario():
+        chars = [character_manager.create_character(f"hero{i}", "Mage") for i in range(10)]
+        await asyncio.gather(*(acm.async_save_character(c, str(tmp_path)) for c in chars))
+        names = await acm.async_list_saved_characters(str(tmp_path))
+        loaded = await acm.async_load_character("hero3", str(tmp_path))
+        page = await acm.async_list_saved_characters(str(tmp_path), offset=2, limit=3)
+        return names, loaded, page
+
+    names, loaded, page = asyncio.run(scenario())
+    assert names == sorted(f"hero{i}" for i in range(10))
+    assert loaded == character_manager.create_character("hero3", "Mage")
+    assert page == names[2:5]
+
+
+def test_saves_of_one_character_keep_call_order(tmp_path):
+    """Test that saves of one character reach the disk in call order"""
+    backend = SlowBackend(str(tmp_path))
+
+    async def scenario():
+        char = character_manager.create_character("Ordered", "Rogue")
+        other = character_manager.create_character("Other", "Rogue")
+        tasks = []
+        for gold in range(20):
+            char['gold'] = gold
+            other['gold'] = gold
+            tasks.append(acm.async_save_character(char, backend=backend))
+            tasks.append(acm.async_save_character(other, backend=backend))
+        await asyncio.gather(*tasks)
+        return await acm.async_load_character("Ordered", backend=backend)
+
+    loaded = asyncio.run(scenario())
+    assert loaded['gold'] == 19
+    assert [gold for name, gold in backend.writes if name == "Ordered"] == list(range(20))
+    assert acm._locks == {}
+
+
+def test_saves_awaited_out_of_order_keep_newest(tmp_path):
+    """Test that an older save awaited last never overwrites a newer one"""
+    backend = SlowBackend(str(tmp_path))
+
+    async def scenario():
+        char = character_manager.create_character("Reordered", "Rogue")
+        char['gold'] = 100
+        first = acm.async_save_character(char, backend=backend)
+        char['gold'] = 200
+        second = acm.async_save_character(char, backend=backend)
+        assert await second is True
+        assert await first is True
+        return await acm.async_load_character("Reordered", backend=backend)
+
+    assert asyncio.run(scenario())['gold'] == 200
+    assert backend.writes == [("Reordered", 200)]
+    assert acm._sequences == {}
+
+
+def test_save_order_is_tracked_per_backend(tmp_path):
+    """Test that saves of one name to different directories do not skip each other"""
+    first, second = tmp_path / "first", tmp_path / "second"
+
+    async def scenario():
+        char = character_manager.create_character("Twice", "Mage")
+        to_first = acm.async_save_character(char, str(first))
+        to_second = acm.async_save_character(char, str(second))
+        await to_second
+        await to_first
+
+    asyncio.run(scenario())
+    assert (first / "Twice_save.txt").exists() and (second / "Twice_save.txt").exists()
+    assert acm._sequences == {}
+
+
+def test_async_errors_propagate(tmp_path):
+    """Test that load and delete errors surface from the awaitable"""
+    async def scenario():
+        with pytest.raises(CharacterNotFoundError):
+            await acm.async_load_character("Nobody", str(tmp_path))
+        with pytest.raises(CharacterNotFoundError):
+            await acm.async_delete_character("Nobody", str(tmp_path))
+
+    asyncio.run(scenario())
+
+
+def test_event_loop_keeps_running_during_saves(tmp_path):
+    """Test that slow saves run off the event loop"""
+    backend = SlowBackend(str(tmp_path))
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        char = character_manager.create_character("Busy", "Cleric")
+        await asyncio.gather(*(acm.async_save_character(char, backend=backend) for _ in range(10)))
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(scenario()) > 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
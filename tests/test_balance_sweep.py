@@ -0,0 +1,43 @@
+"""
+Test Balance Sweep
+Tests that parallel sweeps are reproducible and merge into one table
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import balance_sweep
+
+# ============================================================================
+# SWEEP TESTS
+# ============================================================================
+
+def test_sweep_covers_full_grid():
+    """Test that every class x enemy x level cell is present and ordered"""
+    results = balance_sweep.run_sweep(fights=10, levels=range(1, 4), workers=1)
+
+    assert list(results) == balance_sweep.sweep_cells(levels=range(1, 4))
+    assert len(results) == 4 * 3 * 3
+
+def test_sweep_reproducible_across_worker_counts():
+    """Test that results do not depend on how many workers run"""
+    single = balance_sweep.run_sweep(fights=50, levels=range(1, 6), seed=9, workers=1)
+    pooled = balance_sweep.run_sweep(fights=50, levels=range(1, 6), seed=9, workers=3)
+    assert single == pooled
+
+def test_summary_table_rows():
+    """Test that sweep results flatten into printable rows"""
+    results = balance_sweep.run_sweep(fights=20, classes=("Mage",), enemy_types=("orc",),
+                                      levels=(1, 2), workers=1)
+    rows = balance_sweep.summary_table(results)
+
+    assert [(r['class'], r['enemy'], r['level']) for r in rows] == [("Mage", "orc", 1), ("Mage", "orc", 2)]
+    text = balance_sweep.format_summary_table(rows)
+    assert text.count("\n") == 2
+    assert "Mage" in text
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+"""
+Test Battle Simulator
+Tests that headless batch battles follow the SimpleBattle rules
+"""
+
+import pytest
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import battle_simulator
+import combat_system
+from custom_exceptions import AbilityOnCooldownError
+
+# ============================================================================
+# SIMULATOR TESTS
+# ============================================================================
+
+def test_simulation_is_silent_and_does_not_mutate(capsys):
+    """Test that simulations print nothing and leave inputs untouched"""
+    char = battle_simulator.build_character("Warrior", 1)
+    enemy = combat_system.create_enemy("goblin")
+    before = (dict(char), dict(enemy))
+
+    battle_simulator.simulate_many(char, enemy, 200, rng=random.Random(0))
+
+    assert capsys.readouterr().out == ""
+    assert (char, enemy) == before
+
+def test_run_simulations_grid_and_aggregates():
+    """Test that every class x enemy x level cell is summarized"""
+    results = battle_simulator.run_simulations(fights=50, levels=(1, 5), seed=42)
+
+    assert len(results) == 4 * 3 * 2
+    for summary in results.values():
+        assert summary['wins'] + summary['losses'] + summary['escapes'] == 50
+        assert sum(summary['turn_counts'].values()) == 50
+        assert sum(summary['hp_remaining'].values()) == summary['wins']
+        assert 0.0 <= summary['win_rate'] <= 1.0
+
+def test_simulations_are_reproducible_with_seed():
+    """Test that the same seed produces the same results"""
+    first = battle_simulator.run_simulations(fights=100, seed=7)
+    second = battle_simulator.run_simulations(fights=100, seed=7)
+    assert first == second
+
+def test_build_character_matches_level_ups():
+    """Test that build_character applies the same gains as gain_experience"""
+    char = battle_simulator.build_character("Mage", 4)
+    assert char['level'] == 4
+    assert char['max_health'] == 80 + 30
+    assert char['strength'] == 8 + 6
+    assert char['magic'] == 20 + 6
+    assert char['health'] == char['max_health']
+
+def test_policy_cannot_use_special_on_cooldown():
+    """Test that a policy spamming specials hits the SimpleBattle cooldown rule"""
+    char = battle_simulator.build_character("Cleric", 1)
+    enemy = combat_system.create_enemy("dragon")
+
+    with pytest.raises(AbilityOnCooldownError):
+        battle_simulator.simulate_battle(char, enemy, policy=lambda *state: '2')
+
+def test_level_advantage_improves_win_rate():
+    """Test that higher level characters win more often"""
+    results = battle_simulator.run_simulations(
+        fights=500, classes=("Warrior",), enemy_types=("dragon",), levels=(1, 20), seed=3
+    )
+    assert results[("Warrior", "dragon", 20)]['win_rate'] > results[("Warrior", "dragon", 1)]['win_rate']
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
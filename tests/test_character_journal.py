@@ -0,0 +1,194 @@
+"""
+Test Character Journal
+Tests append-only journaling of character changes
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import async_character_manager
+import character_manager
+import character_journal
+import inventory_system
+import quest_handler
+
+QUESTS = {
+    'first_quest': {'quest_id': 'first_quest', 'title': 'First', 'reward_xp': 150,
+                    'reward_gold': 40, 'required_level': 1, 'prerequisite': 'NONE'},
+}
+
+
+@pytest.fixture
+def journal(tmp_path, monkeypatch):
+    monkeypatch.setattr(character_manager, "CHARACTER_CACHE", None)
+    monkeypatch.setattr(character_manager, "SAVE_JOURNAL", None)
+    journal = character_journal.enable_journal(str(tmp_path))
+    yield journal
+    character_journal.disable_journal()
+
+
+def attach_new(journal, tmp_path, name="Journaled"):
+    char = character_manager.create_character(name, "Warrior")
+    return journal.attach(char, str(tmp_path))
+
+
+def test_changes_are_appended_not_saved(journal, tmp_path):
+    """Test that changes append journal lines and leave the save alone"""
+    char = attach_new(journal, tmp_path)
+    save_file = tmp_path / "Journaled_save.txt"
+    before = save_file.read_bytes()
+
+    character_manager.add_gold(char, 25)
+    inventory_system.add_item_to_inventory(char, "health_potion")
+    quest_handler.accept_quest(char, "first_quest", QUESTS)
+
+    assert save_file.read_bytes() == before
+    lines = (tmp_path / "Journaled_journal.log").read_text().splitlines()
+    assert lines[1:] == ['["add","gold",25]', '["append","inventory","health_potion"]',
+                         '["append","active_quests","first_quest"]']
+
+
+def test_load_replays_journal(journal, tmp_path):
+    """Test that loading applies the journal on top of the snapshot"""
+    char = attach_new(journal, tmp_path)
+    character_manager.add_gold(char, 25)
+    inventory_system.add_item_to_inventory(char, "health_potion")
+    inventory_system.add_item_to_inventory(char, "iron_sword")
+    inventory_system.remove_item_from_inventory(char, "health_potion")
+    quest_handler.accept_quest(char, "first_quest", QUESTS)
+    quest_handler.complete_quest(char, "first_quest", QUESTS)
+    char['health'] -= 30
+    char['equipped_armor'] = "leather_armor"
+
+    loaded = character_manager.load_character("Journaled", str(tmp_path))
+    assert loaded == dict(char)
+    assert loaded['level'] == 2 and loaded['gold'] == 165
+    assert loaded['inventory'] == ["iron_sword"]
+    assert loaded['completed_quests'] == ["first_quest"]
+
+
+def test_full_save_restarts_journal(journal, tmp_path):
+    """Test that a full save empties the journal"""
+    char = attach_new(journal, tmp_path)
+    character_manager.add_gold(char, 10)
+    character_manager.save_character(char, str(tmp_path))
+
+    assert (tmp_path / "Journaled_journal.log").read_text().count("\n") == 1
+    character_manager.add_gold(char, 5)
+    assert character_manager.load_character("Journaled", str(tmp_path))['gold'] == 115
+
+
+def test_async_save_restarts_journal(journal, tmp_path):
+    """Test that an async save restarts the journal but keeps later changes"""
+    char = attach_new(journal, tmp_path)
+    character_manager.add_gold(char, 5)
+
+    async def scenario():
+        pending = async_character_manager.async_save_character(char, str(tmp_path))
+        character_manager.add_gold(char, 3)         # after encoding, before the write
+        await pending
+        character_manager.add_gold(char, 7)
+
+    asyncio.run(scenario())
+    assert char['gold'] == 115
+    assert character_manager.load_character("Journaled", str(tmp_path))['gold'] == 115
+
+
+def test_migrate_keeps_journaled_changes(journal, tmp_path):
+    """Test that migrating saves folds journaled changes in"""
+    char = attach_new(journal, tmp_path)
+    character_manager.add_gold(char, 40)
+
+    assert character_manager.migrate_saves("binary", str(tmp_path)) == 1
+    assert character_manager.load_character("Journaled", str(tmp_path))['gold'] == 140
+    character_manager.add_gold(char, 2)
+    assert character_manager.load_character("Journaled", str(tmp_path))['gold'] == 142
+
+
+def test_cache_write_back_restarts_journal(journal, tmp_path):
+    """Test that a cache write-back restarts the journal"""
+    char = attach_new(journal, tmp_path)
+    character_manager.add_gold(char, 20)
+    cache = character_manager.CharacterCache(write_back=True)
+    cache.put(character_manager.get_save_backend(str(tmp_path)), "Journaled", dict(char),
+              dirty=True)
+    cache.flush()
+
+    character_manager.add_gold(char, 1)
+    assert character_manager.load_character("Journaled", str(tmp_path))['gold'] == 121
+
+
+def test_cache_follows_journaled_changes(journal, tmp_path, monkeypatch):
+    """Test that journaled changes update the cached character instead of evicting it"""
+    cache = character_manager.CharacterCache()
+    monkeypatch.setattr(character_manager, "CHARACTER_CACHE", cache)
+    char = attach_new(journal, tmp_path)
+    character_manager.add_gold(char, 25)
+    inventory_system.add_item_to_inventory(char, "health_potion")
+    char['equipped_weapon'] = "iron_sword"
+
+    loaded = character_manager.load_character("Journaled", str(tmp_path))
+    assert loaded == dict(char) and cache.hits == 1
+    cache.invalidate()
+    assert character_manager.load_character("Journaled", str(tmp_path)) == loaded
+
+def test_compaction_every_n_deltas(tmp_path, monkeypatch):
+    """Test that the journal writes a snapshot every compact_every deltas"""
+    monkeypatch.setattr(character_manager, "CHARACTER_CACHE", None)
+    monkeypatch.setattr(character_manager, "SAVE_JOURNAL", None)
+    journal = character_journal.enable_journal(str(tmp_path), compact_every=5)
+    char = attach_new(journal, tmp_path)
+    for _ in range(12):
+        character_manager.add_gold(char, 1)
+
+    assert journal.compactions == 3      # attach + 2
+    assert character_manager.load_character("Journaled", str(tmp_path), backend=None)['gold'] == 112
+    character_journal.disable_journal()
+
+
+def test_stale_journal_is_ignored(journal, tmp_path):
+    """Test that a journal for an older snapshot is not replayed"""
+    char = attach_new(journal, tmp_path)
+    character_manager.add_gold(char, 50)
+
+    # Another writer replaces the save without going through the journal
+    other = character_manager.create_character("Journaled", "Warrior")
+    other['gold'] = 7
+    character_manager.get_save_backend(str(tmp_path)).write(
+        "Journaled", character_manager.encode_character(other))
+
+    assert character_manager.load_character("Journaled", str(tmp_path))['gold'] == 7
+
+
+def test_torn_last_line_is_skipped(journal, tmp_path):
+    """Test that a half-written last line is ignored on replay"""
+    char = attach_new(journal, tmp_path)
+    character_manager.add_gold(char, 5)
+    journal.close()
+    with open(tmp_path / "Journaled_journal.log", "a") as f:
+        f.write('["add","gold",10')
+
+    assert character_manager.load_character("Journaled", str(tmp_path))['gold'] == 105
+
+
+def test_delete_removes_journal(journal, tmp_path):
+    """Test that deleting a character removes its journal"""
+    char = attach_new(journal, tmp_path)
+    character_manager.add_gold(char, 5)
+    character_manager.delete_character("Journaled", str(tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_attach_requires_installed_journal(tmp_path):
+    """Test that attaching to an uninstalled journal fails"""
+    journal = character_journal.CharacterJournal(str(tmp_path))
+    with pytest.raises(ValueError):
+        journal.attach(character_manager.create_character("Loose", "Mage"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
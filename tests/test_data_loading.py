@@ -0,0 +1,286 @@
+"""
+Test Data Loading
+Tests the faster game_data loading paths
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from custom_exceptions import (
+    MissingDataFileError,
+    InvalidDataFormatError,
+    DuplicateDataIdError,
+    CorruptedDataError,
+    ItemNotFoundError
+)
+
+ITEM_BLOCK = """ITEM_ID: {item_id}
+NAME: {name}
+TYPE: consumable
+EFFECT: health:{effect}
+COST: {cost}
+DESCRIPTION: Restores {effect} health points
+"""
+
+
+def write_items(path, *entries):
+    """Write an items file with one block per (item_id, name, effect, cost)"""
+    blocks = [ITEM_BLOCK.format(item_id=i, name=n, effect=e, cost=c) for i, n, e, c in entries]
+    path.write_text("\n".join(blocks))
+    return str(path)
+
+# ============================================================================
+# COMPILED CACHE TESTS
+# ============================================================================
+
+def test_cache_written_and_reused(tmp_path, monkeypatch):
+    """Test that a second load is served from the cache without parsing"""
+    filename = write_items(tmp_path / "items.txt", ("potion", "Potion", 20, 25))
+
+    first = game_data.load_items(filename)
+    assert os.path.exists(filename + game_data.CACHE_SUFFIX)
+
+    def fail(*args):
+        raise AssertionError("cache hit should not reparse")
+
+    monkeypatch.setattr(game_data, "parse_item_block", fail)
+    assert game_data.load_items(filename) == first
+
+def test_cache_rebuilt_when_source_changes(tmp_path):
+    """Test that editing the source invalidates the cache"""
+    filename = write_items(tmp_path / "items.txt", ("potion", "Potion", 20, 25))
+    game_data.load_items(filename)
+
+    write_items(tmp_path / "items.txt", ("potion", "Potion", 20, 30), ("elixir", "Elixir", 5, 50))
+    os.utime(filename, ns=(1, 1))
+
+    items = game_data.load_items(filename)
+    assert set(items) == {"potion", "elixir"}
+    assert items["potion"]["cost"] == 30
+
+def test_corrupt_cache_falls_back_to_parsing(tmp_path):
+    """Test that an unreadable cache is ignored and replaced"""
+    filename = write_items(tmp_path / "items.txt", ("potion", "Potion", 20, 25))
+    (tmp_path / ("items.txt" + game_data.CACHE_SUFFIX)).write_bytes(b"not a pickle")
+
+    assert game_data.load_items(filename)["potion"]["cost"] == 25
+    assert game_data.load_items(filename)["potion"]["cost"] == 25
+
+def test_cache_does_not_hide_missing_source(tmp_path):
+    """Test that a leftover cache never replaces a deleted data file"""
+    filename = write_items(tmp_path / "items.txt", ("potion", "Potion", 20, 25))
+    game_data.load_items(filename)
+    os.remove(filename)
+
+    with pytest.raises(MissingDataFileError):
+        game_data.load_items(filename)
+
+# ============================================================================
+# STREAMING PARSER TESTS
+# ============================================================================
+
+def test_iter_items_yields_blocks_lazily(tmp_path):
+    """Test that iter_items yields validated items one at a time"""
+    filename = write_items(tmp_path / "items.txt", ("a", "A", 1, 10), ("b", "B", 2, 20))
+
+    stream = game_data.iter_items(filename)
+    first = next(stream)
+    assert first["item_id"] == "a" and first["cost"] == 10
+    assert [item["item_id"] for item in stream] == ["b"]
+
+def test_iter_quests_matches_load_quests():
+    """Test that load_quests is built on the streaming iterator"""
+    streamed = {q["quest_id"]: q for q in game_data.iter_quests("data/quests.txt")}
+    assert streamed == game_data.load_quests("data/quests.txt", use_cache=False)
+
+def test_iter_handles_extra_blank_lines(tmp_path):
+    """Test that runs of blank lines and missing trailing newline are fine"""
+    path = tmp_path / "items.txt"
+    path.write_text("\n\n" + ITEM_BLOCK.format(item_id="a", name="A", effect=1, cost=1)
+                    + "\n\n\n" + ITEM_BLOCK.format(item_id="b", name="B", effect=2, cost=2).rstrip())
+
+    assert [item["item_id"] for item in game_data.iter_items(str(path))] == ["a", "b"]
+
+def test_iter_missing_file_raises_immediately(tmp_path):
+    """Test that a missing file fails on the call, not on first iteration"""
+    with pytest.raises(MissingDataFileError):
+        game_data.iter_quests(str(tmp_path / "nope.txt"))
+
+# ============================================================================
+# SCHEMA PARSER TESTS
+# ============================================================================
+
+def test_parse_block_validates_in_one_pass():
+    """Test that parsing converts, normalizes and checks required fields"""
+    item = game_data.parse_item_block([
+        "ITEM_ID: sword", "NAME: Sword", "TYPE: Weapon",
+        "EFFECT: strength:5", "COST: 10", "DESCRIPTION: Sharp", "RARITY: common",
+    ])
+    assert item == {'item_id': 'sword', 'name': 'Sword', 'type': 'weapon',
+                    'effect': 'strength:5', 'cost': 10, 'description': 'Sharp',
+                    'effects': (('strength', 5),)}
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_block(["ITEM_ID: sword", "NAME: Sword"])
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_block(["ITEM_ID: x", "TYPE: trinket"])
+
+def test_generated_validators_check_types_and_choices():
+    """Test that validate_* are driven by the same schema"""
+    quest = {'quest_id': 'q', 'title': 'Q', 'description': 'D', 'reward_xp': '50',
+             'reward_gold': 1, 'required_level': 1, 'prerequisite': 'NONE'}
+    with pytest.raises(InvalidDataFormatError, match="reward_xp must be integer"):
+        game_data.validate_quest_data(quest)
+
+    item = {'item_id': 'i', 'name': 'I', 'type': 'trinket', 'effect': 'health:1',
+            'cost': 1, 'description': 'D'}
+    with pytest.raises(InvalidDataFormatError, match="Invalid type"):
+        game_data.validate_item_data(item)
+
+def test_effects_parsed_at_load():
+    """Test that effects are parsed once and malformed ones rejected at load"""
+    assert game_data.parse_effects("strength:5, magic:-2") == (('strength', 5), ('magic', -2))
+    assert game_data.parse_effects("") == ()
+
+    for effect in ("strength", "strength:lots", "luck:5", "strength:5,"):
+        with pytest.raises(InvalidDataFormatError):
+            game_data.parse_item_block(["ITEM_ID: x", "NAME: X", "TYPE: weapon",
+                                        f"EFFECT: {effect}", "COST: 1", "DESCRIPTION: D"])
+
+    items = game_data.load_items()
+    assert items['health_potion']['effects'] == (('health', 20),)
+
+# ============================================================================
+# DATA PACK TESTS
+# ============================================================================
+
+def make_pack(tmp_path):
+    """Create a pack directory with two expansion files"""
+    pack = tmp_path / "pack"
+    pack.mkdir()
+    write_items(pack / "base.txt", ("a", "A", 1, 10), ("b", "B", 2, 20))
+    write_items(pack / "expansion.txt", ("c", "C", 3, 30))
+    (pack / "notes.md").write_text("ignored")
+    return pack
+
+def test_item_pack_merges_directory(tmp_path):
+    """Test that every .txt file in a directory is merged"""
+    pack = make_pack(tmp_path)
+    items = game_data.load_item_pack(str(pack), workers=1)
+    assert list(items) == ["a", "b", "c"]
+
+def test_item_pack_parallel_matches_serial(tmp_path):
+    """Test that the process pool gives the same result as one worker"""
+    pack = make_pack(tmp_path)
+    pattern = str(pack / "*.txt")
+    assert game_data.load_item_pack(pattern, workers=2) == game_data.load_item_pack(pattern, workers=1)
+
+def test_item_pack_reports_duplicates_with_location(tmp_path):
+    """Test that duplicate IDs name the file and line of both definitions"""
+    pack = make_pack(tmp_path)
+    write_items(pack / "patch.txt", ("x", "X", 1, 1), ("b", "B2", 2, 20))
+
+    with pytest.raises(DuplicateDataIdError) as error:
+        game_data.load_item_pack(str(pack), workers=1)
+    message = str(error.value)
+    assert "patch.txt:8" in message
+    assert "base.txt:8" in message
+
+def test_empty_pack_is_missing(tmp_path):
+    """Test that a pattern matching nothing raises MissingDataFileError"""
+    with pytest.raises(MissingDataFileError):
+        game_data.load_quest_pack(str(tmp_path / "*.txt"))
+
+# ============================================================================
+# LAZY CATALOG TESTS
+# ============================================================================
+
+def test_lazy_catalog_matches_eager_load():
+    """Test that lazy records expose the same data as load_items"""
+    eager = game_data.load_items("data/items.txt", use_cache=False)
+    lazy = game_data.load_items_lazy("data/items.txt")
+
+    assert list(lazy) == list(eager)
+    for item_id, item in eager.items():
+        assert dict(lazy[item_id]) == item
+
+def test_lazy_catalog_defers_cold_fields(tmp_path, monkeypatch):
+    """Test that hot fields never touch the file and cold fields do"""
+    filename = write_items(tmp_path / "items.txt", ("a", "A", 1, 10), ("b", "B", 2, 20))
+    catalog = game_data.load_items_lazy(filename)
+    reads = []
+    original = game_data.LazyCatalog._read_block
+    monkeypatch.setattr(game_data.LazyCatalog, "_read_block",
+                        lambda self, *span: reads.append(span) or original(self, *span))
+
+    assert catalog["b"]["cost"] == 20 and catalog["b"]["type"] == "consumable"
+    assert reads == []
+    assert catalog["b"]["description"] == "Restores 2 health points"
+    assert catalog["b"]["name"] == "B"
+    assert len(reads) == 1
+
+def test_lazy_catalog_works_with_inventory():
+    """Test that inventory functions accept a lazy catalog"""
+    import inventory_system
+    char = {'inventory': [], 'gold': 100}
+    catalog = game_data.load_items_lazy("data/items.txt")
+
+    assert inventory_system.purchase_item(char, "health_potion", catalog) == "Purchased Health Potion"
+    assert char['gold'] == 75
+
+def test_lazy_catalog_survives_source_change(tmp_path):
+    """Test that a changed data file is re-indexed instead of failing mid-purchase"""
+    import inventory_system
+    filename = write_items(tmp_path / "items.txt", ("a", "A", 1, 10), ("b", "B", 2, 20))
+    catalog = game_data.load_items_lazy(filename)
+    with open(filename, "a") as f:
+        f.write("\n")
+    char = {'inventory': [], 'gold': 100}
+
+    assert inventory_system.purchase_item(char, "b", catalog) == "Purchased B"
+    assert char == {'inventory': ["b"], 'gold': 80}
+
+    write_items(tmp_path / "items.txt", ("c", "C", 3, 30), ("b", "B", 7, 20))
+    assert catalog["b"]["description"] == "Restores 7 health points"
+    with pytest.raises(CorruptedDataError):
+        catalog["a"]["description"]
+
+# ============================================================================
+# ITEM CATALOG TESTS
+# ============================================================================
+
+def test_item_catalog_resolves_once():
+    """Test that an ItemCatalog is a read-only mapping with parsed effects"""
+    catalog = game_data.load_item_catalog()
+    assert catalog == game_data.load_items()
+    assert catalog.resolve("iron_sword")['effects'] == (('strength', 5),)
+    with pytest.raises(ItemNotFoundError):
+        catalog.resolve("no_such_item")
+
+    raw = game_data.ItemCatalog({'staff': {'type': 'weapon', 'effect': 'magic:4,strength:1'}})
+    assert raw['staff']['effects'] == (('magic', 4), ('strength', 1))
+    with pytest.raises(InvalidDataFormatError):
+        game_data.ItemCatalog({'bad': {'type': 'weapon', 'effect': 'magic'}})
+
+def test_item_catalog_works_with_inventory():
+    """Test that inventory functions take an ItemCatalog and skip the heuristics"""
+    import inventory_system
+    import character_manager
+    char = character_manager.create_character("CatalogHero", "Warrior")
+    catalog = game_data.load_item_catalog()
+
+    inventory_system.purchase_item(char, "iron_sword", catalog)
+    inventory_system.equip_weapon(char, "iron_sword", catalog)
+    assert character_manager.get_effective_stats(char)['strength'] == 20
+
+    # A catalog never falls back to "looks like a single item"
+    odd = game_data.ItemCatalog({'name': {'type': 'weapon', 'cost': 1, 'effect': ''}})
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.purchase_item(char, "health_potion", odd)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,129 @@
+"""
+Test Data Watcher
+Tests hot reloading of data files
+"""
+
+import pytest
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_watcher
+import game_data
+
+ITEM = """ITEM_ID: potion
+NAME: Potion
+TYPE: consumable
+EFFECT: health:20
+COST: {cost}
+DESCRIPTION: Heals
+"""
+
+
+def write_item(path, cost, mtime_ns):
+    """Write a one-item file and force a distinct mtime"""
+    path.write_text(ITEM.format(cost=cost))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+def load(filename):
+    return game_data.load_items(filename, use_cache=False)
+
+# ============================================================================
+# RELOAD TESTS
+# ============================================================================
+
+def test_check_reloads_only_changed_files(tmp_path):
+    """Test that only the modified file is re-parsed and swapped in"""
+    items = write_item(tmp_path / "items.txt", 25, 10**9)
+    other = write_item(tmp_path / "other.txt", 5, 10**9)
+    watcher = data_watcher.DataWatcher(backend='poll')
+    watcher.watch('items', items, load)
+    watcher.watch('other', other, load)
+    old_other = watcher.get('other')
+
+    assert watcher.check() == []
+
+    write_item(tmp_path / "items.txt", 40, 2 * 10**9)
+    assert watcher.check() == ['items']
+    assert watcher.get('items')['potion']['cost'] == 40
+    assert watcher.get('other') is old_other
+
+def test_callbacks_receive_new_catalog(tmp_path):
+    """Test that reload callbacks fire with the swapped-in catalog"""
+    items = write_item(tmp_path / "items.txt", 25, 10**9)
+    watcher = data_watcher.DataWatcher(backend='poll')
+    watcher.watch('items', items, load)
+    seen = []
+    watcher.on_reload(lambda name, catalog: seen.append((name, catalog['potion']['cost'])))
+
+    write_item(tmp_path / "items.txt", 30, 2 * 10**9)
+    watcher.check()
+    assert seen == [('items', 30)]
+
+def test_broken_file_keeps_last_good_catalog(tmp_path):
+    """Test that a reload that fails to parse never replaces the catalog"""
+    items = write_item(tmp_path / "items.txt", 25, 10**9)
+    watcher = data_watcher.DataWatcher(backend='poll')
+    watcher.watch('items', items, load)
+    good = watcher.get('items')
+
+    (tmp_path / "items.txt").write_text("ITEM_ID: potion\nCOST: lots\n")
+    os.utime(items, ns=(2 * 10**9, 2 * 10**9))
+
+    assert watcher.check() == []
+    assert watcher.get('items') is good
+    assert 'items' in watcher.errors
+
+def test_failing_callback_is_recorded(tmp_path):
+    """Test that a raising callback neither stops other callbacks nor the watcher"""
+    items = write_item(tmp_path / "items.txt", 25, 10**9)
+    watcher = data_watcher.DataWatcher(backend='poll')
+    watcher.watch('items', items, load)
+    seen = []
+    watcher.on_reload(lambda name, catalog: 1 / 0)
+    watcher.on_reload(lambda name, catalog: seen.append(name))
+
+    write_item(tmp_path / "items.txt", 30, 2 * 10**9)
+    assert watcher.check() == ['items']
+    assert seen == ['items']
+    assert isinstance(watcher.errors['items'], ZeroDivisionError)
+
+def test_reload_with_circular_prerequisites_is_rejected(tmp_path):
+    """Test that main's quest loader turns a prerequisite cycle into a reload error"""
+    import main
+    quest = ("QUEST_ID: {0}\nTITLE: {0}\nDESCRIPTION: d\nREWARD_XP: 1\nREWARD_GOLD: 1\n"
+             "REQUIRED_LEVEL: 1\nPREREQUISITE: {1}\n")
+    quests = tmp_path / "quests.txt"
+    quests.write_text(quest.format("a", "NONE"))
+    os.utime(quests, ns=(10**9, 10**9))
+    watcher = data_watcher.DataWatcher(backend='poll')
+    good = watcher.watch('quests', str(quests), main.load_checked_quests)
+
+    quests.write_text(quest.format("a", "b") + "\n" + quest.format("b", "a"))
+    os.utime(quests, ns=(2 * 10**9, 2 * 10**9))
+    assert watcher.check() == []
+    assert watcher.get('quests') is good
+    assert isinstance(watcher.errors['quests'], ValueError)
+
+def test_background_thread_picks_up_changes(tmp_path):
+    """Test that the polling thread reloads without explicit check()"""
+    items = write_item(tmp_path / "items.txt", 25, 10**9)
+    watcher = data_watcher.DataWatcher(interval=0.01, backend='poll')
+    watcher.watch('items', items, load)
+    watcher.start()
+    try:
+        write_item(tmp_path / "items.txt", 99, 2 * 10**9)
+        deadline = time.time() + 5
+        while watcher.get('items')['potion']['cost'] != 99 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
+
+    assert watcher.get('items')['potion']['cost'] == 99
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+"""
+Test Events
+Tests the event bus and the events game modules publish
+"""
+
+import pytest
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+import events
+import inventory_system
+import quest_handler
+
+
+@pytest.fixture
+def received():
+    """Subscribe to every event type; yields the list of received events"""
+    seen = []
+    types = (events.DamageDealt, events.CombatMessage, events.LevelUp,
+             events.ItemUsed, events.QuestCompleted)
+    for event_type in types:
+        events.subscribe(event_type, seen.append)
+    yield seen
+    for event_type in types:
+        events.unsubscribe(event_type, seen.append)
+
+
+def test_subscribe_and_unsubscribe():
+    """Test that subscribers receive events until they unsubscribe"""
+    seen = []
+    assert not events.has_subscribers(events.CombatMessage)
+    events.subscribe(events.CombatMessage, seen.append)
+    assert events.has_subscribers(events.CombatMessage)
+
+    events.publish(events.CombatMessage("hello"))
+    events.publish(events.DamageDealt("a", "b", 1, "ignored"))
+    events.unsubscribe(events.CombatMessage, seen.append)
+    events.publish(events.CombatMessage("not delivered"))
+
+    assert seen == [events.CombatMessage("hello")]
+    assert not events.has_subscribers(events.CombatMessage)
+
+
+def test_battle_turns_publish_instead_of_printing(capsys, received):
+    """Test that battle turns publish events and print nothing"""
+    random.seed(3)
+    char = character_manager.create_character("Fighter", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+    battle = combat_system.SimpleBattle(char, enemy)
+    battle.combat_active = True
+
+    battle.player_turn('1')
+    battle.enemy_turn()
+    battle.player_turn('9')
+
+    assert capsys.readouterr().out == ""
+    hit, taken, invalid = received
+    assert (hit.attacker, hit.target) == ("Fighter", enemy['name'])
+    assert hit.amount == enemy['max_health'] - enemy['health']
+    assert taken.amount == char['max_health'] - char['health']
+    assert invalid == events.CombatMessage("Invalid action.")
+    assert [e.message for e in received] == battle.battle_log
+
+
+def test_special_ability_events(received):
+    """Test that special abilities publish their result"""
+    random.seed(1)
+    cleric = character_manager.create_character("Healer", "Cleric")
+    mage = character_manager.create_character("Caster", "Mage")
+    for char in (cleric, mage):
+        battle = combat_system.SimpleBattle(char, combat_system.create_enemy("goblin"))
+        battle.combat_active = True
+        battle.player_turn('2')
+
+    assert isinstance(received[0], events.CombatMessage)
+    assert isinstance(received[1], events.DamageDealt) and received[1].amount > 0
+
+
+def test_items_quests_and_levels_publish(received):
+    """Test that item use, quests and level ups publish events"""
+    char = character_manager.create_character("Quester", "Rogue")
+    char['health'] = 10
+    inventory_system.add_item_to_inventory(char, "health_potion")
+    inventory_system.use_item(char, "health_potion",
+                              {'health_potion': {'name': 'Potion', 'type': 'consumable',
+                                                 'effect': 'health:20', 'cost': 25}})
+    quests = {'q': {'title': 'Q', 'reward_xp': 100, 'reward_gold': 5,
+                    'required_level': 1, 'prerequisite': 'NONE'}}
+    quest_handler.accept_quest(char, 'q', quests)
+    quest_handler.complete_quest(char, 'q', quests)
+
+    item_used, level_up, quest_done = received
+    assert item_used == events.ItemUsed(char, "health_potion", "Used Potion")
+    assert (level_up.old_level, level_up.new_level) == (1, 2)
+    assert (quest_done.quest_id, quest_done.reward_xp, quest_done.reward_gold) == ('q', 100, 5)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
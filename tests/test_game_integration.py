@@ -3,6 +3,7 @@ Test Game Integration
 Tests that modules work together correctly
 """
 
+import copy
 import pytest
 import sys
 import os
@@ -14,6 +15,15 @@ import inventory_system
 import quest_handler
 import combat_system
 import game_data
+import autosave
+import records
+from custom_exceptions import (
+    InsufficientResourcesError,
+    InvalidItemTypeError,
+    InventoryError,
+    InventoryFullError,
+    ItemNotFoundError
+)
 
 # ============================================================================
 # CHARACTER INTEGRATION TESTS
@@ -100,10 +110,121 @@ def test_equipment_system():
     
     inventory_system.equip_weapon(char, "iron_sword", weapon_data)
     
-    assert char['strength'] == original_strength + 5
+    # The bonus is kept apart from the base stat
+    assert character_manager.get_effective_stats(char)['strength'] == original_strength + 5
+    assert char['strength'] == original_strength
     assert 'equipped_weapon' in char
     assert char['equipped_weapon'] == "iron_sword"
 
+def test_equipment_with_multiple_effects():
+    """Test that every parsed effect is applied on equip and removed on unequip"""
+    char = character_manager.create_character("MultiEquip", "Mage")
+    before = dict(char)
+    items = {
+        'staff': {'type': 'weapon', 'effect': 'magic:6,max_health:10',
+                  'effects': (('magic', 6), ('max_health', 10))},
+        'wand': {'type': 'weapon', 'effect': 'magic:2,strength:1'},
+    }
+    inventory_system.add_item_to_inventory(char, 'staff')
+    inventory_system.add_item_to_inventory(char, 'wand')
+
+    inventory_system.equip_weapon(char, 'staff', items)
+    stats = character_manager.get_effective_stats(char)
+    assert stats['magic'] == before['magic'] + 6
+    assert stats['max_health'] == before['max_health'] + 10
+
+    inventory_system.equip_weapon(char, 'wand', items)
+    stats = character_manager.get_effective_stats(char)
+    assert stats['magic'] == before['magic'] + 2
+    assert stats['strength'] == before['strength'] + 1
+    assert stats['max_health'] == before['max_health']
+
+    inventory_system.unequip_weapon(char, items)
+    assert character_manager.get_effective_stats(char) == {
+        stat: before[stat] for stat in ('max_health', 'strength', 'magic')}
+    assert (char['magic'], char['strength']) == (before['magic'], before['strength'])
+
+def test_effective_stats_cached_until_equipment_or_level_changes():
+    """Test that effective stats are computed once and refreshed on equip,
+    unequip and level up, and that damage rolls use them"""
+    char = autosave.TrackedCharacter(character_manager.create_character("Cached", "Warrior"))
+    items = {'axe': {'type': 'weapon', 'effect': 'strength:30'}}
+    stats = character_manager.get_effective_stats(char)
+    assert character_manager.get_effective_stats(char) is stats
+
+    inventory_system.add_item_to_inventory(char, 'axe')
+    inventory_system.equip_weapon(char, 'axe', items)
+    assert character_manager.get_effective_stats(char)['strength'] == 45
+    battle = combat_system.SimpleBattle(char, combat_system.create_enemy("goblin"))
+    assert battle.calculate_damage(char, battle.enemy) >= int(45 * 0.8)
+
+    character_manager.gain_experience(char, 100)
+    assert character_manager.get_effective_stats(char)['strength'] == 47
+    assert char['health'] == char['max_health'] == 130
+
+    inventory_system.unequip_weapon(char, items)
+    assert character_manager.get_effective_stats(char)['strength'] == char['strength'] == 17
+
+def test_created_and_loaded_characters_cache_effective_stats(tmp_path):
+    """Test that the plain character dicts the game uses keep the cache"""
+    char = character_manager.create_character("Plain", "Mage")
+    stats = character_manager.get_effective_stats(char)
+    assert character_manager.get_effective_stats(char) is stats
+    assert char == dict(char) and type(char) is not dict
+
+    character_manager.save_character(char, str(tmp_path))
+    loaded = character_manager.load_character("Plain", str(tmp_path))
+    assert character_manager.get_effective_stats(loaded) is character_manager.get_effective_stats(loaded)
+    enemy = combat_system.create_enemy("orc")
+    assert character_manager.get_effective_stats(enemy) is character_manager.get_effective_stats(enemy)
+
+    assert combat_system.damage_range(loaded) == (16, 24)
+    character_manager.gain_experience(loaded, 100)
+    assert combat_system.damage_range(loaded) == (17, 26)
+
+def test_writing_stats_clears_cached_effective_stats():
+    """Test that direct writes, copies and tracked characters never see stale stats"""
+    assert records.CACHE_KEYS == set(character_manager.EFFECTIVE_STATS
+                                     + character_manager.BONUS_FIELDS + ('level',))
+    char = character_manager.create_character("Direct", "Warrior")
+    assert combat_system.damage_range(char) == (12, 18)
+    char['strength'] = 100
+    assert character_manager.get_effective_stats(char)['strength'] == 100
+    assert combat_system.damage_range(char) == (80, 120)
+    char['weapon_bonus'] = {'strength': 10}
+    assert character_manager.get_effective_stats(char)['strength'] == 110
+    char.update(strength=50)
+    assert combat_system.damage_range(char) == (48, 72)
+
+    copied = copy.copy(char)
+    copied['strength'] = 1
+    assert character_manager.get_effective_stats(char)['strength'] == 60
+    assert character_manager.get_effective_stats(copied)['strength'] == 11
+
+    tracked = autosave.TrackedCharacter(char)
+    character_manager.get_effective_stats(tracked)
+    del tracked['weapon_bonus']
+    assert character_manager.get_effective_stats(tracked)['strength'] == 50
+
+def test_unequip_item_from_old_save_removes_baked_in_bonus():
+    """Test that items equipped before bonuses were stored still come off"""
+    char = character_manager.create_character("OldSave", "Rogue")
+    char.update(strength=char['strength'] + 5, equipped_weapon='iron_sword',
+                weapon_bonus=None)
+    inventory_system.unequip_weapon(char, {'iron_sword': {'type': 'weapon',
+                                                          'effect': 'strength:5'}})
+    assert char['strength'] == 12 and char['weapon_bonus'] == {}
+    assert 'iron_sword' in char['inventory']
+
+def test_malformed_effect_rejected_before_equip():
+    """Test that a raw item with a bad effect leaves the character untouched"""
+    char = character_manager.create_character("BadEquip", "Rogue")
+    inventory_system.add_item_to_inventory(char, 'cursed')
+    before = dict(char, inventory=list(char['inventory']))
+    with pytest.raises(InvalidItemTypeError):
+        inventory_system.equip_weapon(char, 'cursed', {'type': 'weapon', 'effect': 'luck:9'})
+    assert char == before
+
 def test_shop_system():
     """Test buying and selling items"""
     char = character_manager.create_character("ShopTest", "Mage")
@@ -123,6 +244,66 @@ def test_shop_system():
     assert gold_received == 12  # Half of cost (25 // 2)
     assert "health_potion" not in char['inventory']
 
+SHOP_ITEMS = {
+    'health_potion': {'type': 'consumable', 'cost': 25, 'effect': 'health:20'},
+    'iron_sword': {'type': 'weapon', 'cost': 50, 'effect': 'strength:5'},
+    'pebble': {'type': 'consumable', 'cost': 0, 'effect': ''},
+}
+
+def test_transaction_applies_batch():
+    """Test buying, selling and using several items in one transaction"""
+    char = character_manager.create_character("Trader", "Warrior")
+    char['health'] = 50
+
+    change = inventory_system.apply_transaction(char, [
+        ('buy', 'health_potion', 2), ('buy', 'iron_sword'),
+        ('use', 'health_potion'), ('sell', 'iron_sword'),
+    ], SHOP_ITEMS)
+
+    assert change == -25 * 2 - 50 + 25
+    assert char['gold'] == 100 + change
+    assert char['inventory'] == ['health_potion']
+    assert char['health'] == 70
+
+def test_transaction_checks_everything_first():
+    """Test that a failing operation anywhere in the batch changes nothing"""
+    char = character_manager.create_character("Checker", "Mage")
+    inventory_system.add_item_to_inventory(char, 'iron_sword')
+    before = dict(char, inventory=list(char['inventory']))
+
+    failing = [
+        ([('buy', 'health_potion'), ('buy', 'iron_sword', 2)], InsufficientResourcesError),
+        ([('sell', 'iron_sword'), ('sell', 'iron_sword')], ItemNotFoundError),
+        ([('buy', 'pebble', inventory_system.MAX_INVENTORY_SIZE)], InventoryFullError),
+        ([('buy', 'health_potion'), ('use', 'iron_sword')], InvalidItemTypeError),
+        ([('buy', 'pebble'), ('use', 'pebble')], InvalidItemTypeError),
+        ([('steal', 'iron_sword')], InventoryError),
+    ]
+    for operations, error in failing:
+        with pytest.raises(error):
+            inventory_system.apply_transaction(char, operations, SHOP_ITEMS)
+        assert char == before
+
+def test_transaction_rolls_back_midway(monkeypatch):
+    """Test that an error while applying restores inventory and stats"""
+    char = character_manager.create_character("Rollback", "Cleric")
+    char['health'] = 40
+    before = dict(char, inventory=list(char['inventory']))
+    calls = []
+
+    def flaky_use(character, effects):
+        calls.append(effects)
+        if len(calls) == 2:
+            raise InventoryError("potion shattered")
+        original_use(character, effects)
+
+    original_use = inventory_system._apply_use
+    monkeypatch.setattr(inventory_system, '_apply_use', flaky_use)
+    with pytest.raises(InventoryError):
+        inventory_system.apply_transaction(
+            char, [('buy', 'health_potion', 2), ('use', 'health_potion', 2)], SHOP_ITEMS)
+    assert char == before
+
 # ============================================================================
 # QUEST INTEGRATION TESTS
 # ============================================================================
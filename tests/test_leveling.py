@@ -0,0 +1,80 @@
+"""
+Test Leveling
+Tests closed-form level ups and level-up notifications
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import events
+
+
+def step_by_step(character, xp_amount):
+    """gain_experience as it was: one loop iteration per level"""
+    character['experience'] += xp_amount
+    while character['experience'] >= character['level'] * 100:
+        character['experience'] -= character['level'] * 100
+        character['level'] += 1
+        character['max_health'] += 10
+        character['strength'] += 2
+        character['magic'] += 2
+        character['health'] = character['max_health']
+
+
+@pytest.mark.parametrize("start_level", [1, 2, 7, 40])
+@pytest.mark.parametrize("xp", [0, 99, 100, 299, 300, 1000, 12345, 999999])
+def test_matches_step_by_step_leveling(start_level, xp):
+    """Test that bulk leveling matches one level at a time"""
+    expected = character_manager.create_character("Step", "Rogue")
+    expected['level'] = start_level
+    expected['experience'] = 50
+    expected['health'] = 1
+    actual = dict(expected)
+
+    step_by_step(expected, xp)
+    assert character_manager.gain_experience(actual, xp) == expected['level']
+    assert actual == expected
+
+
+def test_levels_gained_boundaries():
+    """Test levels_gained exactly at and around XP thresholds"""
+    assert character_manager.levels_gained(1, 99) == (0, 0)
+    assert character_manager.levels_gained(1, 100) == (1, 100)
+    assert character_manager.levels_gained(1, 299) == (1, 100)
+    assert character_manager.levels_gained(1, 300) == (2, 300)
+    assert character_manager.levels_gained(5, -10) == (0, 0)
+
+
+def test_massive_grant_is_exact():
+    """Test that a huge XP grant lands on the exact level"""
+    char = character_manager.create_character("Admin", "Cleric")
+    character_manager.gain_experience(char, 10 ** 15)
+
+    level = char['level']
+    assert char['experience'] < level * 100
+    # Total spent on levels 1..level-1 plus the remainder is the grant
+    assert 100 * (level - 1) * level // 2 + char['experience'] == 10 ** 15
+
+
+def test_level_up_event_published_once_per_grant(capsys):
+    """Test that one XP grant publishes a single LevelUp"""
+    calls = []
+    listener = lambda event: calls.append((event.character['name'], event.old_level, event.new_level))
+    events.subscribe(events.LevelUp, listener)
+    try:
+        char = character_manager.create_character("Listened", "Mage")
+        character_manager.gain_experience(char, 50)
+        character_manager.gain_experience(char, 1000)
+    finally:
+        events.unsubscribe(events.LevelUp, listener)
+
+    assert calls == [("Listened", 1, 5)]
+    assert capsys.readouterr().out == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,149 @@
+"""
+Test Records
+Tests that compact slot records work anywhere a dict does
+"""
+
+import json
+import pytest
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import records
+import character_manager
+import combat_system
+import inventory_system
+import quest_handler
+
+# ============================================================================
+# RECORD TESTS
+# ============================================================================
+
+def test_record_behaves_like_dict():
+    """Test mapping access, missing keys, extras and equality"""
+    data = character_manager.create_character("Slots", "Rogue")
+    char = records.Character(data)
+
+    assert char == data and data == char
+    assert char['class'] == "Rogue"
+    assert not hasattr(char, '__dict__')
+
+    del char['equipped_armor']
+    assert 'equipped_armor' not in char
+    assert char.get('equipped_armor', 'none') == 'none'
+    with pytest.raises(KeyError):
+        char['equipped_armor']
+
+    char['title'] = "the Quick"
+    assert char['title'] == "the Quick"
+    assert 'title' in list(char)
+
+def test_character_record_with_game_modules():
+    """Test that inventory, quests and save/load accept a Character record"""
+    char = records.Character(character_manager.create_character("SlotsHero", "Warrior"))
+    item = records.Item(item_id='health_potion', name='Health Potion', type='consumable',
+                        effect='health:20', cost=25, description='Heals')
+    quest = records.Quest(quest_id='q', title='Q', description='D', reward_xp=100,
+                          reward_gold=5, required_level=1, prerequisite='NONE')
+
+    inventory_system.purchase_item(char, 'health_potion', {'health_potion': item})
+    assert char['inventory'] == ['health_potion'] and char['gold'] == 75
+
+    quest_handler.accept_quest(char, 'q', {'q': quest})
+    quest_handler.complete_quest(char, 'q', {'q': quest})
+    assert char['level'] == 2
+
+    character_manager.save_character(char)
+    try:
+        assert character_manager.load_character("SlotsHero") == char
+    finally:
+        character_manager.delete_character("SlotsHero")
+
+def test_simple_battle_with_records(capsys):
+    """Test that SimpleBattle runs with record characters and enemies"""
+    random.seed(0)
+    char = records.Character(character_manager.create_character("SlotsFighter", "Mage"))
+    enemy = records.Enemy(combat_system.create_enemy("goblin"))
+    battle = combat_system.SimpleBattle(char, enemy)
+    battle.combat_active = True
+
+    battle.player_turn('1')
+    battle.enemy_turn()
+    assert enemy['health'] < enemy['max_health']
+    assert char['health'] < char['max_health']
+
+# ============================================================================
+# INVENTORY TESTS
+# ============================================================================
+
+def test_inventory_stacks_and_list_view():
+    """Test counts, removal and that the inventory still reads as a list"""
+    inv = records.Inventory(['health_potion', 'iron_sword', 'health_potion'])
+
+    assert len(inv) == 3 and inv.count('health_potion') == 2
+    assert 'iron_sword' in inv and 'mana_potion' not in inv
+    assert inv == ['health_potion', 'health_potion', 'iron_sword']
+    assert dict(inv.stacks()) == {'health_potion': 2, 'iron_sword': 1}
+    assert inv[-1] == 'iron_sword' and ','.join(inv) == "health_potion,health_potion,iron_sword"
+
+    inv.remove('health_potion')
+    inv.remove('iron_sword')
+    assert inv == ['health_potion'] and 'iron_sword' not in inv
+    with pytest.raises(ValueError):
+        inv.remove('iron_sword')
+
+    copy = inv.copy()
+    copy.add('mana_potion', 3)
+    assert len(copy) == 4 and len(inv) == 1
+
+def test_inventory_list_compatibility():
+    """Test that the inventory compares, sorts and inserts like the list it replaces"""
+    items = ['b', 'a', 'b', 'c']
+    inv = records.Inventory(items)
+
+    assert inv == items and items == inv and tuple(items) == inv
+    assert inv != ['a', 'b', 'c'] and inv != ['a', 'b', 'c', 'c']
+    inv.sort()
+    assert list(inv) == sorted(items)
+    inv.sort(reverse=True)
+    assert list(inv) == sorted(items, reverse=True)
+
+    inv.insert(len(inv), 'd')
+    assert inv.count('d') == 1
+    with pytest.raises(TypeError):
+        inv.insert(0, 'e')
+    inv[0] = 'e'
+    assert 'c' not in inv and inv.count('e') == 1
+    assert json.dumps(list(inv))
+
+def test_inventory_with_inventory_system():
+    """Test that new and loaded characters get an Inventory the game modules use"""
+    char = character_manager.create_character("StackHero", "Warrior")
+    assert isinstance(char['inventory'], records.Inventory)
+
+    for _ in range(3):
+        inventory_system.add_item_to_inventory(char, 'health_potion')
+    assert inventory_system.count_item(char, 'health_potion') == 3
+    assert inventory_system.get_inventory_space_remaining(char) == \
+        inventory_system.MAX_INVENTORY_SIZE - 3
+    character_manager.validate_character_data(char)
+
+    character_manager.save_character(char)
+    try:
+        loaded = character_manager.load_character("StackHero")
+        assert isinstance(loaded['inventory'], records.Inventory)
+        assert loaded == char
+    finally:
+        character_manager.delete_character("StackHero")
+
+def test_inventory_display_shows_stacks(capsys):
+    """Test that display_inventory prints one line per stack"""
+    char = character_manager.create_character("StackShow", "Mage")
+    char['inventory'].add('health_potion', 5)
+    inventory_system.display_inventory(char, {'health_potion': {'name': 'Health Potion'}})
+    assert "Health Potion x5" in capsys.readouterr().out
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,507 @@
+"""
+Test Save System
+Tests crash safety and performance features of character saving
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import autosave
+import save_backends
+import save_format
+from records import Inventory
+from custom_exceptions import *
+
+
+class CrashingFile:
+    """File wrapper that writes half of the data and then fails"""
+
+    def __init__(self, f):
+        self.f = f
+
+    def write(self, data):
+        self.f.write(data[:len(data) // 2])
+        self.f.flush()
+        raise OSError("simulated crash mid-write")
+
+    def __getattr__(self, name):
+        return getattr(self.f, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.f.close()
+
+# ============================================================================
+# ATOMIC SAVE TESTS
+# ============================================================================
+
+def test_save_round_trip_and_no_temp_files(tmp_path):
+    """Test that a save writes exactly one complete file"""
+    char = character_manager.create_character("Atomic", "Cleric")
+    char['inventory'] = ['health_potion', 'iron_sword']
+
+    assert character_manager.save_character(char, str(tmp_path), durable=True)
+    assert os.listdir(tmp_path) == ["Atomic_save.txt"]
+    assert character_manager.load_character("Atomic", str(tmp_path)) == char
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_save_files_get_normal_permissions(tmp_path):
+    """Test that saves get umask permissions, and keep a mode set on them"""
+    char = character_manager.create_character("Perms", "Mage")
+    path = tmp_path / "Perms_save.txt"
+    character_manager.save_character(char, str(tmp_path))
+    assert path.stat().st_mode & 0o777 == 0o666 & ~save_backends._UMASK
+
+    os.chmod(path, 0o640)
+    character_manager.save_character(char, str(tmp_path))
+    assert path.stat().st_mode & 0o777 == 0o640
+
+def test_crash_mid_write_keeps_previous_save(tmp_path, monkeypatch):
+    """Test that a failed write never leaves a truncated save behind"""
+    char = character_manager.create_character("Crashy", "Rogue")
+    character_manager.save_character(char, str(tmp_path))
+    before = (tmp_path / "Crashy_save.txt").read_text()
+
+    real_fdopen = os.fdopen
+    monkeypatch.setattr(os, "fdopen", lambda *a, **k: CrashingFile(real_fdopen(*a, **k)))
+    char['gold'] = 999999
+    with pytest.raises(OSError):
+        character_manager.save_character(char, str(tmp_path))
+    monkeypatch.undo()
+
+    assert (tmp_path / "Crashy_save.txt").read_text() == before
+    assert os.listdir(tmp_path) == ["Crashy_save.txt"]
+    assert character_manager.load_character("Crashy", str(tmp_path))['gold'] == 100
+
+def test_crash_before_rename_keeps_previous_save(tmp_path, monkeypatch):
+    """Test that dying between write and rename keeps the old save"""
+    char = character_manager.create_character("Renamer", "Mage")
+    character_manager.save_character(char, str(tmp_path))
+
+    def crash(*args):
+        raise OSError("simulated crash before rename")
+
+    monkeypatch.setattr(os, "replace", crash)
+    char['level'] = 50
+    with pytest.raises(OSError):
+        character_manager.save_character(char, str(tmp_path))
+    monkeypatch.undo()
+
+    assert character_manager.load_character("Renamer", str(tmp_path))['level'] == 1
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["Renamer"]
+
+# ============================================================================
+# WRITE-BEHIND AUTOSAVE TESTS
+# ============================================================================
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_saver(tmp_path, **kwargs):
+    return autosave.WriteBehindSaver(save_directory=str(tmp_path), **kwargs)
+
+
+def test_reads_do_not_mark_character_dirty():
+    """Test that reading fields leaves a tracked character clean"""
+    char = autosave.TrackedCharacter(character_manager.create_character("Reader", "Mage"))
+    _ = char['gold'], char.get('inventory'), list(char['active_quests'])
+    char['gold'] = char['gold']
+    assert not char.dirty
+
+
+def test_field_and_list_mutations_mark_dirty():
+    """Test that field and list changes mark the character dirty"""
+    char = autosave.TrackedCharacter(character_manager.create_character("Writer", "Mage"))
+    char['inventory'].append("health_potion")
+    assert char.dirty
+
+    char.dirty = False
+    char['gold'] += 10
+    assert char.dirty
+
+    char.dirty = False
+    char['active_quests'] = ["q1"]
+    char['active_quests'].remove("q1")
+    assert char.dirty and char['active_quests'] == []
+
+
+def test_saver_skips_clean_characters(tmp_path):
+    """Test that the saver only writes dirty characters"""
+    saver = make_saver(tmp_path)
+    char = saver.track(character_manager.create_character("Idle", "Rogue"), dirty=True)
+
+    assert saver.save(char) is True
+    for _ in range(5):
+        assert saver.save(char) is False
+    assert saver.stats() == {'performed': 1, 'skipped': 5, 'pending': 0}
+    assert character_manager.load_character("Idle", str(tmp_path))['name'] == "Idle"
+
+
+def test_saver_coalesces_writes_within_interval(tmp_path):
+    """Test that saves within the interval are coalesced"""
+    clock = FakeClock()
+    saver = make_saver(tmp_path, interval=5.0, clock=clock)
+    char = saver.track(character_manager.create_character("Busy", "Warrior"), dirty=True)
+    saver.save(char)
+
+    for gold in range(1, 11):
+        clock.now += 0.1
+        char['gold'] = gold
+        saver.save(char)
+    assert saver.writes_performed == 1
+    assert character_manager.load_character("Busy", str(tmp_path))['gold'] == 100
+
+    clock.now += 5.0
+    char['gold'] = 11
+    assert saver.save(char) is True
+    assert character_manager.load_character("Busy", str(tmp_path))['gold'] == 11
+
+
+def test_force_and_flush_write_pending_changes(tmp_path):
+    """Test that force and flush write pending changes"""
+    clock = FakeClock()
+    saver = make_saver(tmp_path, interval=60.0, clock=clock)
+    char = saver.track(character_manager.create_character("Quitter", "Cleric"), dirty=True)
+    saver.save(char)
+
+    char['inventory'].append("iron_sword")
+    assert saver.save(char) is False
+    assert saver.flush() == 1
+    assert character_manager.load_character("Quitter", str(tmp_path))['inventory'] == ["iron_sword"]
+
+    char['level'] = 2
+    assert saver.save(char, force=True) is True
+    assert character_manager.load_character("Quitter", str(tmp_path))['level'] == 2
+    assert saver.flush() == 0
+
+
+def test_failed_save_keeps_character_dirty(tmp_path):
+    """Test that a failed save leaves the character pending"""
+    calls = []
+
+    def failing_save(character, **kwargs):
+        calls.append(character['name'])
+        raise OSError("disk full")
+
+    saver = autosave.WriteBehindSaver(save=failing_save)
+    char = saver.track(character_manager.create_character("Unlucky", "Mage"), dirty=True)
+    with pytest.raises(OSError):
+        saver.save(char)
+    assert char.dirty
+    assert saver.stats()['pending'] == 1
+
+# ============================================================================
+# SAVE BACKEND TESTS
+# ============================================================================
+
+@pytest.fixture(params=["text", "sqlite"])
+def backend(request, tmp_path):
+    if request.param == "text":
+        store = save_backends.TextFileBackend(str(tmp_path / "saves"))
+    else:
+        store = save_backends.SQLiteBackend(str(tmp_path / "saves.db"))
+    yield store
+    store.close()
+
+
+def test_backend_round_trip_and_delete(backend):
+    """Test that a backend saves, loads and deletes a character"""
+    char = character_manager.create_character("Stored", "Rogue")
+    char['inventory'] = ['health_potion']
+    character_manager.save_character(char, backend=backend)
+
+    assert character_manager.load_character("Stored", backend=backend) == char
+    assert character_manager.delete_character("Stored", backend=backend)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("Stored", backend=backend)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.delete_character("Stored", backend=backend)
+
+
+def test_backend_overwrite_keeps_one_entry(backend):
+    """Test that saving again replaces the stored entry"""
+    char = character_manager.create_character("Again", "Mage")
+    character_manager.save_character(char, backend=backend)
+    char['gold'] = 5
+    character_manager.save_character(char, backend=backend, durable=True)
+
+    assert backend.count() == 1
+    assert character_manager.load_character("Again", backend=backend)['gold'] == 5
+
+
+def test_paginated_listing(backend):
+    """Test that listings are sorted and paginate"""
+    names = [f"hero{i:03d}" for i in range(25)]
+    for name in reversed(names):
+        character_manager.save_character(character_manager.create_character(name, "Cleric"),
+                                         backend=backend)
+
+    assert character_manager.list_saved_characters(backend=backend) == names
+    assert character_manager.list_saved_characters(offset=10, limit=5, backend=backend) == names[10:15]
+    assert backend.names(limit=3, after="hero020") == names[21:24]
+    assert character_manager.list_saved_characters(offset=30, backend=backend) == []
+
+
+def test_corrupted_payload_raises(backend):
+    """Test that an unparseable save raises SaveFileCorruptedError"""
+    backend.write("Broken", b"NAME: Broken\nLEVEL: abc\n")
+    with pytest.raises(SaveFileCorruptedError):
+        character_manager.load_character("Broken", backend=backend)
+
+
+def test_module_backend_setting(tmp_path, monkeypatch):
+    """Test that SAVE_BACKEND replaces the text files"""
+    store = save_backends.SQLiteBackend(str(tmp_path / "global.db"))
+    monkeypatch.setattr(character_manager, "SAVE_BACKEND", store)
+    character_manager.save_character(character_manager.create_character("Global", "Warrior"))
+
+    assert character_manager.list_saved_characters() == ["Global"]
+    assert not os.path.exists(tmp_path / "Global_save.txt")
+    store.close()
+
+
+def test_copy_saves_between_backends(tmp_path):
+    """Test that saves copy from text files into sqlite"""
+    text = save_backends.TextFileBackend(str(tmp_path / "saves"))
+    for name in ("Ann", "Bob", "Cid"):
+        character_manager.save_character(character_manager.create_character(name, "Mage"),
+                                         backend=text)
+
+    with save_backends.SQLiteBackend(str(tmp_path / "saves.db")) as db:
+        assert save_backends.copy_saves(text, db, batch_size=2) == 3
+        assert db.names() == ["Ann", "Bob", "Cid"]
+        assert character_manager.load_character("Bob", backend=db)['class'] == "Mage"
+
+# ============================================================================
+# BINARY SAVE FORMAT TESTS
+# ============================================================================
+
+def make_hero():
+    char = character_manager.create_character("Hero", "Warrior")
+    char.update(level=12, experience=345, gold=10 ** 10, equipped_weapon="iron_sword",
+                weapon_bonus={'strength': 5, 'max_health': 10}, armor_bonus=None)
+    char['inventory'] = ['health_potion', 'health_potion', 'odd,item']
+    char['completed_quests'] = ['first_quest']
+    return char
+
+
+def test_binary_round_trip():
+    """Test that a binary save decodes to the same character"""
+    char = make_hero()
+    data = save_format.encode(char)
+
+    assert save_format.is_binary(data)
+    assert save_format.decode(data) == char
+    assert list(save_format.decode(data)) == list(char)
+    assert len(data) < len(character_manager.serialize_character(char).encode())
+
+
+def test_binary_rejects_corruption():
+    """Test that truncated or unknown-version binary saves are rejected"""
+    data = save_format.encode(make_hero())
+    with pytest.raises(SaveFileCorruptedError):
+        save_format.decode(data[:-3])
+    with pytest.raises(SaveFileCorruptedError):
+        save_format.decode(data[:4] + bytes([99]) + data[5:])
+
+
+def test_version_1_binary_save_loads_with_unknown_bonuses():
+    """Test that version 1 binary saves load with unknown bonuses"""
+    char = make_hero()
+    strings = [char['name'], char['class'], "iron_sword", "", *char['inventory'],
+               *char['completed_quests']]
+    table = "\0".join(strings).encode()
+    data = save_format._HEADER_V2.pack(save_format.MAGIC, 1, *save_format._get_stats(char),
+                                       len(table), 3, 0, 1) + table
+
+    loaded = save_format.decode(data)
+    assert loaded['weapon_bonus'] is None and loaded['armor_bonus'] is None
+    assert loaded['inventory'] == char['inventory'] and loaded['level'] == 12
+
+
+def test_version_2_binary_save_loads():
+    """Test that version 2 binary saves still load"""
+    char = make_hero()
+    strings = [char['name'], char['class'], "iron_sword", "", "strength:5,max_health:10", "-",
+               *char['inventory'], *char['completed_quests']]
+    table = "\0".join(strings).encode()
+    data = save_format._HEADER_V2.pack(save_format.MAGIC, 2, *save_format._get_stats(char),
+                                       len(table), 3, 0, 1) + table
+
+    assert character_manager.deserialize_character(data) == char
+
+
+def test_binary_round_trips_large_inventory():
+    """Test that binary saves hold more than 65,535 entries"""
+    char = make_hero()
+    char['inventory'] = Inventory.from_stacks({'health_potion': 70_000, 'iron_sword': 1})
+    char['active_quests'] = [f"quest_{i}" for i in range(70_000)]
+    data = save_format.encode(char)
+
+    loaded = character_manager.deserialize_character(data)
+    assert loaded['inventory'].count('health_potion') == 70_000
+    assert len(loaded['inventory']) == 70_001
+    assert loaded['active_quests'] == char['active_quests']
+    assert len(data) < 70_000 * 12
+
+
+def test_load_detects_both_formats(backend, monkeypatch):
+    """Test that loading detects text and binary saves"""
+    char = make_hero()
+    char['inventory'] = ['health_potion']
+    character_manager.save_character(char, backend=backend)
+
+    monkeypatch.setattr(character_manager, "SAVE_FORMAT", "binary")
+    char['name'] = "Binary"
+    character_manager.save_character(char, backend=backend)
+
+    assert save_format.is_binary(backend.read("Binary"))
+    assert not save_format.is_binary(backend.read("Hero"))
+    assert character_manager.load_character("Binary", backend=backend) == char
+    assert character_manager.load_character("Hero", backend=backend)['inventory'] == ['health_potion']
+
+
+def test_migrate_saves(backend):
+    """Test that migrate_saves converts each save once, both ways"""
+    for name in ("Ann", "Bob"):
+        character_manager.save_character(character_manager.create_character(name, "Mage"),
+                                         backend=backend)
+    before = character_manager.load_character("Ann", backend=backend)
+
+    assert character_manager.migrate_saves("binary", backend=backend) == 2
+    assert character_manager.migrate_saves("binary", backend=backend) == 0
+    assert all(save_format.is_binary(backend.read(name)) for name in ("Ann", "Bob"))
+    assert character_manager.load_character("Ann", backend=backend) == before
+
+    assert character_manager.migrate_saves("text", backend=backend) == 2
+    assert not save_format.is_binary(backend.read("Bob"))
+
+# ============================================================================
+# BATCH SAVE/LOAD TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_batch_round_trip(backend, workers):
+    """Test that batch save and load agree with or without threads"""
+    chars = [character_manager.create_character(f"hero{i}", "Rogue") for i in range(30)]
+    saved, errors = character_manager.save_characters(chars, workers=workers, backend=backend)
+    assert saved == [c['name'] for c in chars] and errors == {}
+
+    loaded, errors = character_manager.load_characters(saved, workers=workers, backend=backend)
+    assert errors == {}
+    assert loaded == {c['name']: c for c in chars}
+
+
+def test_batch_load_reports_errors_without_aborting(backend):
+    """Test that bad saves are reported while the rest load"""
+    character_manager.save_character(character_manager.create_character("Good", "Mage"),
+                                     backend=backend)
+    backend.write("Corrupt", b"NAME: Corrupt\nLEVEL: x\n")
+    backend.write("Partial", b"NAME: Partial\n")
+
+    loaded, errors = character_manager.load_characters(
+        ["Good", "Missing", "Corrupt", "Partial"], backend=backend)
+
+    assert list(loaded) == ["Good"]
+    assert isinstance(errors["Missing"], CharacterNotFoundError)
+    assert isinstance(errors["Corrupt"], SaveFileCorruptedError)
+    assert isinstance(errors["Partial"], InvalidSaveDataError)
+
+
+def test_batch_save_skips_invalid_characters(backend):
+    """Test that invalid characters are reported by position and not saved"""
+    good = character_manager.create_character("Valid", "Cleric")
+    bad = character_manager.create_character("Invalid", "Cleric")
+    bad['gold'] = "lots"
+
+    nameless = [{'class': "Cleric"}, {'name': None}]
+
+    saved, errors = character_manager.save_characters([good, bad, *nameless], backend=backend)
+    assert saved == ["Valid"]
+    assert sorted(errors) == [1, 2, 3]
+    assert all(isinstance(error, InvalidSaveDataError) for error in errors.values())
+    assert backend.names() == ["Valid"]
+
+# ============================================================================
+# CHARACTER CACHE TESTS
+# ============================================================================
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(character_manager, "CHARACTER_CACHE", None)
+    yield character_manager.enable_character_cache(capacity=2)
+    character_manager.disable_character_cache()
+
+
+def test_cache_serves_saved_characters(backend, cache, monkeypatch):
+    """Test that a saved character loads from the cache without a read"""
+    char = character_manager.create_character("Cached", "Mage")
+    character_manager.save_character(char, backend=backend)
+
+    monkeypatch.setattr(backend, "read", lambda name: pytest.fail("read from disk"))
+    loaded = character_manager.load_character("Cached", backend=backend)
+    assert loaded == char
+    loaded['inventory'].append("health_potion")
+    assert character_manager.load_character("Cached", backend=backend)['inventory'] == []
+    assert cache.stats()['hits'] == 2
+
+
+def test_cache_lru_eviction_and_counters(tmp_path, cache):
+    """Test LRU eviction and the cache counters"""
+    for name in ("A", "B", "C"):
+        character_manager.save_character(character_manager.create_character(name, "Rogue"),
+                                         str(tmp_path))
+    assert cache.stats()['evictions'] == 1
+
+    character_manager.load_character("B", str(tmp_path))      # hit
+    character_manager.load_character("A", str(tmp_path))      # miss, evicts C
+    character_manager.load_character("B", str(tmp_path))      # hit
+    character_manager.load_character("C", str(tmp_path))      # miss, evicts A
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions'], stats['size']) == (2, 2, 3, 2)
+
+
+def test_cache_invalidated_when_save_changes_on_disk(tmp_path, cache):
+    """Test that a save edited on disk is not served from the cache"""
+    char = character_manager.create_character("Edited", "Cleric")
+    character_manager.save_character(char, str(tmp_path))
+    path = tmp_path / "Edited_save.txt"
+    path.write_text(path.read_text().replace("GOLD: 100", "GOLD: 12345"))
+
+    assert character_manager.load_character("Edited", str(tmp_path))['gold'] == 12345
+    assert cache.stats()['invalidations'] == 1
+
+
+def test_write_back_cache_writes_on_eviction(tmp_path, monkeypatch):
+    """Test that write-back saves reach the disk on eviction"""
+    monkeypatch.setattr(character_manager, "CHARACTER_CACHE", None)
+    cache = character_manager.enable_character_cache(capacity=1, write_back=True)
+    first = character_manager.create_character("First", "Warrior")
+    character_manager.save_character(first, str(tmp_path))
+    assert not (tmp_path / "First_save.txt").exists()
+    assert character_manager.load_character("First", str(tmp_path)) == first
+
+    character_manager.save_character(character_manager.create_character("Second", "Mage"),
+                                     str(tmp_path))
+    assert (tmp_path / "First_save.txt").exists()
+    assert not (tmp_path / "Second_save.txt").exists()
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["First", "Second"]
+    assert cache.stats()['write_backs'] == 2
+
+    character_manager.delete_character("Second", str(tmp_path))
+    character_manager.disable_character_cache()
+    assert character_manager.list_saved_characters(str(tmp_path)) == ["First"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,95 @@
+"""
+Test Vectorized Combat
+Tests that the NumPy resolver is statistically equivalent to SimpleBattle
+"""
+
+import pytest
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+np = pytest.importorskip("numpy")
+
+import battle_simulator
+import combat_system
+import vectorized_combat
+
+
+class AutoBattle(combat_system.SimpleBattle):
+    """SimpleBattle that uses its special ability whenever it is ready"""
+
+    def player_turn(self, choice=None):
+        return super().player_turn('2' if self.ability_cooldown == 0 else '1')
+
+
+def run_scalar(character_class, level, enemy_type, fights):
+    """Run real SimpleBattle fights and collect wins and turn counts"""
+    random.seed(12345)
+    wins = 0
+    turns = []
+    for _ in range(fights):
+        char = battle_simulator.build_character(character_class, level)
+        battle = AutoBattle(char, combat_system.create_enemy(enemy_type))
+        if battle.start_battle()['winner'] == 'player':
+            wins += 1
+        turns.append(battle.turn)
+    return wins / fights, turns
+
+# ============================================================================
+# EQUIVALENCE TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("character_class,level,enemy_type", [
+    ("Warrior", 1, "dragon"),
+    ("Mage", 2, "dragon"),
+    ("Rogue", 3, "orc"),
+    ("Cleric", 1, "goblin"),
+])
+def test_matches_simple_battle_statistics(capsys, character_class, level, enemy_type):
+    """Test win rate and mean turns agree with SimpleBattle within 4 standard errors"""
+    fights = 3000
+    scalar_rate, scalar_turns = run_scalar(character_class, level, enemy_type, fights)
+    capsys.readouterr()
+
+    char = battle_simulator.build_character(character_class, level)
+    summary = vectorized_combat.resolve_matchup(
+        char, combat_system.create_enemy(enemy_type), 50000, seed=1
+    )
+
+    rate_se = max(1e-3, (scalar_rate * (1 - scalar_rate) / fights) ** 0.5)
+    assert abs(summary['win_rate'] - scalar_rate) < 4 * rate_se
+
+    turns = np.array(scalar_turns, dtype=float)
+    turns_se = max(1e-3, turns.std() / fights ** 0.5)
+    assert abs(summary['avg_turns'] - turns.mean()) < 4 * turns_se
+
+def test_summary_shape_matches_scalar_simulator():
+    """Test that the vectorized summary can stand in for simulate_many"""
+    char = battle_simulator.build_character("Warrior", 5)
+    summary = vectorized_combat.resolve_matchup(char, combat_system.create_enemy("orc"), 1000, seed=0)
+
+    assert set(summary) == set(battle_simulator.simulate_many(char, combat_system.create_enemy("orc"), 1))
+    assert sum(summary['turn_counts'].values()) == 1000
+    assert sum(summary['hp_remaining'].values()) == summary['wins']
+
+def test_resolve_batch_mixed_matchups():
+    """Test one batch holding different classes and enemies"""
+    chars = [battle_simulator.build_character(cls, 1) for cls in battle_simulator.CHARACTER_CLASSES]
+    enemies = [combat_system.create_enemy("goblin")] * len(chars)
+
+    winners, turns, hp = vectorized_combat.resolve_batch(chars, enemies, seed=3)
+
+    assert winners.shape == (4,)
+    assert (turns >= 1).all()
+    assert ((hp >= 0) & (hp <= [c['max_health'] for c in chars])).all()
+
+def test_unknown_policy_rejected():
+    """Test that only the supported policies are accepted"""
+    char = battle_simulator.build_character("Mage", 1)
+    with pytest.raises(ValueError):
+        vectorized_combat.resolve_matchup(char, combat_system.create_enemy("orc"), 10, policy='flee')
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,228 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Vectorized Combat Module
+
+Monte Carlo combat resolver that advances thousands of independent
+fights at once using NumPy arrays. Follows the same rules as
+SimpleBattle: calculate_damage rolls (0.8-1.2 of the attack stat),
+use_special_ability for Warrior/Mage/Rogue/Cleric, and the two turn
+ability cooldown. Every roll needed for a turn is drawn in one batch.
+
+NumPy is optional for the rest of the game; it is only required here.
+"""
+
+import character_manager
+import combat_system
+from battle_simulator import MAX_TURNS, CHARACTER_CLASSES, ENEMY_TYPES, build_character
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+POLICIES = ('attack', 'special')
+
+# Special ability kinds per class
+_NO_SPECIAL, _DAMAGE, _CRIT, _HEAL = 0, 1, 2, 3
+_CLASS_KINDS = {'Warrior': _DAMAGE, 'Mage': _DAMAGE, 'Rogue': _CRIT, 'Cleric': _HEAL}
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("vectorized_combat requires numpy (pip install numpy)")
+
+
+# ============================================================================
+# LANE SETUP
+# ============================================================================
+def _attack_bounds(attack_stat):
+    """Vectorized combat_system.damage_range. Returns (low, span) arrays"""
+    base = np.maximum(1, attack_stat)
+    low = np.maximum(1, np.floor(base * 0.8).astype(np.int64))
+    high = np.maximum(low, np.floor(base * 1.2).astype(np.int64))
+    return low, high - low + 1
+
+
+def _special_bounds(special_stat, multiplier):
+    """Vectorized combat_system.special_damage_range. Returns (low, span) arrays"""
+    damage = np.maximum(1, special_stat * multiplier)
+    low = np.floor(damage * 0.8).astype(np.int64)
+    high = np.floor(damage * 1.2).astype(np.int64)
+    return low, high - low + 1
+
+
+def _build_lanes(characters, enemies):
+    """Turn parallel lists of character / enemy dicts into stat arrays"""
+    classes = [c.get('class', '') for c in characters]
+    scaling = [combat_system.SPECIAL_ABILITY_SCALING.get(cls, ('strength', 1)) for cls in classes]
+    # Stats including equipment bonuses
+    stats = [character_manager.get_effective_stats(c) for c in characters]
+    lanes = {
+        'health': np.array([c['health'] for c in characters], dtype=np.int64),
+        'max_health': np.array([s['max_health'] for s in stats], dtype=np.int64),
+        'strength': np.array([int(s.get('strength', 5)) for s in stats], dtype=np.int64),
+        'magic': np.array([int(s.get('magic', 5)) for s in stats], dtype=np.int64),
+        'is_mage': np.array([cls == 'Mage' for cls in classes]),
+        'kind': np.array([_CLASS_KINDS.get(cls, _NO_SPECIAL) for cls in classes], dtype=np.int8),
+        'special_stat': np.array(
+            [int(s.get(stat, 1)) for s, (stat, _) in zip(stats, scaling)], dtype=np.int64
+        ),
+        'special_multiplier': np.array([multiplier for _, multiplier in scaling], dtype=np.int64),
+        'enemy_health': np.array([e['health'] for e in enemies], dtype=np.int64),
+        'enemy_strength': np.array([int(e.get('strength', 5)) for e in enemies], dtype=np.int64),
+        'enemy_magic': np.array([int(e.get('magic', 5)) for e in enemies], dtype=np.int64),
+        'enemy_is_mage': np.array([e.get('class') == 'Mage' for e in enemies]),
+    }
+    return lanes
+
+
+def _repeat_lanes(character, enemy, fights):
+    """Lanes for `fights` copies of one matchup without building per-lane dicts"""
+    lanes = _build_lanes([character], [enemy])
+    return {key: np.repeat(values, fights) for key, values in lanes.items()}
+
+
+# ============================================================================
+# RESOLUTION
+# ============================================================================
+def _resolve(lanes, policy, rng, max_turns):
+    """Advance every lane until it finishes. Returns (winner, turns, hp) arrays
+    where winner is 1 for player, -1 for enemy and 0 for turn limit.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy '{policy}', expected one of {POLICIES}")
+
+    n = len(lanes['health'])
+    winner = np.zeros(n, dtype=np.int8)
+    turns = np.full(n, max_turns, dtype=np.int64)
+    final_hp = lanes['health'].copy()
+
+    # Per-lane constants (basic attack uses magic for spellcasters)
+    strength, magic = lanes['strength'], lanes['magic']
+    p_low, p_span = _attack_bounds(np.where(lanes['is_mage'] | (magic > strength), magic, strength))
+
+    e_strength, e_magic = lanes['enemy_strength'], lanes['enemy_magic']
+    e_low, e_span = _attack_bounds(
+        np.where(lanes['enemy_is_mage'] | (e_magic > e_strength), e_magic, e_strength)
+    )
+
+    kind = lanes['kind']
+    s_low, s_span = _special_bounds(lanes['special_stat'], lanes['special_multiplier'])
+    miss_damage = np.maximum(1, strength)
+
+    # Mutable state for fights still running, addressed through `active`
+    active = np.arange(n)
+    health = lanes['health'].copy()
+    max_health = lanes['max_health']
+    enemy_health = lanes['enemy_health'].copy()
+    cooldown = np.zeros(n, dtype=np.int64)
+
+    turn = 0
+    while active.size and turn < max_turns:
+        turn += 1
+        cd = cooldown[active]
+        cd = np.where(cd > 0, cd - 1, cd)
+
+        # One batch of uniforms per turn: [player roll, crit roll, enemy roll]
+        rolls = rng.random((3, active.size))
+
+        if policy == 'special':
+            use_special = cd == 0
+        else:
+            use_special = np.zeros(active.size, dtype=bool)
+        k = np.where(use_special, kind[active], _NO_SPECIAL)
+
+        attack_dmg = p_low[active] + (rolls[0] * p_span[active]).astype(np.int64)
+        special_dmg = s_low[active] + (rolls[0] * s_span[active]).astype(np.int64)
+        crit_dmg = np.where(rolls[1] < combat_system.ROGUE_CRIT_CHANCE, special_dmg, miss_damage[active])
+
+        damage = np.where(use_special, 0, attack_dmg)
+        damage = np.where(k == _DAMAGE, special_dmg, damage)
+        damage = np.where(k == _CRIT, crit_dmg, damage)
+
+        hp = health[active]
+        hp = np.where(k == _HEAL, np.minimum(hp + combat_system.CLERIC_HEAL_AMOUNT, max_health[active]), hp)
+        cd = np.where(use_special, combat_system.ABILITY_COOLDOWN, cd)
+
+        e_hp = enemy_health[active] - damage
+        won = e_hp <= 0
+
+        hp = np.where(won, hp, hp - (e_low[active] + (rolls[2] * e_span[active]).astype(np.int64)))
+        lost = ~won & (hp <= 0)
+
+        done = won | lost
+        finished = active[done]
+        winner[finished] = np.where(won[done], 1, -1)
+        turns[finished] = turn
+        final_hp[finished] = np.maximum(0, hp[done])
+
+        health[active] = hp
+        enemy_health[active] = e_hp
+        cooldown[active] = cd
+        active = active[~done]
+
+    final_hp[active] = health[active]
+    return winner, turns, final_hp
+
+
+def _summarize(winner, turns, final_hp):
+    """Build the same summary dict as battle_simulator.simulate_many"""
+    fights = int(winner.size)
+    wins = int(np.count_nonzero(winner == 1))
+    losses = int(np.count_nonzero(winner == -1))
+    turn_values, turn_freq = np.unique(turns, return_counts=True)
+    hp_values, hp_freq = np.unique(final_hp[winner == 1], return_counts=True)
+    return {
+        'fights': fights,
+        'wins': wins,
+        'losses': losses,
+        'escapes': fights - wins - losses,
+        'win_rate': wins / fights if fights else 0.0,
+        'avg_turns': float(turns.mean()) if fights else 0.0,
+        'turn_counts': dict(zip(turn_values.tolist(), turn_freq.tolist())),
+        'hp_remaining': dict(zip(hp_values.tolist(), hp_freq.tolist())),
+    }
+
+
+# ============================================================================
+# PUBLIC API
+# ============================================================================
+def resolve_matchup(character, enemy, fights, policy='special', seed=None, max_turns=MAX_TURNS):
+    """Resolve `fights` independent copies of one matchup.
+    Returns the same summary dict as battle_simulator.simulate_many.
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    lanes = _repeat_lanes(character, enemy, fights)
+    return _summarize(*_resolve(lanes, policy, rng, max_turns))
+
+
+def resolve_batch(characters, enemies, policy='special', seed=None, max_turns=MAX_TURNS):
+    """Resolve one fight per (character, enemy) pair in a single batch.
+    Returns (winners, turns, player_health) arrays; winners are
+    1 for the player, -1 for the enemy and 0 when the turn limit hit.
+    """
+    _require_numpy()
+    if len(characters) != len(enemies):
+        raise ValueError("characters and enemies must have the same length")
+    rng = np.random.default_rng(seed)
+    return _resolve(_build_lanes(characters, enemies), policy, rng, max_turns)
+
+
+def run_simulations(fights=1000, classes=CHARACTER_CLASSES, enemy_types=ENEMY_TYPES,
+                    levels=(1,), policy='special', seed=None, max_turns=MAX_TURNS):
+    """Vectorized counterpart of battle_simulator.run_simulations"""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    for character_class in classes:
+        for level in levels:
+            character = build_character(character_class, level)
+            for enemy_type in enemy_types:
+                lanes = _repeat_lanes(character, combat_system.create_enemy(enemy_type), fights)
+                results[(character_class, enemy_type, level)] = _summarize(
+                    *_resolve(lanes, policy, rng, max_turns)
+                )
+
+    return results